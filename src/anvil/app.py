@@ -1,6 +1,8 @@
 """Main Anvil TUI application."""
 
+import threading
 from datetime import datetime
+from functools import partial
 
 from textual.app import App, ComposeResult
 from textual.binding import Binding
@@ -11,11 +13,17 @@ from anvil.config import ConfigManager, FoundrySelection
 from anvil.screens.auth import AuthScreen
 from anvil.screens.foundry_select import FoundrySelectScreen
 from anvil.screens.home import HomeScreen
+from anvil.screens.project_discovery import ProjectDiscoveryScreen
 from anvil.screens.project_select import ProjectSelectScreen
 from anvil.screens.splash import SplashScreen
 from anvil.screens.subscription_select import SubscriptionSelectScreen
 from anvil.services.auth import AuthService, AuthStatus
+from anvil.services.client_registry import get_client_registry
+from anvil.services.discovery import DiscoveredProject, FoundryDiscovery
 from anvil.services.foundry import FoundryAccount, FoundryProject, FoundryService
+from anvil.services.inventory import InventoryCache
+from anvil.services.prefetch import PrefetchCache
+from anvil.services.resource_graph import ResourceGraphService
 from anvil.services.subscriptions import Subscription, SubscriptionService
 
 # MKLab brand theme (Gruvbox-inspired dark theme)
@@ -46,6 +54,7 @@ class AnvilApp(App[None]):
         Binding("q", "quit", "Quit"),
         Binding("?", "help", "Help"),
         Binding("p", "switch_project", "Switch Project"),
+        Binding("f", "find_project", "Find Project"),
     ]
 
     def __init__(self) -> None:
@@ -53,7 +62,17 @@ class AnvilApp(App[None]):
         super().__init__()
         self.auth_service = AuthService()
         self.config_manager = ConfigManager()
+        self.inventory = InventoryCache(self.config_manager.config_dir)
         self.current_selection: FoundrySelection | None = None
+        # Selection-flow services are kept for the app's lifetime, so going
+        # back and forth between screens reuses their management clients
+        self._subscription_service: SubscriptionService | None = None
+        self._foundry_services: dict[str, FoundryService] = {}
+        self._resource_graph: ResourceGraphService | None = None
+        # Children of the subscription or instance the user lingers on
+        self._prefetch: PrefetchCache | None = None
+        # Discovery requests foundry services from a worker thread
+        self._services_lock = threading.Lock()
         # Register and apply MKLab brand theme
         self.register_theme(MKLAB_THEME)
         self.theme = "mklab"
@@ -66,6 +85,100 @@ class AnvilApp(App[None]):
         """Run startup flow on mount."""
         self._startup_flow()
 
+    def on_unmount(self) -> None:
+        """Close shared clients on exit."""
+        self._close_selection_services()
+        get_client_registry().close()
+
+    def _get_subscription_service(self) -> SubscriptionService:
+        """Get the shared subscription service for the current credential."""
+        credential = self.auth_service.get_credential()
+        service = self._subscription_service
+        if service is None or service.credential is not credential:
+            self._close_selection_services()
+            service = SubscriptionService(credential)
+            self._subscription_service = service
+        return service
+
+    def _get_foundry_service(self, subscription_id: str) -> FoundryService:
+        """Get the shared foundry service for a subscription.
+
+        Args:
+            subscription_id: Azure subscription ID.
+        """
+        credential = self.auth_service.get_credential()
+        with self._services_lock:
+            service = self._foundry_services.get(subscription_id)
+            if service is None or service.credential is not credential:
+                if service is not None:
+                    service.close()
+                service = FoundryService(credential=credential, subscription_id=subscription_id)
+                self._foundry_services[subscription_id] = service
+            return service
+
+    def _get_resource_graph(self) -> ResourceGraphService | None:
+        """Get the shared Resource Graph service, if enabled in the config."""
+        if not self.config_manager.load().use_resource_graph:
+            return None
+        credential = self.auth_service.get_credential()
+        service = self._resource_graph
+        if service is None or service.credential is not credential:
+            if service is not None:
+                service.close()
+            service = ResourceGraphService(credential)
+            self._resource_graph = service
+        return service
+
+    def _get_prefetch(self) -> PrefetchCache:
+        """Get the prefetch cache, sized from the config."""
+        if self._prefetch is None:
+            config = self.config_manager.load()
+            self._prefetch = PrefetchCache(max_entries=config.prefetch_max_entries)
+        return self._prefetch
+
+    def _prefetch_accounts(self, subscription: Subscription) -> None:
+        """Start listing a subscription's Foundry instances in the background.
+
+        Args:
+            subscription: Subscription the user is likely to select.
+        """
+        service = self._get_foundry_service(subscription.subscription_id)
+        key = ("accounts", subscription.subscription_id)
+        self._get_prefetch().prefetch(key, service.list_accounts)
+
+    def _prefetch_projects(self, foundry_service: FoundryService, account: FoundryAccount) -> None:
+        """Start listing a Foundry instance's projects in the background.
+
+        Args:
+            foundry_service: Service for the instance's subscription.
+            account: Foundry instance the user is likely to select.
+        """
+        fetch = partial(
+            foundry_service.list_projects,
+            resource_group=account.resource_group,
+            account_name=account.name,
+        )
+        self._get_prefetch().prefetch(("projects", account.id), fetch)
+
+    def _close_selection_services(self) -> None:
+        """Close the selection flow's management and Resource Graph clients.
+
+        Runs on the event loop, so running prefetches are not waited for;
+        they fail against the closed clients and their results are dropped.
+        """
+        if self._prefetch is not None:
+            self._prefetch.close(wait=False)
+        if self._resource_graph is not None:
+            self._resource_graph.close()
+            self._resource_graph = None
+        if self._subscription_service is not None:
+            self._subscription_service.close()
+            self._subscription_service = None
+        with self._services_lock:
+            for service in self._foundry_services.values():
+                service.close()
+            self._foundry_services.clear()
+
     def _startup_flow(self) -> None:
         """Execute the startup authentication and selection flow."""
         # Step 1: Check/perform authentication
@@ -117,7 +230,8 @@ class AnvilApp(App[None]):
         last_sub_id = self.config_manager.get_last_subscription_id()
 
         # Step 1: Select subscription
-        subscription_service = SubscriptionService(self.auth_service.get_credential())
+        subscription_service = self._get_subscription_service()
+        config = self.config_manager.load()
 
         def on_subscription_selected(subscription: Subscription | None) -> None:
             if subscription is None:
@@ -129,6 +243,9 @@ class AnvilApp(App[None]):
             SubscriptionSelectScreen(
                 subscription_service=subscription_service,
                 highlight_subscription_id=last_sub_id,
+                inventory=self.inventory,
+                prefetch=self._prefetch_accounts,
+                prefetch_delay=config.prefetch_dwell_seconds,
             ),
             on_subscription_selected,
         )
@@ -140,10 +257,9 @@ class AnvilApp(App[None]):
             subscription: Selected subscription.
         """
         last_account = self.config_manager.get_last_account_name()
-        foundry_service = FoundryService(
-            credential=self.auth_service.get_credential(),
-            subscription_id=subscription.subscription_id,
-        )
+        foundry_service = self._get_foundry_service(subscription.subscription_id)
+        prefetched = self._get_prefetch().take(("accounts", subscription.subscription_id))
+        config = self.config_manager.load()
 
         def on_account_selected(account: FoundryAccount | None) -> None:
             if account is None:
@@ -156,6 +272,10 @@ class AnvilApp(App[None]):
             FoundrySelectScreen(
                 foundry_service=foundry_service,
                 highlight_account_name=last_account,
+                inventory=self.inventory,
+                prefetched=prefetched,
+                prefetch=partial(self._prefetch_projects, foundry_service),
+                prefetch_delay=config.prefetch_dwell_seconds,
             ),
             on_account_selected,
         )
@@ -174,6 +294,7 @@ class AnvilApp(App[None]):
             foundry_service: Foundry service instance.
         """
         last_project = self.config_manager.get_last_project_name()
+        prefetched = self._get_prefetch().take(("projects", account.id))
 
         def on_project_selected(project: FoundryProject | None) -> None:
             if project is None:
@@ -181,29 +302,45 @@ class AnvilApp(App[None]):
                 self._select_foundry_account(subscription)
                 return
 
-            # Save selection and proceed
-            selection = FoundrySelection(
-                subscription_id=subscription.subscription_id,
-                subscription_name=subscription.display_name,
-                resource_group=account.resource_group,
-                account_name=account.name,
-                project_name=project.name,
-                project_endpoint=project.endpoint,
-                selected_at=datetime.now(),
-            )
-            self.config_manager.update_selection(selection)
-            self.current_selection = selection
-            self._show_home()
+            self._open_project(subscription, account, project)
 
         self.push_screen(
             ProjectSelectScreen(
                 foundry_service=foundry_service,
                 account=account,
                 highlight_project_name=last_project,
+                inventory=self.inventory,
+                prefetched=prefetched,
             ),
             on_project_selected,
         )
 
+    def _open_project(
+        self,
+        subscription: Subscription,
+        account: FoundryAccount,
+        project: FoundryProject,
+    ) -> None:
+        """Save a selected project and show the home screen.
+
+        Args:
+            subscription: Subscription containing the project.
+            account: Foundry account containing the project.
+            project: Selected project.
+        """
+        selection = FoundrySelection(
+            subscription_id=subscription.subscription_id,
+            subscription_name=subscription.display_name,
+            resource_group=account.resource_group,
+            account_name=account.name,
+            project_name=project.name,
+            project_endpoint=project.endpoint,
+            selected_at=datetime.now(),
+        )
+        self.config_manager.update_selection(selection)
+        self.current_selection = selection
+        self._show_home()
+
     def _show_home(self, show_splash: bool = True) -> None:
         """Show the home screen.
 
@@ -214,28 +351,25 @@ class AnvilApp(App[None]):
         while len(self.screen_stack) > 1:
             self.pop_screen()
 
+        # Start loading the project right away, while the splash is shown
+        home = HomeScreen(
+            current_selection=self.current_selection,
+            credential=self.auth_service.get_credential(),
+        )
+        home.start_warmup()
+
         if show_splash:
             # Show splash first, then home
             def on_splash_dismiss(_: None) -> None:
-                self.push_screen(
-                    HomeScreen(
-                        current_selection=self.current_selection,
-                        credential=self.auth_service.get_credential(),
-                    )
-                )
+                self.push_screen(home)
 
             self.push_screen(SplashScreen(), on_splash_dismiss)
         else:
-            self.push_screen(
-                HomeScreen(
-                    current_selection=self.current_selection,
-                    credential=self.auth_service.get_credential(),
-                )
-            )
+            self.push_screen(home)
 
     def action_help(self) -> None:
         """Show help notification."""
-        self.notify("Press 'q' to quit, 'p' to switch project")
+        self.notify("Press 'q' to quit, 'p' to switch project, 'f' to find a project")
 
     def action_switch_project(self) -> None:
         """Switch to a different project."""
@@ -246,6 +380,29 @@ class AnvilApp(App[None]):
         # Run selection flow (will highlight last used values)
         self._run_selection_flow()
 
+    def action_find_project(self) -> None:
+        """Search all subscriptions for a project to open."""
+        if not self.auth_service.is_authenticated():
+            self.notify("Not authenticated", severity="error")
+            return
+        if isinstance(self.screen, ProjectDiscoveryScreen):
+            return
+
+        def on_project_found(found: DiscoveredProject | None) -> None:
+            if found is None or found.project is None:
+                return
+            self._open_project(found.subscription, found.account, found.project)
+
+        self.push_screen(
+            ProjectDiscoveryScreen(
+                subscription_service=self._get_subscription_service(),
+                discovery=FoundryDiscovery(
+                    self._get_foundry_service, resource_graph=self._get_resource_graph()
+                ),
+            ),
+            on_project_found,
+        )
+
 
 def main() -> None:
     """Entry point for the Anvil TUI."""
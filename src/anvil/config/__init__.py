@@ -1,6 +1,12 @@
 """Configuration management for Anvil."""
 
-from anvil.config.models import AppConfig, FoundrySelection
+from anvil.config.models import AppConfig, FoundrySelection, Inventory, InventoryEntry
 from anvil.config.settings import ConfigManager
 
-__all__ = ["AppConfig", "ConfigManager", "FoundrySelection"]
+__all__ = [
+    "AppConfig",
+    "ConfigManager",
+    "FoundrySelection",
+    "Inventory",
+    "InventoryEntry",
+]
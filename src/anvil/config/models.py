@@ -1,6 +1,7 @@
 """Pydantic models for Anvil configuration."""
 
 from datetime import datetime
+from typing import Any
 
 from pydantic import BaseModel
 
@@ -23,3 +24,25 @@ class AppConfig(BaseModel):
     last_selection: FoundrySelection | None = None
     recent_selections: list[FoundrySelection] = []
     auto_connect_last: bool = True
+    # Find projects with one Azure Resource Graph query instead of listing
+    # every subscription
+    use_resource_graph: bool = False
+    # Seconds a subscription or instance stays highlighted before its
+    # children are fetched in the background, and how many are kept
+    prefetch_dwell_seconds: float = 0.3
+    prefetch_max_entries: int = 8
+
+
+class InventoryEntry(BaseModel):
+    """A cached resource listing and when it was fetched."""
+
+    items: list[dict[str, Any]]
+    fetched_at: datetime
+
+
+class Inventory(BaseModel):
+    """Resources discovered during the selection flow."""
+
+    subscriptions: InventoryEntry | None = None
+    accounts: dict[str, InventoryEntry] = {}  # Keyed by subscription ID
+    projects: dict[str, InventoryEntry] = {}  # Keyed by account resource ID
@@ -4,6 +4,7 @@ from anvil.screens.agent_edit import AgentEditScreen
 from anvil.screens.auth import AuthScreen
 from anvil.screens.foundry_select import FoundrySelectScreen
 from anvil.screens.home import HomeScreen
+from anvil.screens.project_discovery import ProjectDiscoveryScreen
 from anvil.screens.project_select import ProjectSelectScreen
 from anvil.screens.splash import SplashScreen
 from anvil.screens.subscription_select import SubscriptionSelectScreen
@@ -13,6 +14,7 @@ __all__ = [
     "AuthScreen",
     "FoundrySelectScreen",
     "HomeScreen",
+    "ProjectDiscoveryScreen",
     "ProjectSelectScreen",
     "SplashScreen",
     "SubscriptionSelectScreen",
@@ -1,13 +1,20 @@
 """Foundry instance selection screen for Anvil TUI."""
 
+from collections.abc import Callable
+from concurrent.futures import Future
+from functools import partial
+
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Center, Container
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widgets import LoadingIndicator, Static
 from textual.worker import Worker, WorkerState, get_current_worker
 
 from anvil.services.foundry import FoundryAccount, FoundryService
+from anvil.services.inventory import InventoryCache
+from anvil.services.prefetch import PrefetchCache
 from anvil.widgets.searchable_list import SearchableList
 
 
@@ -66,16 +73,33 @@ class FoundrySelectScreen(Screen[FoundryAccount | None]):
         self,
         foundry_service: FoundryService,
         highlight_account_name: str | None = None,
+        inventory: InventoryCache | None = None,
+        prefetched: Future[list[FoundryAccount]] | None = None,
+        prefetch: Callable[[FoundryAccount], None] | None = None,
+        prefetch_delay: float = PrefetchCache.DEFAULT_DWELL,
     ) -> None:
         """Initialize the foundry select screen.
 
         Args:
             foundry_service: Service for listing Foundry instances.
             highlight_account_name: Instance name to highlight (last used).
+            inventory: Cache to show instances from while they are refreshed.
+            prefetched: Listing of the instances started ahead of time, used
+                instead of fetching them again.
+            prefetch: Starts fetching an instance's projects in the background.
+                Called for the last used instance, and for any instance
+                highlighted for prefetch_delay seconds.
+            prefetch_delay: Seconds an instance must stay highlighted before
+                it is prefetched.
         """
         super().__init__()
         self._service = foundry_service
         self._highlight_name = highlight_account_name
+        self._inventory = inventory
+        self._prefetched = prefetched
+        self._prefetch = prefetch
+        self._prefetch_delay = prefetch_delay
+        self._prefetch_timer: Timer | None = None
         self._accounts: list[FoundryAccount] = []
 
     def compose(self) -> ComposeResult:
@@ -92,8 +116,18 @@ class FoundrySelectScreen(Screen[FoundryAccount | None]):
             )
 
     def on_mount(self) -> None:
-        """Load accounts on mount."""
+        """Show prefetched or cached accounts, then load current ones."""
         self.query_one("#account-list", SearchableList).display = False
+        cached = (
+            self._inventory.get_accounts(self._service.subscription_id) if self._inventory else None
+        )
+        prefetched = self._prefetched_accounts(wait=False)
+        if prefetched is not None:
+            self._accounts = prefetched
+            self._show_accounts()
+        elif cached and cached.items:
+            self._accounts = cached.items
+            self._show_accounts(refreshing=True)
         self.run_worker(self._fetch_accounts, thread=True)
 
     def _fetch_accounts(self) -> list[FoundryAccount]:
@@ -101,7 +135,30 @@ class FoundrySelectScreen(Screen[FoundryAccount | None]):
         worker = get_current_worker()
         if worker.is_cancelled:
             return []
-        return self._service.list_accounts()
+        accounts = self._prefetched_accounts()
+        if accounts is None:
+            accounts = self._service.list_accounts()
+        if self._inventory:
+            self._inventory.put_accounts(self._service.subscription_id, accounts)
+        return accounts
+
+    def _prefetched_accounts(self, wait: bool = True) -> list[FoundryAccount] | None:
+        """Get the prefetched instances.
+
+        Args:
+            wait: Whether to wait for a prefetch that is still running.
+
+        Returns:
+            The prefetched instances, or None if there are none, the prefetch
+            failed, or it is still running and wait is False.
+        """
+        if self._prefetched is None or not (wait or self._prefetched.done()):
+            return None
+        try:
+            return self._prefetched.result()
+        except Exception:
+            # Fetched again instead
+            return None
 
     def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
         """Handle worker completion."""
@@ -109,14 +166,24 @@ class FoundrySelectScreen(Screen[FoundryAccount | None]):
             self._accounts = event.worker.result or []
             self._show_accounts()
         elif event.state == WorkerState.ERROR:
+            if self._accounts:
+                # Keep the cached list usable
+                self.query_one("#status", Static).update(
+                    "Showing cached Foundry instances; refresh failed."
+                )
+                return
             self.query_one("#loading", LoadingIndicator).display = False
             self.query_one("#status", Static).update("Failed to load Foundry instances.")
             error_widget = self.query_one("#error", Static)
             error_widget.update(str(event.worker.error))
             error_widget.add_class("has-error")
 
-    def _show_accounts(self) -> None:
-        """Display loaded Foundry instances."""
+    def _show_accounts(self, refreshing: bool = False) -> None:
+        """Display loaded Foundry instances.
+
+        Args:
+            refreshing: Whether these are cached instances being refreshed.
+        """
         if not self._accounts:
             self.query_one("#loading", LoadingIndicator).display = False
             self.query_one("#status", Static).update(
@@ -132,21 +199,45 @@ class FoundrySelectScreen(Screen[FoundryAccount | None]):
 
         # Update UI
         self.query_one("#loading", LoadingIndicator).display = False
-        self.query_one("#status", Static).update(
-            f"Found {len(self._accounts)} Foundry instance(s). Select one or type to filter."
-        )
+        status = f"Found {len(self._accounts)} Foundry instance(s). Select one or type to filter."
+        if refreshing:
+            status += " Refreshing..."
+        self.query_one("#status", Static).update(status)
 
         search_list = self.query_one("#account-list", SearchableList)
         search_list.display = True
         search_list.set_options(options)
 
+        # The last used instance is the likeliest choice
+        last_used = self._find_account(self._highlight_name)
+        if self._prefetch is not None and last_used is not None:
+            self._prefetch(last_used)
+
+    def _find_account(self, name: str | None) -> FoundryAccount | None:
+        """Find a loaded Foundry instance by name."""
+        for acc in self._accounts:
+            if acc.name == name:
+                return acc
+        return None
+
+    def on_searchable_list_highlighted(self, event: SearchableList.Highlighted) -> None:
+        """Prefetch an instance once it has stayed highlighted for a moment."""
+        if self._prefetch is None:
+            return
+        if self._prefetch_timer is not None:
+            self._prefetch_timer.stop()
+            self._prefetch_timer = None
+        account = self._find_account(event.value)
+        if account is not None:
+            self._prefetch_timer = self.set_timer(
+                self._prefetch_delay, partial(self._prefetch, account)
+            )
+
     def on_searchable_list_selected(self, event: SearchableList.Selected) -> None:
         """Handle instance selection."""
-        # Find the account by name
-        for acc in self._accounts:
-            if acc.name == event.value:
-                self.dismiss(acc)
-                return
+        account = self._find_account(event.value)
+        if account is not None:
+            self.dismiss(account)
 
     def action_cancel(self) -> None:
         """Handle cancel action."""
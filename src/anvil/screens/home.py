@@ -1,22 +1,42 @@
 """Home screen for Anvil TUI."""
 
 import contextlib
+from typing import Any
 
 from azure.core.credentials import TokenCredential
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical
 from textual.screen import Screen
-from textual.widgets import Button, DataTable, Footer, Header, Input, Static
+from textual.widgets import Button, DataTable, Footer, Header, Input, SelectionList, Static
+from textual.widgets.data_table import ColumnKey
 from textual.worker import Worker, WorkerState, get_current_worker
 
 from anvil.config import FoundrySelection
 from anvil.screens.agent_edit import AgentEditScreen
-from anvil.services.arm_client import ArmClientService, PublishedAgent, PublishedDeployment
+from anvil.services.arm_client import (
+    ArmClientService,
+    PublishedAgent,
+    PublishedDeployment,
+    UnpublishResult,
+)
+from anvil.services.client_registry import get_client_registry
+from anvil.services.exceptions import OperationCancelled
 from anvil.services.project_client import Agent, Deployment, ProjectClientService
+from anvil.services.warmup import PageLoader, ProjectWarmup, WarmupProgress, WarmupState
 from anvil.widgets.sidebar import Sidebar
 
 
+class _WorkerCancelToken:
+    """Exposes a worker's cancellation as a CancelToken for service listings."""
+
+    def __init__(self, worker: Worker[Any]) -> None:
+        self._worker = worker
+
+    def is_set(self) -> bool:
+        return self._worker.is_cancelled
+
+
 class HomeScreen(Screen[None]):
     """Main home screen with sidebar navigation and resource list."""
 
@@ -29,6 +49,7 @@ class HomeScreen(Screen[None]):
         Binding("e", "edit_agent", "Edit"),
         Binding("enter", "edit_agent", "Edit", show=False),
         Binding("u", "unpublish_agent", "Unpublish", show=False),
+        Binding("U", "bulk_unpublish", "Bulk unpublish", show=False),
     ]
 
     CSS = """
@@ -158,8 +179,10 @@ class HomeScreen(Screen[None]):
         Args:
             current_selection: Current Foundry project selection.
             credential: Azure credential for API calls.
-            subscription_id: Azure subscription ID for ARM API.
-            resource_group: Resource group name for ARM API.
+            subscription_id: Azure subscription ID for ARM API. Defaults to
+                the selection's subscription.
+            resource_group: Resource group name for ARM API. Defaults to the
+                selection's resource group.
         """
         super().__init__()
         self._selection = current_selection
@@ -170,17 +193,27 @@ class HomeScreen(Screen[None]):
         self._project_client: ProjectClientService | None = None
         self._arm_client: ArmClientService | None = None
         self._agents: list[Agent] = []
+        # Rendered agent rows keyed by row key, used to update only changed rows
+        self._agent_rows: dict[str, tuple[str, ...]] = {}
+        # Agents of the rendered rows, by row key
+        self._agents_by_row_key: dict[str, Agent] = {}
+        self._agent_columns: list[ColumnKey] = []
         self._deployments: list[Deployment] = []
         self._published_agents: dict[str, PublishedAgent] = {}
+        self._warmup: ProjectWarmup | None = None
+        # Set once warm-up progress can be applied to the mounted screen
+        self._warmup_live = False
 
         # Initialize project client if we have selection and credential
         if self._selection and self._credential and self._selection.project_endpoint:
-            self._project_client = ProjectClientService(
+            self._project_client = get_client_registry().project_client(
                 endpoint=self._selection.project_endpoint,
                 credential=self._credential,
             )
 
             # Initialize ARM client if we have all required info
+            subscription_id = subscription_id or self._selection.subscription_id
+            resource_group = resource_group or self._selection.resource_group
             if subscription_id and resource_group:
                 with contextlib.suppress(ValueError):
                     self._arm_client = ArmClientService.from_project_endpoint(
@@ -190,6 +223,30 @@ class HomeScreen(Screen[None]):
                         credential=self._credential,
                     )
 
+            self._warmup = self._create_warmup(self._project_client, self._arm_client)
+
+    def _create_warmup(
+        self, project_client: ProjectClientService, arm_client: ArmClientService | None
+    ) -> ProjectWarmup:
+        """Create the warm-up that loads every resource of the project at once."""
+        catalog = project_client.deployment_catalog
+        loaders: dict[str, PageLoader] = {
+            "agents": lambda cancel: project_client.iter_agent_pages(cancel=cancel),
+            "models": lambda cancel: [catalog.deployments(cancel)],
+        }
+        if arm_client:
+            loaders["published"] = arm_client.iter_published_agent_pages
+        return ProjectWarmup(loaders, on_progress=self._on_warmup_progress)
+
+    def start_warmup(self) -> None:
+        """Start loading agents, models and publishing state concurrently.
+
+        Called as soon as the project is selected, so data is loading while the
+        splash screen is shown. Safe to call more than once.
+        """
+        if self._warmup and not self._warmup.started:
+            self._warmup.start()
+
     def compose(self) -> ComposeResult:
         """Create the home screen layout."""
         yield Header()
@@ -210,11 +267,90 @@ class HomeScreen(Screen[None]):
         """Initialize the table on mount."""
         self._setup_agents_table()
         # Load real data if we have a project client, otherwise use placeholder
-        if self._project_client:
+        if self._warmup:
+            self.start_warmup()
+            # Progress reported before now is replayed from the warm-up itself
+            self._warmup_live = True
+            for progress in self._warmup.snapshot():
+                self._apply_warmup_progress(progress)
+        elif self._project_client:
             self._load_agents()
         else:
             self._load_placeholder_data()
 
+    def on_unmount(self) -> None:
+        """Stop warming up and release pooled ARM connections.
+
+        Closing the ARM client is final, so a loader or worker still running
+        fails its next request instead of reopening the client.
+        """
+        self._warmup_live = False
+        if self._warmup:
+            self._warmup.cancel()
+        if self._arm_client:
+            self._arm_client.close()
+
+    def _on_warmup_progress(self, progress: WarmupProgress) -> None:
+        """Forward warm-up progress from a loader thread to the UI thread."""
+        if self._warmup_live:
+            # The app may be shutting down while a loader finishes
+            with contextlib.suppress(RuntimeError):
+                self.app.call_from_thread(self._apply_warmup_progress, progress)
+
+    def _apply_warmup_progress(self, progress: WarmupProgress) -> None:
+        """Apply warmed-up data to the screen and update the loading status."""
+        if self._warmup is None or progress is not self._warmup.progress(progress.resource):
+            # A newer update for this resource is already on its way
+            return
+
+        if progress.resource == "agents":
+            if progress.state == WarmupState.LOADING and progress.items:
+                self._apply_agent_page(list(progress.items))
+            elif progress.state == WarmupState.DONE:
+                self._agents = list(progress.items)
+                self._merge_published_status()
+                if self._current_resource == "agents":
+                    self._populate_agents_table()
+            elif progress.state == WarmupState.FAILED:
+                self.notify(f"Failed to load agents: {progress.error}", severity="error")
+                if self._current_resource == "agents":
+                    self._load_placeholder_data()
+        elif progress.resource == "published":
+            if progress.items:
+                self._published_agents = {p.agent_name: p for p in progress.items}
+                self._merge_published_status()
+                if self._current_resource == "agents":
+                    self._populate_agents_table()
+        elif progress.resource == "models":
+            if progress.state == WarmupState.DONE:
+                self._deployments = list(progress.items)
+                if self._current_resource == "models":
+                    self._populate_models_table()
+            elif progress.state == WarmupState.FAILED:
+                self.notify(f"Failed to load models: {progress.error}", severity="error")
+                if self._current_resource == "models":
+                    self._load_placeholder_models()
+
+        self._update_warmup_status()
+
+    def _update_warmup_status(self) -> None:
+        """Show which resources are still loading in the header."""
+        if self._warmup is None:
+            return
+        loading = [
+            f"{p.resource} ({p.loaded})" if p.loaded else p.resource
+            for p in self._warmup.snapshot()
+            if not p.finished
+        ]
+        self.sub_title = f"Loading {', '.join(loading)}..." if loading else None
+
+    def _is_warming(self, resource: str) -> bool:
+        """Check if the warm-up is still loading a resource."""
+        if self._warmup is None:
+            return False
+        progress = self._warmup.progress(resource)
+        return progress is not None and not progress.finished
+
     def _load_agents(self) -> None:
         """Load agents from the SDK using a background worker."""
         self.run_worker(self._fetch_agents, thread=True, name="fetch_agents")
@@ -223,13 +359,37 @@ class HomeScreen(Screen[None]):
             self.run_worker(self._fetch_published_agents, thread=True, name="fetch_published")
 
     def _fetch_agents(self) -> list[Agent]:
-        """Fetch agents in background thread."""
+        """Fetch agents in background thread.
+
+        On the first load, rows are rendered page by page as they arrive. A
+        refresh of an already populated table is applied once at the end, so
+        existing rows do not disappear while later pages load.
+        """
         worker = get_current_worker()
         if worker.is_cancelled:
             return []
-        if self._project_client:
-            return self._project_client.list_agents()
-        return []
+        if not self._project_client:
+            return []
+
+        stream = not self._agents
+        loaded: list[Agent] = []
+        try:
+            # Stops before the next page once the worker is cancelled
+            cancel = _WorkerCancelToken(worker)
+            for page in self._project_client.iter_agent_pages(cancel=cancel):
+                loaded.extend(page)
+                if stream and page:
+                    self.app.call_from_thread(self._apply_agent_page, list(loaded))
+        except OperationCancelled:
+            return []
+        return loaded
+
+    def _apply_agent_page(self, agents: list[Agent]) -> None:
+        """Show the agents loaded so far while later pages are loading."""
+        self._agents = agents
+        self._merge_published_status()
+        if self._current_resource == "agents":
+            self._populate_agents_table()
 
     def _fetch_published_agents(self) -> list[PublishedAgent]:
         """Fetch published agents via ARM API in background thread."""
@@ -237,12 +397,28 @@ class HomeScreen(Screen[None]):
         if worker.is_cancelled:
             return []
         if self._arm_client:
+            published: list[PublishedAgent] = []
             try:
-                return self._arm_client.list_published_agents()
+                cancel = _WorkerCancelToken(worker)
+                for page in self._arm_client.iter_published_agent_pages(cancel):
+                    published.extend(page)
+                    # Show published status for the first pages right away
+                    self.app.call_from_thread(self._apply_published_page, page)
             except Exception:
+                # Includes OperationCancelled; publishing state is best effort
                 return []
+            return published
         return []
 
+    def _apply_published_page(self, page: list[PublishedAgent]) -> None:
+        """Merge a page of published agents while later pages are loading."""
+        if not page:
+            return
+        self._published_agents.update({p.agent_name: p for p in page})
+        self._merge_published_status()
+        if self._current_resource == "agents":
+            self._populate_agents_table()
+
     def _merge_published_status(self) -> None:
         """Merge published status into agent objects."""
         for agent in self._agents:
@@ -287,6 +463,11 @@ class HomeScreen(Screen[None]):
                     self._load_agents()
             elif event.state == WorkerState.ERROR:
                 self.notify(f"Failed to unpublish: {event.worker.error}", severity="error")
+        elif event.worker.name == "bulk_unpublish":
+            if event.state == WorkerState.SUCCESS:
+                self._report_bulk_unpublish(event.worker.result or [])
+            elif event.state == WorkerState.ERROR:
+                self.notify(f"Failed to unpublish: {event.worker.error}", severity="error")
         elif event.worker.name == "fetch_deployments":
             if event.state == WorkerState.SUCCESS:
                 self._deployments = event.worker.result or []
@@ -298,17 +479,30 @@ class HomeScreen(Screen[None]):
                 if self._current_resource == "models":
                     self._load_placeholder_models()
 
-    def _load_models(self) -> None:
-        """Load model deployments from the SDK using a background worker."""
-        self.run_worker(self._fetch_deployments, thread=True, name="fetch_deployments")
+    def _load_models(self, force: bool = False) -> None:
+        """Load model deployments using a background worker.
 
-    def _fetch_deployments(self) -> list[Deployment]:
+        Args:
+            force: Fetch from the service instead of the deployment catalog.
+        """
+        self.run_worker(
+            lambda: self._fetch_deployments(force),
+            thread=True,
+            name="fetch_deployments",
+        )
+
+    def _fetch_deployments(self, force: bool = False) -> list[Deployment]:
         """Fetch deployments in background thread."""
         worker = get_current_worker()
         if worker.is_cancelled:
             return []
         if self._project_client:
-            return self._project_client.list_deployments()
+            catalog = self._project_client.deployment_catalog
+            cancel = _WorkerCancelToken(worker)
+            try:
+                return catalog.refresh(cancel) if force else catalog.deployments(cancel)
+            except OperationCancelled:
+                return []
         return []
 
     def _populate_models_table(self) -> None:
@@ -365,49 +559,119 @@ class HomeScreen(Screen[None]):
         self._deployments.sort(key=lambda d: d.name.lower())
         self._populate_models_table()
 
+    def _agent_row(self, agent: Agent) -> tuple[str, ...]:
+        """Render the table cells for an agent."""
+        created_str = ""
+        if agent.created_at:
+            created_str = agent.created_at.strftime("%m/%d/%y, %I:%M %p")
+
+        # Truncate description for table display
+        description = agent.description or ""
+        if len(description) > 40:
+            description = description[:37] + "..."
+
+        # Count tools and knowledge bases
+        tools_count = str(len(agent.tools)) if agent.tools else "0"
+        kb_count = str(len(agent.knowledge)) if agent.knowledge else "0"
+
+        # Show published status
+        status = "Published" if agent.is_published else ""
+
+        return (
+            agent.name,
+            status,
+            agent.version,
+            agent.agent_type,
+            tools_count,
+            kb_count,
+            created_str,
+            description,
+        )
+
     def _populate_agents_table(self) -> None:
-        """Populate the table with fetched agents."""
+        """Populate the table with fetched agents.
+
+        Rows are reconciled against what is already rendered: unchanged rows
+        are left alone, changed cells are updated in place, and only added or
+        removed agents insert or delete rows.
+        """
         table = self.query_one("#resource-table", DataTable)
-        table.clear()
 
         if not self._agents:
+            table.clear()
+            self._agent_rows = {}
+            self._agents_by_row_key = {}
             self.notify("No agents found", severity="information")
             return
 
-        for agent in self._agents:
-            created_str = ""
-            if agent.created_at:
-                created_str = agent.created_at.strftime("%m/%d/%y, %I:%M %p")
+        keys = self._agent_row_keys(self._agents)
+        self._agents_by_row_key = dict(zip(keys, self._agents, strict=True))
+        rows = {key: self._agent_row(agent) for key, agent in zip(keys, self._agents, strict=True)}
+        rendered = self._agent_rows
+        kept = [agent_id for agent_id in rendered if agent_id in rows]
+        order = list(rows)
+
+        # Rows can only be appended, so anything else needs a full rebuild
+        if (
+            not self._agent_columns
+            or table.row_count != len(rendered)
+            or order[: len(kept)] != kept
+        ):
+            table.clear()
+            for agent_id, row in rows.items():
+                table.add_row(*row, key=agent_id)
+            self._agent_rows = rows
+            return
 
-            # Truncate description for table display
-            description = agent.description or ""
-            if len(description) > 40:
-                description = description[:37] + "..."
+        for agent_id in rendered.keys() - rows.keys():
+            table.remove_row(agent_id)
 
-            # Count tools and knowledge bases
-            tools_count = str(len(agent.tools)) if agent.tools else "0"
-            kb_count = str(len(agent.knowledge)) if agent.knowledge else "0"
+        for agent_id, row in rows.items():
+            previous = rendered.get(agent_id)
+            if previous is None:
+                table.add_row(*row, key=agent_id)
+                continue
+            for column, old_value, new_value in zip(
+                self._agent_columns, previous, row, strict=True
+            ):
+                if old_value != new_value:
+                    table.update_cell(agent_id, column, new_value)
 
-            # Show published status
-            status = "Published" if agent.is_published else ""
+        self._agent_rows = rows
 
-            table.add_row(
-                agent.name,
-                status,
-                agent.version,
-                agent.agent_type,
-                tools_count,
-                kb_count,
-                created_str,
-                description,
-                key=agent.id,
-            )
+    @staticmethod
+    def _agent_row_keys(agents: list[Agent]) -> list[str]:
+        """Get a unique table row key for each agent.
+
+        Rows are keyed by agent ID. An agent without an ID falls back to its
+        name, and a key that is missing or already taken gets the agent's
+        position appended, so no agent's row replaces another's.
+
+        Args:
+            agents: Agents in table order.
+
+        Returns:
+            One row key per agent, in the same order.
+        """
+        keys: list[str] = []
+        used: set[str] = set()
+        for index, agent in enumerate(agents):
+            key = agent.id or agent.name
+            if not key or key in used:
+                key = f"{key}#{index}"
+                while key in used:
+                    key += "#"
+            used.add(key)
+            keys.append(key)
+        return keys
 
     def _setup_agents_table(self) -> None:
         """Configure the table for Agents resource."""
         table = self.query_one("#resource-table", DataTable)
         table.clear(columns=True)
-        table.add_columns(
+        self._agent_rows = {}
+        self._agents_by_row_key = {}
+        self._agent_columns = table.add_columns(
             "Name", "Status", "Version", "Type", "Tools", "KB", "Created", "Description"
         )
 
@@ -415,6 +679,9 @@ class HomeScreen(Screen[None]):
         """Configure the table for Models resource."""
         table = self.query_one("#resource-table", DataTable)
         table.clear(columns=True)
+        self._agent_rows = {}
+        self._agents_by_row_key = {}
+        self._agent_columns = []
         table.add_columns("Name", "Model", "Version", "Type", "Publisher")
 
     def _load_placeholder_data(self) -> None:
@@ -503,14 +770,21 @@ class HomeScreen(Screen[None]):
             title.update("Agents")
             self._setup_agents_table()
             if self._project_client:
-                self._load_agents()
+                # Show what we have right away; the warm-up or a refresh fills in the rest
+                if self._agents:
+                    self._populate_agents_table()
+                if not self._is_warming("agents"):
+                    self._load_agents()
             else:
                 self._load_placeholder_data()
         elif event.resource_id == "models":
             title.update("Models")
             self._setup_models_table()
             if self._project_client:
-                self._load_models()
+                if self._deployments:
+                    self._populate_models_table()
+                if not self._is_warming("models"):
+                    self._load_models()
             else:
                 self._load_placeholder_models()
         elif event.resource_id == "knowledge":
@@ -540,6 +814,11 @@ class HomeScreen(Screen[None]):
                 return agent
         return None
 
+    def _get_agent_by_row_key(self, row_key: str) -> Agent | None:
+        """Find the agent shown in a table row."""
+        agent = self._agents_by_row_key.get(row_key)
+        return agent if agent is not None else self._get_agent_by_id(row_key)
+
     def _get_deployment_by_name(self, name: str) -> Deployment | None:
         """Find a deployment by its name."""
         for deployment in self._deployments:
@@ -712,7 +991,7 @@ class HomeScreen(Screen[None]):
             title.update(str(name))
 
             # Try to get full agent details
-            agent = self._get_agent_by_id(str(event.row_key.value)) if event.row_key else None
+            agent = self._get_agent_by_row_key(str(event.row_key.value)) if event.row_key else None
             if agent:
                 content.update(self._format_agent_preview(agent))
             else:
@@ -766,7 +1045,9 @@ class HomeScreen(Screen[None]):
                 title.update(str(name))
 
                 # Try to get full agent details
-                agent = self._get_agent_by_id(str(event.row_key.value)) if event.row_key else None
+                agent = (
+                    self._get_agent_by_row_key(str(event.row_key.value)) if event.row_key else None
+                )
                 if agent:
                     content.update(self._format_agent_preview(agent))
                 else:
@@ -813,7 +1094,7 @@ class HomeScreen(Screen[None]):
         if self._current_resource == "agents" and self._project_client:
             self._load_agents()
         elif self._current_resource == "models" and self._project_client:
-            self._load_models()
+            self._load_models(force=True)
         else:
             self._load_placeholder_data()
         self.notify("Refreshed")
@@ -831,10 +1112,9 @@ class HomeScreen(Screen[None]):
         try:
             row_key = table.get_row_at(table.cursor_row)
             if row_key:
-                # The key is the agent ID
                 cursor_row_key = table._row_locations.get_key(table.cursor_row)
                 if cursor_row_key:
-                    return self._get_agent_by_id(str(cursor_row_key.value))
+                    return self._get_agent_by_row_key(str(cursor_row_key.value))
         except Exception:
             pass
         return None
@@ -842,11 +1122,23 @@ class HomeScreen(Screen[None]):
     def _on_edit_screen_dismiss(self, result: Agent | None) -> None:
         """Handle edit screen dismissal."""
         if result:
-            # Agent was saved, refresh the list
-            if self._project_client:
-                self._load_agents()
+            # Agent was saved; splice it in instead of reloading every agent
+            self._splice_agent(result)
             self.notify(f"Agent '{result.name}' saved")
 
+    def _splice_agent(self, agent: Agent) -> None:
+        """Insert or replace a single agent in the loaded list."""
+        for i, existing in enumerate(self._agents):
+            if existing.id == agent.id or existing.name == agent.name:
+                self._agents[i] = agent
+                break
+        else:
+            self._agents.append(agent)
+
+        self._merge_published_status()
+        if self._current_resource == "agents":
+            self._populate_agents_table()
+
     def action_new_agent(self) -> None:
         """Create a new agent."""
         if self._current_resource != "agents":
@@ -961,6 +1253,70 @@ class HomeScreen(Screen[None]):
             self._arm_client.unpublish_agent(application_name, deployment_name)
         return agent_name
 
+    def action_bulk_unpublish(self) -> None:
+        """Select several deployments and unpublish them in one go."""
+        if self._current_resource != "agents":
+            self.notify("Can only unpublish agents in Agents view", severity="warning")
+            return
+
+        if not self._arm_client:
+            self.notify("ARM client not available", severity="error")
+            return
+
+        # A deployment may serve several agents; offer each one only once
+        targets: dict[tuple[str, str], str] = {}
+        for pub_agent in self._published_agents.values():
+            for dep in pub_agent.deployments:
+                key = (pub_agent.application_name, dep.deployment_name)
+                targets.setdefault(key, f"{pub_agent.agent_name} / {dep.deployment_name}")
+
+        if not targets:
+            self.notify("No published deployments", severity="warning")
+            return
+
+        self.app.push_screen(
+            BulkUnpublishScreen(targets),
+            callback=self._handle_bulk_unpublish_selection,
+        )
+
+    def _handle_bulk_unpublish_selection(self, targets: list[tuple[str, str]] | None) -> None:
+        """Start unpublishing the selected deployments."""
+        if not targets or not self._arm_client:
+            return
+
+        self.notify(f"Unpublishing {len(targets)} deployment(s)...")
+        self.run_worker(
+            lambda: self._do_bulk_unpublish(targets),
+            thread=True,
+            name="bulk_unpublish",
+        )
+
+    def _do_bulk_unpublish(self, targets: list[tuple[str, str]]) -> list[UnpublishResult]:
+        """Perform the bulk unpublish operation in background thread."""
+        if self._arm_client:
+            return self._arm_client.unpublish_agents(targets)
+        return []
+
+    def _report_bulk_unpublish(self, results: list[UnpublishResult]) -> None:
+        """Summarize a bulk unpublish and refresh published state once."""
+        failed = [r for r in results if not r.succeeded]
+        succeeded = len(results) - len(failed)
+
+        if failed:
+            names = ", ".join(r.deployment_name for r in failed[:3])
+            if len(failed) > 3:
+                names += f" and {len(failed) - 3} more"
+            self.notify(
+                f"Unpublished {succeeded} of {len(results)} deployment(s). Failed: {names}",
+                severity="error",
+            )
+        else:
+            self.notify(f"Unpublished {succeeded} deployment(s)", severity="information")
+
+        # Only publishing state changed, so the agents themselves need no reload
+        if succeeded and self._arm_client:
+            self.run_worker(self._fetch_published_agents, thread=True, name="fetch_published")
+
     def action_focus_next(self) -> None:
         """Focus the next pane."""
         # Cycle: sidebar -> table -> search -> sidebar
@@ -1150,3 +1506,94 @@ class SelectDeploymentScreen(Screen[PublishedDeployment | None]):
     def action_cancel(self) -> None:
         """Cancel the operation."""
         self.dismiss(None)
+
+
+class BulkUnpublishScreen(Screen[list[tuple[str, str]] | None]):
+    """Screen to select several deployments to unpublish at once."""
+
+    CSS = """
+    BulkUnpublishScreen {
+        align: center middle;
+    }
+
+    #bulk-dialog {
+        width: 70;
+        height: auto;
+        max-height: 30;
+        padding: 1 2;
+        background: $surface;
+        border: solid $primary;
+    }
+
+    #bulk-title {
+        text-style: bold;
+        margin-bottom: 1;
+    }
+
+    #bulk-message {
+        margin-bottom: 1;
+        color: $text-muted;
+    }
+
+    #bulk-list {
+        height: auto;
+        max-height: 18;
+        margin-bottom: 1;
+    }
+
+    #bulk-buttons {
+        width: 100%;
+        height: 3;
+        align: center middle;
+    }
+
+    #bulk-buttons Button {
+        margin: 0 1;
+    }
+
+    .danger-btn {
+        background: $error;
+    }
+    """
+
+    BINDINGS = [  # noqa: RUF012
+        Binding("escape", "cancel", "Cancel"),
+    ]
+
+    def __init__(self, targets: dict[tuple[str, str], str]) -> None:
+        """Initialize the selection screen.
+
+        Args:
+            targets: Display labels keyed by (application name, deployment name).
+        """
+        super().__init__()
+        self._targets = targets
+
+    def compose(self) -> ComposeResult:
+        """Create the selection dialog."""
+        with Container(id="bulk-dialog"):
+            yield Static("Unpublish Deployments", id="bulk-title")
+            yield Static(
+                "Select the deployments to unpublish (space to toggle).\n"
+                "This will remove their API endpoints.",
+                id="bulk-message",
+            )
+            yield SelectionList[tuple[str, str]](
+                *((label, key) for key, label in self._targets.items()),
+                id="bulk-list",
+            )
+            with Horizontal(id="bulk-buttons"):
+                yield Button("Cancel", id="cancel-btn")
+                yield Button("Unpublish", id="confirm-btn", classes="danger-btn")
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        """Handle button press."""
+        if event.button.id == "confirm-btn":
+            selection_list = self.query_one("#bulk-list", SelectionList)
+            self.dismiss(list(selection_list.selected))
+        else:
+            self.dismiss(None)
+
+    def action_cancel(self) -> None:
+        """Cancel the operation."""
+        self.dismiss(None)
@@ -0,0 +1,190 @@
+"""All-projects discovery screen for Anvil TUI."""
+
+import threading
+
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Center, Container
+from textual.screen import Screen
+from textual.widgets import LoadingIndicator, Static
+from textual.worker import Worker, WorkerState
+
+from anvil.services.discovery import DiscoveredProject, FoundryDiscovery
+from anvil.services.subscriptions import SubscriptionService
+from anvil.widgets.searchable_list import SearchableList
+
+
+class ProjectDiscoveryScreen(Screen[DiscoveredProject | None]):
+    """Screen for picking a project from all subscriptions at once.
+
+    Projects are listed as they are discovered, so the user can start
+    filtering before every subscription has been searched. Returns the
+    selected DiscoveredProject or None if cancelled.
+    """
+
+    BINDINGS = [  # noqa: RUF012
+        Binding("escape", "cancel", "Back"),
+        Binding("/", "focus_search", "Search"),
+    ]
+
+    CSS = """
+    ProjectDiscoveryScreen {
+        align: center middle;
+    }
+
+    #select-container {
+        width: 100;
+        height: auto;
+        padding: 1 2;
+        border: solid $primary;
+        background: $surface;
+    }
+
+    #screen-title {
+        text-align: center;
+        text-style: bold;
+        color: $primary;
+        margin-bottom: 1;
+    }
+
+    #status {
+        text-align: center;
+        color: $text-muted;
+    }
+
+    #error {
+        text-align: center;
+        color: $error;
+        display: none;
+    }
+
+    #error.has-error {
+        display: block;
+    }
+
+    #loading {
+        height: 3;
+    }
+    """
+
+    def __init__(
+        self,
+        subscription_service: SubscriptionService,
+        discovery: FoundryDiscovery,
+    ) -> None:
+        """Initialize the project discovery screen.
+
+        Args:
+            subscription_service: Service for listing the subscriptions to search.
+            discovery: Discovery used to search the subscriptions.
+        """
+        super().__init__()
+        self._service = subscription_service
+        self._discovery = discovery
+        self._projects: dict[str, DiscoveredProject] = {}
+        self._subscription_count = 0
+        self._cancel = threading.Event()
+
+    def compose(self) -> ComposeResult:
+        with Center(), Container(id="select-container"):
+            yield Static("Find Foundry Project", id="screen-title")
+            yield Static("Loading subscriptions...", id="status")
+            yield Static("", id="error")
+            with Center():
+                yield LoadingIndicator(id="loading")
+            yield SearchableList[str](
+                placeholder="Type to filter by project, instance or subscription...",
+                id="project-list",
+            )
+
+    def on_mount(self) -> None:
+        """Start searching all subscriptions."""
+        self.query_one("#project-list", SearchableList).display = False
+        self.run_worker(self._discover_projects, thread=True)
+
+    def on_unmount(self) -> None:
+        """Stop discovery when the screen closes."""
+        self._cancel.set()
+
+    def _discover_projects(self) -> None:
+        """Search all subscriptions in background thread, streaming results."""
+        subscriptions = self._service.list_subscriptions()
+        self._subscription_count = len(subscriptions)
+        if self._cancel.is_set():
+            return
+        self.app.call_from_thread(self._update_status, searching=True)
+
+        for page in self._discovery.iter_pages(subscriptions, self._cancel):
+            if self._cancel.is_set():
+                return
+            self.app.call_from_thread(self._add_projects, page)
+
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        """Handle worker completion."""
+        if event.state == WorkerState.SUCCESS:
+            self.query_one("#loading", LoadingIndicator).display = False
+            self._update_status(searching=False)
+        elif event.state == WorkerState.ERROR:
+            self.query_one("#loading", LoadingIndicator).display = False
+            self.query_one("#status", Static).update("Failed to search subscriptions.")
+            error_widget = self.query_one("#error", Static)
+            error_widget.update(str(event.worker.error))
+            error_widget.add_class("has-error")
+
+    def _add_projects(self, page: list[DiscoveredProject]) -> None:
+        """Add newly discovered projects to the list.
+
+        Args:
+            page: Projects found in one account.
+        """
+        if not self.is_mounted:
+            return
+        for found in page:
+            if found.project is not None:
+                self._projects[found.project.id] = found
+
+        options = sorted(
+            ((found.label, key) for key, found in self._projects.items()),
+            key=lambda option: option[0].lower(),
+        )
+        search_list = self.query_one("#project-list", SearchableList)
+        search_list.display = True
+        search_list.set_options(options)
+        self._update_status(searching=True)
+
+    def _update_status(self, searching: bool) -> None:
+        """Show how many projects have been found so far.
+
+        Args:
+            searching: Whether discovery is still running.
+        """
+        if not self.is_mounted:
+            return
+        count = len(self._projects)
+        if searching:
+            status = (
+                f"Searching {self._subscription_count} subscription(s)... found {count} project(s)."
+            )
+        elif count:
+            status = f"Found {count} project(s). Select one or type to filter."
+        else:
+            status = "No projects found in any subscription."
+
+        failures = len(self._discovery.failures)
+        if failures and not searching:
+            status += f" {failures} subscription(s) or instance(s) could not be searched."
+        self.query_one("#status", Static).update(status)
+
+    def on_searchable_list_selected(self, event: SearchableList.Selected) -> None:
+        """Handle project selection."""
+        found = self._projects.get(event.value)
+        if found is not None:
+            self.dismiss(found)
+
+    def action_cancel(self) -> None:
+        """Handle cancel action."""
+        self.dismiss(None)
+
+    def action_focus_search(self) -> None:
+        """Focus the search input."""
+        self.query_one("#project-list", SearchableList).focus_search()
@@ -1,5 +1,7 @@
 """Project selection screen for Anvil TUI."""
 
+from concurrent.futures import Future
+
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Center, Container
@@ -8,6 +10,7 @@ from textual.widgets import LoadingIndicator, Static
 from textual.worker import Worker, WorkerState, get_current_worker
 
 from anvil.services.foundry import FoundryAccount, FoundryProject, FoundryService
+from anvil.services.inventory import InventoryCache
 from anvil.widgets.searchable_list import SearchableList
 
 
@@ -72,6 +75,8 @@ class ProjectSelectScreen(Screen[FoundryProject | None]):
         foundry_service: FoundryService,
         account: FoundryAccount,
         highlight_project_name: str | None = None,
+        inventory: InventoryCache | None = None,
+        prefetched: Future[list[FoundryProject]] | None = None,
     ) -> None:
         """Initialize the project select screen.
 
@@ -79,11 +84,16 @@ class ProjectSelectScreen(Screen[FoundryProject | None]):
             foundry_service: Service for listing projects.
             account: The Foundry account to list projects from.
             highlight_project_name: Project name to highlight (last used).
+            inventory: Cache to show projects from while they are refreshed.
+            prefetched: Listing of the projects started ahead of time, used
+                instead of fetching them again.
         """
         super().__init__()
         self._service = foundry_service
         self._account = account
         self._highlight_name = highlight_project_name
+        self._inventory = inventory
+        self._prefetched = prefetched
         self._projects: list[FoundryProject] = []
 
     def compose(self) -> ComposeResult:
@@ -101,8 +111,16 @@ class ProjectSelectScreen(Screen[FoundryProject | None]):
             )
 
     def on_mount(self) -> None:
-        """Load projects on mount."""
+        """Show prefetched or cached projects, then load current ones."""
         self.query_one("#project-list", SearchableList).display = False
+        cached = self._inventory.get_projects(self._account.id) if self._inventory else None
+        prefetched = self._prefetched_projects(wait=False)
+        if prefetched is not None:
+            self._projects = prefetched
+            self._show_projects()
+        elif cached and cached.items:
+            self._projects = cached.items
+            self._show_projects(refreshing=True)
         self.run_worker(self._fetch_projects, thread=True)
 
     def _fetch_projects(self) -> list[FoundryProject]:
@@ -110,10 +128,33 @@ class ProjectSelectScreen(Screen[FoundryProject | None]):
         worker = get_current_worker()
         if worker.is_cancelled:
             return []
-        return self._service.list_projects(
-            resource_group=self._account.resource_group,
-            account_name=self._account.name,
-        )
+        projects = self._prefetched_projects()
+        if projects is None:
+            projects = self._service.list_projects(
+                resource_group=self._account.resource_group,
+                account_name=self._account.name,
+            )
+        if self._inventory:
+            self._inventory.put_projects(self._account.id, projects)
+        return projects
+
+    def _prefetched_projects(self, wait: bool = True) -> list[FoundryProject] | None:
+        """Get the prefetched projects.
+
+        Args:
+            wait: Whether to wait for a prefetch that is still running.
+
+        Returns:
+            The prefetched projects, or None if there are none, the prefetch
+            failed, or it is still running and wait is False.
+        """
+        if self._prefetched is None or not (wait or self._prefetched.done()):
+            return None
+        try:
+            return self._prefetched.result()
+        except Exception:
+            # Fetched again instead
+            return None
 
     def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
         """Handle worker completion."""
@@ -121,14 +162,22 @@ class ProjectSelectScreen(Screen[FoundryProject | None]):
             self._projects = event.worker.result or []
             self._show_projects()
         elif event.state == WorkerState.ERROR:
+            if self._projects:
+                # Keep the cached list usable
+                self.query_one("#status", Static).update("Showing cached projects; refresh failed.")
+                return
             self.query_one("#loading", LoadingIndicator).display = False
             self.query_one("#status", Static).update("Failed to load projects.")
             error_widget = self.query_one("#error", Static)
             error_widget.update(str(event.worker.error))
             error_widget.add_class("has-error")
 
-    def _show_projects(self) -> None:
-        """Display loaded projects."""
+    def _show_projects(self, refreshing: bool = False) -> None:
+        """Display loaded projects.
+
+        Args:
+            refreshing: Whether these are cached projects being refreshed.
+        """
         if not self._projects:
             self.query_one("#loading", LoadingIndicator).display = False
             self.query_one("#status", Static).update(
@@ -143,9 +192,10 @@ class ProjectSelectScreen(Screen[FoundryProject | None]):
 
         # Update UI
         self.query_one("#loading", LoadingIndicator).display = False
-        self.query_one("#status", Static).update(
-            f"Found {len(self._projects)} project(s). Select one or type to filter."
-        )
+        status = f"Found {len(self._projects)} project(s). Select one or type to filter."
+        if refreshing:
+            status += " Refreshing..."
+        self.query_one("#status", Static).update(status)
 
         search_list = self.query_one("#project-list", SearchableList)
         search_list.display = True
@@ -1,12 +1,18 @@
 """Subscription selection screen for Anvil TUI."""
 
+from collections.abc import Callable
+from functools import partial
+
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Center, Container
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widgets import LoadingIndicator, Static
 from textual.worker import Worker, WorkerState, get_current_worker
 
+from anvil.services.inventory import InventoryCache
+from anvil.services.prefetch import PrefetchCache
 from anvil.services.subscriptions import Subscription, SubscriptionService
 from anvil.widgets.searchable_list import SearchableList
 
@@ -66,16 +72,29 @@ class SubscriptionSelectScreen(Screen[Subscription | None]):
         self,
         subscription_service: SubscriptionService,
         highlight_subscription_id: str | None = None,
+        inventory: InventoryCache | None = None,
+        prefetch: Callable[[Subscription], None] | None = None,
+        prefetch_delay: float = PrefetchCache.DEFAULT_DWELL,
     ) -> None:
         """Initialize the subscription select screen.
 
         Args:
             subscription_service: Service for listing subscriptions.
             highlight_subscription_id: Subscription ID to highlight (last used).
+            inventory: Cache to show subscriptions from while they are refreshed.
+            prefetch: Starts fetching a subscription's Foundry instances in the
+                background. Called for the last used subscription, and for any
+                subscription highlighted for prefetch_delay seconds.
+            prefetch_delay: Seconds a subscription must stay highlighted
+                before it is prefetched.
         """
         super().__init__()
         self._service = subscription_service
         self._highlight_id = highlight_subscription_id
+        self._inventory = inventory
+        self._prefetch = prefetch
+        self._prefetch_delay = prefetch_delay
+        self._prefetch_timer: Timer | None = None
         self._subscriptions: list[Subscription] = []
 
     def compose(self) -> ComposeResult:
@@ -92,8 +111,12 @@ class SubscriptionSelectScreen(Screen[Subscription | None]):
             )
 
     def on_mount(self) -> None:
-        """Load subscriptions on mount."""
+        """Show cached subscriptions, then load fresh ones."""
         self.query_one("#subscription-list", SearchableList).display = False
+        cached = self._inventory.get_subscriptions() if self._inventory else None
+        if cached and cached.items:
+            self._subscriptions = cached.items
+            self._show_subscriptions(refreshing=True)
         self.run_worker(self._fetch_subscriptions, thread=True)
 
     def _fetch_subscriptions(self) -> list[Subscription]:
@@ -101,7 +124,10 @@ class SubscriptionSelectScreen(Screen[Subscription | None]):
         worker = get_current_worker()
         if worker.is_cancelled:
             return []
-        return self._service.list_subscriptions()
+        subscriptions = self._service.list_subscriptions()
+        if self._inventory:
+            self._inventory.put_subscriptions(subscriptions)
+        return subscriptions
 
     def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
         """Handle worker completion."""
@@ -109,14 +135,24 @@ class SubscriptionSelectScreen(Screen[Subscription | None]):
             self._subscriptions = event.worker.result or []
             self._show_subscriptions()
         elif event.state == WorkerState.ERROR:
+            if self._subscriptions:
+                # Keep the cached list usable
+                self.query_one("#status", Static).update(
+                    "Showing cached subscriptions; refresh failed."
+                )
+                return
             self.query_one("#loading", LoadingIndicator).display = False
             self.query_one("#status", Static).update("Failed to load subscriptions.")
             error_widget = self.query_one("#error", Static)
             error_widget.update(str(event.worker.error))
             error_widget.add_class("has-error")
 
-    def _show_subscriptions(self) -> None:
-        """Display loaded subscriptions."""
+    def _show_subscriptions(self, refreshing: bool = False) -> None:
+        """Display loaded subscriptions.
+
+        Args:
+            refreshing: Whether these are cached subscriptions being refreshed.
+        """
         if not self._subscriptions:
             self.query_one("#loading", LoadingIndicator).display = False
             self.query_one("#status", Static).update(
@@ -132,21 +168,45 @@ class SubscriptionSelectScreen(Screen[Subscription | None]):
 
         # Update UI
         self.query_one("#loading", LoadingIndicator).display = False
-        self.query_one("#status", Static).update(
-            f"Found {len(self._subscriptions)} subscription(s). Select one or type to filter."
-        )
+        status = f"Found {len(self._subscriptions)} subscription(s). Select one or type to filter."
+        if refreshing:
+            status += " Refreshing..."
+        self.query_one("#status", Static).update(status)
 
         search_list = self.query_one("#subscription-list", SearchableList)
         search_list.display = True
         search_list.set_options(options)
 
+        # The last used subscription is the likeliest choice
+        last_used = self._find_subscription(self._highlight_id)
+        if self._prefetch is not None and last_used is not None:
+            self._prefetch(last_used)
+
+    def _find_subscription(self, subscription_id: str | None) -> Subscription | None:
+        """Find a loaded subscription by ID."""
+        for sub in self._subscriptions:
+            if sub.subscription_id == subscription_id:
+                return sub
+        return None
+
+    def on_searchable_list_highlighted(self, event: SearchableList.Highlighted) -> None:
+        """Prefetch a subscription once it has stayed highlighted for a moment."""
+        if self._prefetch is None:
+            return
+        if self._prefetch_timer is not None:
+            self._prefetch_timer.stop()
+            self._prefetch_timer = None
+        subscription = self._find_subscription(event.value)
+        if subscription is not None:
+            self._prefetch_timer = self.set_timer(
+                self._prefetch_delay, partial(self._prefetch, subscription)
+            )
+
     def on_searchable_list_selected(self, event: SearchableList.Selected) -> None:
         """Handle subscription selection."""
-        # Find the subscription by ID
-        for sub in self._subscriptions:
-            if sub.subscription_id == event.value:
-                self.dismiss(sub)
-                return
+        subscription = self._find_subscription(event.value)
+        if subscription is not None:
+            self.dismiss(subscription)
 
     def action_cancel(self) -> None:
         """Handle cancel action."""
@@ -1,16 +1,80 @@
 """ARM client service for Azure Resource Manager operations."""
 
+import asyncio
+import random
 import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any, Self
 
 import httpx
 from azure.core.credentials import TokenCredential
 
-from anvil.services.exceptions import NetworkError, NotAuthenticated
+from anvil.services.cancellation import CancelToken, check_cancelled
+from anvil.services.exceptions import NetworkError, NotAuthenticated, OperationCancelled
 from anvil.services.ssl_config import format_ssl_error_message, get_ssl_verify
 
 
+def _parse_retry_after(value: object) -> float | None:
+    """Parse a Retry-After header given in seconds or as an HTTP date.
+
+    Args:
+        value: Raw header value.
+
+    Returns:
+        Delay in seconds, or None if the header is missing or invalid.
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+def retry_delay(
+    response: httpx.Response,
+    attempt: int,
+    backoff_base: float,
+    backoff_max: float,
+    max_retry_after: float,
+) -> float:
+    """Get the delay before retrying a throttled or failed Azure request.
+
+    Honours the Retry-After header (seconds or HTTP date) when present,
+    otherwise uses exponential backoff with jitter.
+
+    Args:
+        response: Response that is being retried.
+        attempt: Number of retries already made.
+        backoff_base: Backoff before the first retry, in seconds.
+        backoff_max: Maximum backoff, in seconds.
+        max_retry_after: Maximum Retry-After delay honoured, in seconds.
+
+    Returns:
+        Delay in seconds.
+    """
+    retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+    if retry_after is not None:
+        return min(retry_after, max_retry_after)
+
+    backoff = min(backoff_max, backoff_base * 2.0**attempt)
+    return backoff * random.uniform(0.5, 1.0)
+
+
 @dataclass
 class PublishedDeployment:
     """Individual deployment/version of a published agent."""
@@ -57,16 +121,63 @@ class PublishedAgent:
         return len(self.deployments) > 1
 
 
-class ArmClientService:
-    """Service for Azure Resource Manager operations.
+@dataclass
+class UnpublishResult:
+    """Outcome of unpublishing one deployment in a batch."""
 
-    Provides methods for managing published agents via the ARM API,
-    which is separate from the Azure AI Projects SDK.
+    application_name: str
+    deployment_name: str
+    error: str | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        """Check if the deployment was unpublished."""
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class _CachedResponse:
+    """Parsed body of a GET response together with its validators."""
+
+    etag: str | None
+    last_modified: str | None
+    body: dict[str, Any]
+
+
+class _ArmClientBase:
+    """Shared configuration, retry policy and parsing for the ARM clients.
+
+    Subclasses provide the transport: ArmClientService is blocking and
+    AsyncArmClientService is built on asyncio.
     """
 
     # ARM API version for Cognitive Services
     API_VERSION = "2025-10-01-preview"
 
+    # Default connection pool settings for the shared HTTP client
+    DEFAULT_MAX_CONNECTIONS = 10
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 10
+    DEFAULT_KEEPALIVE_EXPIRY = 60.0
+
+    # Default number of ARM requests allowed in flight during fan-out
+    DEFAULT_MAX_CONCURRENCY = 8
+
+    # Retry policy for throttled and transient failures
+    DEFAULT_MAX_RETRIES = 3
+    RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+    IDEMPOTENT_METHODS = frozenset({"GET", "PUT", "DELETE"})
+    RETRY_BACKOFF_BASE = 0.5
+    RETRY_BACKOFF_MAX = 30.0
+    MAX_RETRY_AFTER = 60.0
+
+    # Throttling headers, e.g. x-ms-ratelimit-remaining-subscription-reads
+    RATE_LIMIT_HEADER_PREFIX = "x-ms-ratelimit-remaining-"
+    RATE_LIMIT_LOW_WATERMARK = 10
+    RATE_LIMIT_PACING_DELAY = 1.0
+
+    # Maximum number of GET responses kept for conditional requests
+    MAX_CACHED_RESPONSES = 256
+
     def __init__(
         self,
         subscription_id: str,
@@ -74,6 +185,11 @@ class ArmClientService:
         account_name: str,
         project_name: str,
         credential: TokenCredential,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_retries: int = DEFAULT_MAX_RETRIES,
     ) -> None:
         """Initialize the ARM client service.
 
@@ -83,12 +199,40 @@ class ArmClientService:
             account_name: Cognitive Services account name.
             project_name: Project name within the account.
             credential: Azure credential for authentication.
+            max_connections: Maximum number of concurrent connections in the pool.
+            max_keepalive_connections: Maximum number of idle connections kept alive.
+            keepalive_expiry: Seconds an idle connection is kept before closing.
+            max_concurrency: Maximum number of per-application requests in flight
+                when listing published agents. Use 1 for sequential requests.
+            max_retries: Maximum number of retries for throttled or transient failures.
         """
         self._subscription_id = subscription_id
         self._resource_group = resource_group
         self._account_name = account_name
         self._project_name = project_name
         self._credential = credential
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._max_concurrency = max_concurrency
+        self._max_retries = max_retries
+        # Guards lazy creation of the HTTP client; once closed it is not reopened
+        self._http_client_lock = threading.Lock()
+        self._closed = False
+        self._rate_limit_remaining: dict[str, int] = {}
+        # Fan-out threads record budgets while others pace against them
+        self._rate_limit_lock = threading.Lock()
+        self._response_cache: OrderedDict[str, _CachedResponse] = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+        # Agent name -> raw payload of the application that serves it
+        self._agent_applications: dict[str, dict[str, Any]] = {}
+        # Listings, lookups and unpublishes update the index from several threads
+        self._agent_applications_lock = threading.Lock()
+        # Set once a complete listing has filled the index, so agents missing
+        # from it are known to be unpublished
+        self._agent_index_complete = False
         self._base_url = (
             f"https://management.azure.com/subscriptions/{subscription_id}"
             f"/resourceGroups/{resource_group}"
@@ -103,7 +247,7 @@ class ArmClientService:
         subscription_id: str,
         resource_group: str,
         credential: TokenCredential,
-    ) -> "ArmClientService":
+    ) -> Self:
         """Create an ARM client from a project endpoint URL.
 
         Args:
@@ -113,7 +257,7 @@ class ArmClientService:
             credential: Azure credential for authentication.
 
         Returns:
-            Configured ArmClientService instance.
+            Configured client instance.
         """
         # Parse endpoint to extract account and project names
         # Format: https://{account}.services.ai.azure.com/api/projects/{project}
@@ -140,6 +284,416 @@ class ArmClientService:
         token = self._credential.get_token("https://management.azure.com/.default")
         return token.token
 
+    def _url(self, path: str) -> str:
+        """Build the full ARM URL for a path relative to the project."""
+        return f"{self._base_url}{path}?api-version={self.API_VERSION}"
+
+    def _parse_response(self, response: httpx.Response) -> dict[str, Any]:
+        """Convert a final ARM response into JSON or the matching exception.
+
+        Raises:
+            NotAuthenticated: If authentication fails.
+            NetworkError: If the request failed.
+        """
+        if response.status_code == 401:
+            raise NotAuthenticated("ARM API authentication failed")
+        if response.status_code == 204:
+            return {}  # No content response
+        if response.status_code >= 400:
+            error_msg = response.text
+            raise NetworkError(f"ARM API request failed: {error_msg}")
+
+        return response.json() if response.text else {}
+
+    def _conditional_headers(self, method: str, url: str) -> dict[str, str]:
+        """Get the validators to send with a GET for a previously cached URL."""
+        if method != "GET":
+            return {}
+        with self._response_cache_lock:
+            cached = self._response_cache.get(url)
+        if cached is None:
+            return {}
+
+        headers: dict[str, str] = {}
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+        return headers
+
+    def _complete_response(
+        self, method: str, url: str, response: httpx.Response
+    ) -> dict[str, Any] | None:
+        """Resolve a final response, serving and refreshing the GET cache.
+
+        A 304 Not Modified reuses the body parsed for the previous response,
+        so unchanged listings are neither downloaded nor parsed again. Cached
+        bodies are shared between callers and must be treated as read-only.
+
+        Returns:
+            Response JSON as a dictionary, or None for a 304 whose cached body
+            was evicted after the validators were sent.
+
+        Raises:
+            NotAuthenticated: If authentication fails.
+            NetworkError: If the request failed.
+        """
+        if method != "GET":
+            return self._parse_response(response)
+
+        if response.status_code == 304:
+            with self._response_cache_lock:
+                cached = self._response_cache.get(url)
+                if cached is None:
+                    return None
+                self._response_cache.move_to_end(url)
+                return cached.body
+
+        body = self._parse_response(response)
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not isinstance(etag, str):
+            etag = None
+        if not isinstance(last_modified, str):
+            last_modified = None
+
+        with self._response_cache_lock:
+            if etag or last_modified:
+                self._response_cache[url] = _CachedResponse(etag, last_modified, body)
+                self._response_cache.move_to_end(url)
+                while len(self._response_cache) > self.MAX_CACHED_RESPONSES:
+                    self._response_cache.popitem(last=False)
+            else:
+                self._response_cache.pop(url, None)
+        return body
+
+    def clear_response_cache(self) -> None:
+        """Forget cached GET responses so the next requests fetch full payloads."""
+        with self._response_cache_lock:
+            self._response_cache.clear()
+
+    def _should_retry(self, method: str, status_code: int, attempt: int) -> bool:
+        """Check whether a response should be retried.
+
+        Throttled requests (429) were not processed and are safe to retry for
+        any verb; transient server errors are only retried for idempotent verbs.
+        """
+        if attempt >= self._max_retries or status_code not in self.RETRY_STATUS_CODES:
+            return False
+        return status_code == 429 or method in self.IDEMPOTENT_METHODS
+
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        """Get the delay before the next attempt."""
+        return retry_delay(
+            response,
+            attempt,
+            self.RETRY_BACKOFF_BASE,
+            self.RETRY_BACKOFF_MAX,
+            self.MAX_RETRY_AFTER,
+        )
+
+    def _record_rate_limits(self, response: httpx.Response) -> None:
+        """Remember the remaining ARM request budget reported by the response."""
+        for name, value in response.headers.items():
+            header = name.lower()
+            if not header.startswith(self.RATE_LIMIT_HEADER_PREFIX):
+                continue
+            try:
+                remaining = int(value)
+            except (TypeError, ValueError):
+                continue
+            budget = header.removeprefix(self.RATE_LIMIT_HEADER_PREFIX)
+            with self._rate_limit_lock:
+                self._rate_limit_remaining[budget] = remaining
+
+    def _pacing_delay(self, method: str) -> float:
+        """Get the delay to apply before a request when the budget runs low."""
+        remaining = self.remaining_budget(method)
+        if remaining is not None and remaining <= self.RATE_LIMIT_LOW_WATERMARK:
+            return self.RATE_LIMIT_PACING_DELAY
+        return 0.0
+
+    @property
+    def rate_limit_remaining(self) -> dict[str, int]:
+        """Remaining ARM request budget, as last reported by ARM.
+
+        Keys are the suffixes of the x-ms-ratelimit-remaining-* headers,
+        e.g. "subscription-reads" or "tenant-writes".
+        """
+        with self._rate_limit_lock:
+            return dict(self._rate_limit_remaining)
+
+    def remaining_budget(self, method: str = "GET") -> int | None:
+        """Get the lowest remaining budget that applies to an HTTP method.
+
+        Args:
+            method: HTTP method of the request.
+
+        Returns:
+            Lowest remaining request count for the method's category, or None
+            if ARM has not reported a budget yet.
+        """
+        category = {"GET": "reads", "DELETE": "deletes"}.get(method, "writes")
+        budgets = [
+            remaining
+            for name, remaining in self.rate_limit_remaining.items()
+            if name.endswith(category)
+        ]
+        return min(budgets) if budgets else None
+
+    @staticmethod
+    def _index_deployments(
+        deployments: list[dict[str, Any]],
+    ) -> dict[str, list[PublishedDeployment]]:
+        """Build an agent name -> deployments index from a deployment payload.
+
+        Each deployment is parsed once, no matter how many agents it serves,
+        and deployments keep their payload order within each agent's list.
+
+        Args:
+            deployments: Raw deployment payloads of one application.
+
+        Returns:
+            Mapping of agent name to the deployments that contain it.
+        """
+        index: dict[str, list[PublishedDeployment]] = {}
+
+        for deployment in deployments:
+            dep_props = deployment.get("properties", {})
+            agent_names = {
+                dep_agent.get("agentName")
+                for dep_agent in dep_props.get("agents", [])
+                if dep_agent.get("agentName")
+            }
+            if not agent_names:
+                continue
+
+            # Extract protocol names
+            protocols: list[str] = []
+            for proto in dep_props.get("protocols", []):
+                proto_name = proto.get("protocol", "")
+                if proto_name:
+                    protocols.append(proto_name)
+
+            published = PublishedDeployment(
+                deployment_name=deployment.get("name", ""),
+                state=dep_props.get("state", "Unknown"),
+                protocols=protocols,
+            )
+            for agent_name in agent_names:
+                index.setdefault(agent_name, []).append(published)
+
+        return index
+
+    def _build_published_agents(
+        self, app: dict[str, Any], deployments: list[dict[str, Any]]
+    ) -> list[PublishedAgent]:
+        """Build PublishedAgent entries for one application.
+
+        Args:
+            app: Raw application payload.
+            deployments: Raw deployment payloads of the application.
+
+        Returns:
+            One PublishedAgent per agent associated with the application.
+        """
+        app_name = app.get("name", "")
+        props = app.get("properties", {})
+        base_url = props.get("baseUrl", "")
+        is_enabled = props.get("isEnabled", False)
+
+        # Index deployments by agent name in a single pass
+        deployments_by_agent = self._index_deployments(deployments)
+
+        published_agents: list[PublishedAgent] = []
+        for agent_info in props.get("agents", []):
+            agent_name = agent_info.get("agentName", "")
+            if not agent_name:
+                continue
+
+            published_agents.append(
+                PublishedAgent(
+                    agent_name=agent_name,
+                    application_name=app_name,
+                    base_url=base_url,
+                    is_enabled=is_enabled,
+                    deployments=list(deployments_by_agent.get(agent_name, [])),
+                )
+            )
+        return published_agents
+
+    @staticmethod
+    def _apps_with_agents(page: dict[str, Any]) -> list[dict[str, Any]]:
+        """Get the applications of a page that have associated agents."""
+        return [app for app in page.get("value", []) if app.get("properties", {}).get("agents")]
+
+    def _remember_applications(self, apps: list[dict[str, Any]]) -> set[str]:
+        """Record which application serves each agent for targeted lookups.
+
+        Args:
+            apps: Raw application payloads with associated agents.
+
+        Returns:
+            Names of the agents that were recorded.
+        """
+        seen: set[str] = set()
+        with self._agent_applications_lock:
+            for app in apps:
+                for agent_info in app.get("properties", {}).get("agents", []):
+                    agent_name = agent_info.get("agentName", "")
+                    if agent_name:
+                        self._agent_applications[agent_name] = app
+                        seen.add(agent_name)
+        return seen
+
+    def _application_for(self, agent_name: str) -> dict[str, Any] | None:
+        """Get the recorded application payload that serves an agent, if any."""
+        with self._agent_applications_lock:
+            return self._agent_applications.get(agent_name)
+
+    def _known_unpublished(self, agent_name: str) -> bool:
+        """Check if a complete listing showed that no application serves an agent."""
+        with self._agent_applications_lock:
+            return self._agent_index_complete and agent_name not in self._agent_applications
+
+    def _forget_agents_except(self, seen: set[str]) -> None:
+        """Drop index entries for agents missing from a complete listing.
+
+        Marks the index complete, so later lookups of agents it does not
+        contain need no requests.
+        """
+        with self._agent_applications_lock:
+            for agent_name in list(self._agent_applications):
+                if agent_name not in seen:
+                    self._agent_applications.pop(agent_name, None)
+            self._agent_index_complete = True
+
+    def _forget_application(self, application_name: str) -> None:
+        """Drop index entries that point at an application.
+
+        The index is no longer complete, since the application's agents may
+        still be published.
+        """
+        with self._agent_applications_lock:
+            for agent_name, app in list(self._agent_applications.items()):
+                if app.get("name", "") == application_name:
+                    self._agent_applications.pop(agent_name, None)
+            self._agent_index_complete = False
+
+    @staticmethod
+    def _serves_agent(app: dict[str, Any], agent_name: str) -> bool:
+        """Check if an application payload lists an agent."""
+        agents = app.get("properties", {}).get("agents", [])
+        return any(agent.get("agentName") == agent_name for agent in agents)
+
+    def _published_page(
+        self,
+        apps_with_agents: list[dict[str, Any]],
+        deployments_per_app: list[list[dict[str, Any]]],
+    ) -> list[PublishedAgent]:
+        """Build the published agents of one applications page.
+
+        Args:
+            apps_with_agents: Raw application payloads that list agents.
+            deployments_per_app: Deployment payloads per application, in the
+                same order.
+
+        Returns:
+            Published agents of every application, in application order.
+        """
+        published_agents: list[PublishedAgent] = []
+        for app, deployments in zip(apps_with_agents, deployments_per_app, strict=True):
+            published_agents.extend(self._build_published_agents(app, deployments))
+        return published_agents
+
+    def _find_published_agent(
+        self, agent_name: str, app: dict[str, Any], deployments: list[dict[str, Any]]
+    ) -> PublishedAgent | None:
+        """Build the PublishedAgent for one agent of an application, if present."""
+        for agent in self._build_published_agents(app, deployments):
+            if agent.agent_name == agent_name:
+                return agent
+        return None
+
+
+class ArmClientService(_ArmClientBase):
+    """Service for Azure Resource Manager operations.
+
+    Provides methods for managing published agents via the ARM API,
+    which is separate from the Azure AI Projects SDK.
+    """
+
+    _http_client: httpx.Client | None = None
+    _executor: ThreadPoolExecutor | None = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def http_client(self) -> httpx.Client:
+        """Get or create the shared, connection-pooled HTTP client.
+
+        The client is reused by all requests so that TCP and TLS connections
+        to management.azure.com are kept alive between ARM calls.
+
+        Returns:
+            Configured httpx.Client.
+
+        Raises:
+            RuntimeError: If the service has been closed.
+        """
+        with self._http_client_lock:
+            if self._closed:
+                raise RuntimeError("ARM client has been closed")
+            if self._http_client is None:
+                self._http_client = httpx.Client(
+                    timeout=30.0,
+                    verify=get_ssl_verify(),
+                    limits=self._limits,
+                )
+            return self._http_client
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Get or create the thread pool for concurrent per-application requests.
+
+        The pool is shared by all listings and bulk operations, so its threads
+        are started once rather than for every page.
+
+        Returns:
+            Thread pool with max_concurrency workers.
+
+        Raises:
+            RuntimeError: If the service has been closed.
+        """
+        with self._http_client_lock:
+            if self._closed:
+                raise RuntimeError("ARM client has been closed")
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_concurrency, thread_name_prefix="arm"
+                )
+            return self._executor
+
+    def close(self) -> None:
+        """Close the shared HTTP client and release pooled connections.
+
+        Closing is final: requests still in flight fail, and later requests
+        raise instead of silently opening a new client.
+        """
+        with self._http_client_lock:
+            self._closed = True
+            client, self._http_client = self._http_client, None
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        if client is not None:
+            client.close()
+
     def _make_request(
         self,
         method: str,
@@ -160,129 +714,590 @@ class ArmClientService:
             NotAuthenticated: If authentication fails.
             NetworkError: If the request fails.
         """
-        url = f"{self._base_url}{path}?api-version={self.API_VERSION}"
+        return self._request(method, self._url(path), json_body)
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        json_body: dict[str, Any] | None = None,
+        conditional: bool = True,
+    ) -> dict[str, Any]:
+        """Make an authenticated request to an absolute ARM URL.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE).
+            url: Full request URL including the api-version.
+            json_body: Optional JSON body for the request.
+            conditional: Send the validators of a cached GET response.
+
+        Returns:
+            Response JSON as a dictionary.
+
+        Raises:
+            NotAuthenticated: If authentication fails.
+            NetworkError: If the request fails.
+        """
         headers = {
             "Authorization": f"Bearer {self._get_access_token()}",
             "Content-Type": "application/json",
+            **(self._conditional_headers(method, url) if conditional else {}),
         }
 
         try:
-            ssl_verify = get_ssl_verify()
-            with httpx.Client(timeout=30.0, verify=ssl_verify) as client:
-                if method == "GET":
-                    response = client.get(url, headers=headers)
-                elif method == "DELETE":
-                    response = client.delete(url, headers=headers)
-                elif method == "PUT":
-                    response = client.put(url, headers=headers, json=json_body)
-                elif method == "POST":
-                    response = client.post(url, headers=headers, json=json_body)
-                else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
-
-                if response.status_code == 401:
-                    raise NotAuthenticated("ARM API authentication failed")
-                if response.status_code == 204:
-                    return {}  # No content response
-                if response.status_code >= 400:
-                    error_msg = response.text
-                    raise NetworkError(f"ARM API request failed: {error_msg}")
-
-                return response.json() if response.text else {}
+            attempt = 0
+            while True:
+                self._pace(method)
+                response = self._send(method, url, headers, json_body)
+                self._record_rate_limits(response)
+
+                if not self._should_retry(method, response.status_code, attempt):
+                    break
+                time.sleep(self._retry_delay(response, attempt))
+                attempt += 1
+
+            body = self._complete_response(method, url, response)
         except httpx.RequestError as e:
             # Provide helpful SSL error messages
             error_msg = format_ssl_error_message(e)
             raise NetworkError(error_msg) from e
 
-    def list_published_agents(self) -> list[PublishedAgent]:
+        if body is None:
+            if not conditional:
+                raise NetworkError("ARM API returned 304 for an unconditional request")
+            # The cached body was evicted, so fetch the full response instead
+            return self._request(method, url, json_body, conditional=False)
+        return body
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        json_body: dict[str, Any] | None,
+    ) -> httpx.Response:
+        """Send a single HTTP request on the shared client."""
+        client = self.http_client
+        if method == "GET":
+            return client.get(url, headers=headers)
+        if method == "DELETE":
+            return client.delete(url, headers=headers)
+        if method == "PUT":
+            return client.put(url, headers=headers, json=json_body)
+        if method == "POST":
+            return client.post(url, headers=headers, json=json_body)
+        raise ValueError(f"Unsupported HTTP method: {method}")
+
+    def _pace(self, method: str) -> None:
+        """Slow down when the remaining budget for this kind of request runs low."""
+        delay = self._pacing_delay(method)
+        if delay:
+            time.sleep(delay)
+
+    def _iter_items(self, path: str, cancel: CancelToken | None = None) -> Iterator[dict[str, Any]]:
+        """Iterate over the items of a paged ARM list, following nextLink lazily.
+
+        The next page is only requested once the caller has consumed the
+        items of the current one.
+
+        Args:
+            path: API path relative to project.
+            cancel: Token checked before each page is requested.
+
+        Yields:
+            Items from the "value" array of each page.
+
+        Raises:
+            NotAuthenticated: If authentication fails.
+            NetworkError: If a page request fails.
+            OperationCancelled: If cancel is set before the listing completes.
+        """
+        url: str | None = self._url(path)
+        while url:
+            check_cancelled(cancel)
+            page = self._request("GET", url)
+            yield from page.get("value", [])
+            url = page.get("nextLink")
+
+    def iter_applications(self, cancel: CancelToken | None = None) -> Iterator[dict[str, Any]]:
+        """Iterate over all applications in the project, page by page.
+
+        Args:
+            cancel: Token checked before each page is requested.
+
+        Yields:
+            Raw application payloads.
+
+        Raises:
+            NotAuthenticated: If authentication fails.
+            NetworkError: If a page request fails.
+            OperationCancelled: If cancel is set before the listing completes.
+        """
+        return self._iter_items("/applications", cancel)
+
+    def iter_agent_deployments(
+        self, application_name: str, cancel: CancelToken | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over the agent deployments of an application, page by page.
+
+        Args:
+            application_name: Name of the application.
+            cancel: Token checked before each page is requested.
+
+        Yields:
+            Raw agent deployment payloads.
+
+        Raises:
+            NotAuthenticated: If authentication fails.
+            NetworkError: If a page request fails.
+            OperationCancelled: If cancel is set before the listing completes.
+        """
+        return self._iter_items(f"/applications/{application_name}/agentdeployments", cancel)
+
+    def _fetch_agent_deployments(
+        self, app_name: str, cancel: CancelToken | None = None
+    ) -> list[dict[str, Any]]:
+        """Fetch the deployments of a single application.
+
+        Network failures for an individual application are tolerated so that
+        one broken application does not hide the others.
+
+        Args:
+            app_name: Name of the application.
+            cancel: Token checked before each page is requested.
+
+        Returns:
+            Raw deployment payloads, or an empty list if the request failed.
+        """
+        try:
+            return list(self.iter_agent_deployments(app_name, cancel))
+        except NetworkError:
+            return []
+
+    def _fetch_deployments_for_apps(
+        self, app_names: list[str], cancel: CancelToken | None = None
+    ) -> list[list[dict[str, Any]]]:
+        """Fetch deployments for several applications with bounded concurrency.
+
+        Args:
+            app_names: Names of the applications to query.
+            cancel: Token checked before each request; once set, pending
+                applications are skipped.
+
+        Returns:
+            Deployment payloads per application, in the same order as app_names.
+        """
+        if self._max_concurrency <= 1 or len(app_names) <= 1:
+            return [self._fetch_agent_deployments(name, cancel) for name in app_names]
+
+        return list(
+            self.executor.map(lambda name: self._fetch_agent_deployments(name, cancel), app_names)
+        )
+
+    def iter_published_agent_pages(
+        self, cancel: CancelToken | None = None
+    ) -> Iterator[list[PublishedAgent]]:
+        """Iterate over published agents one page of applications at a time.
+
+        Each page is yielded as soon as its deployments have been fetched, so
+        callers can render the first results while later pages are still
+        being requested.
+
+        Args:
+            cancel: Token checked before each page is requested.
+
+        Yields:
+            Lists of PublishedAgent objects, one list per applications page.
+
+        Raises:
+            NotAuthenticated: If authentication fails.
+            NetworkError: If the request fails.
+            OperationCancelled: If cancel is set before the listing completes.
+        """
+        seen: set[str] = set()
+        try:
+            url: str | None = self._url("/applications")
+            while url:
+                check_cancelled(cancel)
+                page = self._request("GET", url)
+                url = page.get("nextLink")
+
+                # Only applications with associated agents need their deployments
+                apps_with_agents = self._apps_with_agents(page)
+                seen |= self._remember_applications(apps_with_agents)
+
+                # Get deployments for each application to get protocols and state
+                deployments_per_app = self._fetch_deployments_for_apps(
+                    [app.get("name", "") for app in apps_with_agents], cancel
+                )
+
+                yield self._published_page(apps_with_agents, deployments_per_app)
+
+            self._forget_agents_except(seen)
+        except (NotAuthenticated, OperationCancelled):
+            raise
+        except Exception as e:
+            raise NetworkError(f"Failed to list published agents: {e}") from e
+
+    def list_published_agents(self, cancel: CancelToken | None = None) -> list[PublishedAgent]:
         """List all published agents in the project.
 
+        Follows ARM pagination, so projects with many applications are
+        returned in full.
+
+        Args:
+            cancel: Token checked before each page is requested.
+
         Returns:
             List of PublishedAgent objects with publishing details.
 
         Raises:
             NotAuthenticated: If authentication fails.
             NetworkError: If the request fails.
+            OperationCancelled: If cancel is set before the listing completes.
         """
-        published_agents: list[PublishedAgent] = []
+        return [agent for page in self.iter_published_agent_pages(cancel) for agent in page]
+
+    def get_published_agent(self, agent_name: str) -> PublishedAgent | None:
+        """Get publishing info for a specific agent.
+
+        When a previous listing has recorded which application serves the
+        agent, only that application's deployments are fetched, and an agent
+        missing from a complete listing is not published, which needs no
+        requests at all. Otherwise the project's applications are scanned and
+        only the deployments of applications serving the agent are fetched.
+
+        Args:
+            agent_name: Name of the agent to look up.
 
+        Returns:
+            PublishedAgent if found, None otherwise.
+        """
+        if self._known_unpublished(agent_name):
+            return None
+
+        app = self._application_for(agent_name)
+        if app is not None:
+            try:
+                deployments = list(self.iter_agent_deployments(app.get("name", "")))
+            except NetworkError:
+                # The application may have been removed; rescan the project
+                self._forget_application(app.get("name", ""))
+            else:
+                found = self._find_published_agent(agent_name, app, deployments)
+                if found is not None:
+                    return found
+
+        for app in self.iter_applications():
+            if not self._serves_agent(app, agent_name):
+                continue
+            self._remember_applications([app])
+            deployments = self._fetch_agent_deployments(app.get("name", ""))
+            found = self._find_published_agent(agent_name, app, deployments)
+            if found is not None:
+                return found
+        return None
+
+    def unpublish_agent(self, application_name: str, deployment_name: str) -> None:
+        """Unpublish an agent by deleting its deployment.
+
+        Args:
+            application_name: Name of the application.
+            deployment_name: Name of the deployment to delete.
+
+        Raises:
+            NotAuthenticated: If authentication fails.
+            NetworkError: If the request fails.
+        """
+        self._make_request(
+            "DELETE",
+            f"/applications/{application_name}/agentdeployments/{deployment_name}",
+        )
+        # The recorded payload no longer matches the application
+        self._forget_application(application_name)
+
+    def _unpublish_one(self, target: tuple[str, str]) -> UnpublishResult:
+        """Unpublish one deployment, capturing the failure instead of raising."""
+        application_name, deployment_name = target
         try:
-            # Get all applications
-            apps_response = self._make_request("GET", "/applications")
-            applications = apps_response.get("value", [])
-
-            for app in applications:
-                app_name = app.get("name", "")
-                props = app.get("properties", {})
-                base_url = props.get("baseUrl", "")
-                is_enabled = props.get("isEnabled", False)
-
-                # Get the agents associated with this application
-                app_agents = props.get("agents", [])
-                if not app_agents:
-                    continue
-
-                # Get deployments for this application to get protocols and state
-                try:
-                    deployments_response = self._make_request(
-                        "GET", f"/applications/{app_name}/agentdeployments"
-                    )
-                    deployments = deployments_response.get("value", [])
-                except NetworkError:
-                    deployments = []
-
-                for agent_info in app_agents:
-                    agent_name = agent_info.get("agentName", "")
-                    if not agent_name:
-                        continue
-
-                    # Find ALL matching deployments for this agent
-                    agent_deployments: list[PublishedDeployment] = []
-
-                    for deployment in deployments:
-                        dep_props = deployment.get("properties", {})
-                        dep_agents = dep_props.get("agents", [])
-
-                        # Check if this deployment contains our agent
-                        for dep_agent in dep_agents:
-                            if dep_agent.get("agentName") == agent_name:
-                                deployment_name = deployment.get("name", "")
-                                state = dep_props.get("state", "Unknown")
-
-                                # Extract protocol names
-                                protocols: list[str] = []
-                                for proto in dep_props.get("protocols", []):
-                                    proto_name = proto.get("protocol", "")
-                                    if proto_name:
-                                        protocols.append(proto_name)
-
-                                agent_deployments.append(
-                                    PublishedDeployment(
-                                        deployment_name=deployment_name,
-                                        state=state,
-                                        protocols=protocols,
-                                    )
-                                )
-                                break
-
-                    published_agents.append(
-                        PublishedAgent(
-                            agent_name=agent_name,
-                            application_name=app_name,
-                            base_url=base_url,
-                            is_enabled=is_enabled,
-                            deployments=agent_deployments,
-                        )
-                    )
+            self.unpublish_agent(application_name, deployment_name)
+        except Exception as e:
+            return UnpublishResult(application_name, deployment_name, error=str(e))
+        return UnpublishResult(application_name, deployment_name)
+
+    def unpublish_agents(self, targets: list[tuple[str, str]]) -> list[UnpublishResult]:
+        """Unpublish several deployments with bounded concurrency.
+
+        A failing deployment does not stop the others; each target gets its
+        own result.
+
+        Args:
+            targets: (application name, deployment name) pairs to delete.
+
+        Returns:
+            One UnpublishResult per target, in the same order as targets.
+        """
+        if self._max_concurrency <= 1 or len(targets) <= 1:
+            return [self._unpublish_one(target) for target in targets]
+
+        return list(self.executor.map(self._unpublish_one, targets))
+
+
+class AsyncArmClientService(_ArmClientBase):
+    """Asyncio variant of ArmClientService built on httpx.AsyncClient.
+
+    Exposes the same operations as coroutines so that many ARM calls can be
+    driven concurrently from an event loop (such as Textual's) without a
+    thread per call.
+
+    Not used by the screens yet, which run ArmClientService in thread
+    workers. Payload handling lives in _ArmClientBase, so both return the
+    same results.
+    """
+
+    _http_client: httpx.AsyncClient | None = None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Get or create the shared, connection-pooled async HTTP client.
+
+        Returns:
+            Configured httpx.AsyncClient.
+
+        Raises:
+            RuntimeError: If the service has been closed.
+        """
+        with self._http_client_lock:
+            if self._closed:
+                raise RuntimeError("ARM client has been closed")
+            if self._http_client is None:
+                self._http_client = httpx.AsyncClient(
+                    timeout=30.0,
+                    verify=get_ssl_verify(),
+                    limits=self._limits,
+                )
+            return self._http_client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and release pooled connections.
+
+        Closing is final: later requests raise instead of opening a new client.
+        """
+        with self._http_client_lock:
+            self._closed = True
+            client, self._http_client = self._http_client, None
+        if client is not None:
+            await client.aclose()
+
+    async def _make_request(
+        self,
+        method: str,
+        path: str,
+        json_body: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Make an authenticated request to ARM API.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE).
+            path: API path relative to project.
+            json_body: Optional JSON body for the request.
+
+        Returns:
+            Response JSON as a dictionary.
+
+        Raises:
+            NotAuthenticated: If authentication fails.
+            NetworkError: If the request fails.
+        """
+        return await self._request(method, self._url(path), json_body)
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        json_body: dict[str, Any] | None = None,
+        conditional: bool = True,
+    ) -> dict[str, Any]:
+        """Make an authenticated request to an absolute ARM URL.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE).
+            url: Full request URL including the api-version.
+            json_body: Optional JSON body for the request.
+            conditional: Send the validators of a cached GET response.
+
+        Returns:
+            Response JSON as a dictionary.
+
+        Raises:
+            NotAuthenticated: If authentication fails.
+            NetworkError: If the request fails.
+        """
+        # Credentials are blocking; keep token acquisition off the event loop
+        token = await asyncio.to_thread(self._get_access_token)
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json",
+            **(self._conditional_headers(method, url) if conditional else {}),
+        }
 
+        try:
+            attempt = 0
+            while True:
+                delay = self._pacing_delay(method)
+                if delay:
+                    await asyncio.sleep(delay)
+                response = await self.http_client.request(
+                    method, url, headers=headers, json=json_body
+                )
+                self._record_rate_limits(response)
+
+                if not self._should_retry(method, response.status_code, attempt):
+                    break
+                await asyncio.sleep(self._retry_delay(response, attempt))
+                attempt += 1
+
+            body = self._complete_response(method, url, response)
+        except httpx.RequestError as e:
+            # Provide helpful SSL error messages
+            error_msg = format_ssl_error_message(e)
+            raise NetworkError(error_msg) from e
+
+        if body is None:
+            if not conditional:
+                raise NetworkError("ARM API returned 304 for an unconditional request")
+            # The cached body was evicted, so fetch the full response instead
+            return await self._request(method, url, json_body, conditional=False)
+        return body
+
+    async def _iter_items(
+        self, path: str, cancel: CancelToken | None = None
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over the items of a paged ARM list, following nextLink lazily.
+
+        Args:
+            path: API path relative to project.
+            cancel: Token checked before each page is requested.
+
+        Yields:
+            Items from the "value" array of each page.
+
+        Raises:
+            OperationCancelled: If cancel is set before the listing completes.
+        """
+        url: str | None = self._url(path)
+        while url:
+            check_cancelled(cancel)
+            page = await self._request("GET", url)
+            for item in page.get("value", []):
+                yield item
+            url = page.get("nextLink")
+
+    def iter_applications(self, cancel: CancelToken | None = None) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over all applications in the project, page by page.
+
+        Args:
+            cancel: Token checked before each page is requested.
+
+        Yields:
+            Raw application payloads.
+
+        Raises:
+            OperationCancelled: If cancel is set before the listing completes.
+        """
+        return self._iter_items("/applications", cancel)
+
+    def iter_agent_deployments(
+        self, application_name: str, cancel: CancelToken | None = None
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over the agent deployments of an application, page by page.
+
+        Args:
+            application_name: Name of the application.
+            cancel: Token checked before each page is requested.
+
+        Yields:
+            Raw agent deployment payloads.
+
+        Raises:
+            OperationCancelled: If cancel is set before the listing completes.
+        """
+        return self._iter_items(f"/applications/{application_name}/agentdeployments", cancel)
+
+    async def _fetch_agent_deployments(self, app_name: str) -> list[dict[str, Any]]:
+        """Fetch the deployments of a single application, tolerating failures."""
+        try:
+            return [item async for item in self.iter_agent_deployments(app_name)]
+        except NetworkError:
+            return []
+
+    async def _fetch_deployments_for_apps(self, app_names: list[str]) -> list[list[dict[str, Any]]]:
+        """Fetch deployments for several applications with bounded concurrency.
+
+        Args:
+            app_names: Names of the applications to query.
+
+        Returns:
+            Deployment payloads per application, in the same order as app_names.
+        """
+        semaphore = asyncio.Semaphore(max(1, self._max_concurrency))
+
+        async def fetch(app_name: str) -> list[dict[str, Any]]:
+            async with semaphore:
+                return await self._fetch_agent_deployments(app_name)
+
+        return list(await asyncio.gather(*(fetch(name) for name in app_names)))
+
+    async def iter_published_agent_pages(self) -> AsyncIterator[list[PublishedAgent]]:
+        """Iterate over published agents one page of applications at a time.
+
+        Yields:
+            Lists of PublishedAgent objects, one list per applications page.
+
+        Raises:
+            NotAuthenticated: If authentication fails.
+            NetworkError: If the request fails.
+        """
+        seen: set[str] = set()
+        try:
+            url: str | None = self._url("/applications")
+            while url:
+                page = await self._request("GET", url)
+                url = page.get("nextLink")
+
+                apps_with_agents = self._apps_with_agents(page)
+                seen |= self._remember_applications(apps_with_agents)
+                deployments_per_app = await self._fetch_deployments_for_apps(
+                    [app.get("name", "") for app in apps_with_agents]
+                )
+
+                yield self._published_page(apps_with_agents, deployments_per_app)
+
+            self._forget_agents_except(seen)
         except NotAuthenticated:
             raise
         except Exception as e:
             raise NetworkError(f"Failed to list published agents: {e}") from e
 
-        return published_agents
+    async def list_published_agents(self) -> list[PublishedAgent]:
+        """List all published agents in the project.
 
-    def get_published_agent(self, agent_name: str) -> PublishedAgent | None:
+        Returns:
+            List of PublishedAgent objects with publishing details.
+
+        Raises:
+            NotAuthenticated: If authentication fails.
+            NetworkError: If the request fails.
+        """
+        return [agent async for page in self.iter_published_agent_pages() for agent in page]
+
+    async def get_published_agent(self, agent_name: str) -> PublishedAgent | None:
         """Get publishing info for a specific agent.
 
         Args:
@@ -291,13 +1306,33 @@ class ArmClientService:
         Returns:
             PublishedAgent if found, None otherwise.
         """
-        published = self.list_published_agents()
-        for agent in published:
-            if agent.agent_name == agent_name:
-                return agent
+        if self._known_unpublished(agent_name):
+            return None
+
+        app = self._application_for(agent_name)
+        if app is not None:
+            try:
+                deployments = [
+                    item async for item in self.iter_agent_deployments(app.get("name", ""))
+                ]
+            except NetworkError:
+                self._forget_application(app.get("name", ""))
+            else:
+                found = self._find_published_agent(agent_name, app, deployments)
+                if found is not None:
+                    return found
+
+        async for app in self.iter_applications():
+            if not self._serves_agent(app, agent_name):
+                continue
+            self._remember_applications([app])
+            deployments = await self._fetch_agent_deployments(app.get("name", ""))
+            found = self._find_published_agent(agent_name, app, deployments)
+            if found is not None:
+                return found
         return None
 
-    def unpublish_agent(self, application_name: str, deployment_name: str) -> None:
+    async def unpublish_agent(self, application_name: str, deployment_name: str) -> None:
         """Unpublish an agent by deleting its deployment.
 
         Args:
@@ -308,7 +1343,30 @@ class ArmClientService:
             NotAuthenticated: If authentication fails.
             NetworkError: If the request fails.
         """
-        self._make_request(
+        await self._make_request(
             "DELETE",
             f"/applications/{application_name}/agentdeployments/{deployment_name}",
         )
+        # The recorded payload no longer matches the application
+        self._forget_application(application_name)
+
+    async def unpublish_agents(self, targets: list[tuple[str, str]]) -> list[UnpublishResult]:
+        """Unpublish several deployments with bounded concurrency.
+
+        Args:
+            targets: (application name, deployment name) pairs to delete.
+
+        Returns:
+            One UnpublishResult per target, in the same order as targets.
+        """
+        semaphore = asyncio.Semaphore(max(1, self._max_concurrency))
+
+        async def unpublish(application_name: str, deployment_name: str) -> UnpublishResult:
+            async with semaphore:
+                try:
+                    await self.unpublish_agent(application_name, deployment_name)
+                except Exception as e:
+                    return UnpublishResult(application_name, deployment_name, error=str(e))
+            return UnpublishResult(application_name, deployment_name)
+
+        return list(await asyncio.gather(*(unpublish(*target) for target in targets)))
@@ -10,6 +10,7 @@ from azure.identity import AzureCliCredential, InteractiveBrowserCredential
 
 from anvil.services.exceptions import NotAuthenticated
 from anvil.services.ssl_config import format_ssl_error_message
+from anvil.services.token_broker import TokenBroker
 
 if TYPE_CHECKING:
     pass
@@ -38,7 +39,7 @@ class AuthService:
 
     def __init__(self) -> None:
         """Initialize the auth service."""
-        self._credential: TokenCredential | None = None
+        self._credential: TokenBroker | None = None
 
     def check_auth_status(self) -> AuthResult:
         """Check if user is already authenticated via CLI.
@@ -49,8 +50,8 @@ class AuthService:
             AuthResult with current authentication status.
         """
         try:
-            cli_credential = AzureCliCredential()
-            # Try to get a token to verify authentication
+            cli_credential = TokenBroker(AzureCliCredential())
+            # Try to get a token to verify authentication (and prime the cache)
             cli_credential.get_token(self.MANAGEMENT_SCOPE)
             self._credential = cli_credential
             return AuthResult(status=AuthStatus.AUTHENTICATED)
@@ -76,8 +77,8 @@ class AuthService:
             AuthResult with login status.
         """
         try:
-            browser_credential = InteractiveBrowserCredential()
-            # Try to get a token to trigger browser login
+            browser_credential = TokenBroker(InteractiveBrowserCredential())
+            # Try to get a token to trigger browser login (and prime the cache)
             browser_credential.get_token(self.MANAGEMENT_SCOPE)
             self._credential = browser_credential
             return AuthResult(status=AuthStatus.AUTHENTICATED)
@@ -97,6 +98,9 @@ class AuthService:
     def get_credential(self) -> TokenCredential:
         """Return the authenticated credential for SDK clients.
 
+        The credential caches tokens per scope, so it should be shared by all
+        services instead of wrapping the underlying credential again.
+
         Returns:
             TokenCredential for use with Azure SDKs.
 
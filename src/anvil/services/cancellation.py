@@ -0,0 +1,29 @@
+"""Cooperative cancellation for long-running listings."""
+
+from typing import Protocol
+
+from anvil.services.exceptions import OperationCancelled
+
+
+class CancelToken(Protocol):
+    """Signals that an operation should stop; threading.Event satisfies it."""
+
+    def is_set(self) -> bool:
+        """Check if cancellation has been requested."""
+        ...
+
+
+def check_cancelled(cancel: CancelToken | None) -> None:
+    """Stop the current operation if cancellation has been requested.
+
+    Listings call this at page boundaries, so a cancelled listing never
+    requests another page.
+
+    Args:
+        cancel: Token to check, or None if the operation cannot be cancelled.
+
+    Raises:
+        OperationCancelled: If the token is set.
+    """
+    if cancel is not None and cancel.is_set():
+        raise OperationCancelled("Operation cancelled")
@@ -0,0 +1,85 @@
+"""Process-wide registry of shared project clients."""
+
+import threading
+from collections import OrderedDict
+
+from azure.core.credentials import TokenCredential
+
+from anvil.services.project_client import ProjectClientService
+
+_RegistryKey = tuple[str, int]
+
+
+class ClientRegistry:
+    """Hands out one ProjectClientService per (endpoint, credential) pair.
+
+    Screens that open the same project share a client, and with it the SDK
+    transport, its connection pool, the agent store and the deployment catalog.
+    Recently used clients stay open, so switching back to a project reuses warm
+    connections; the least recently used client is closed once more than
+    max_clients are open.
+    """
+
+    # Project clients kept open at the same time
+    MAX_CLIENTS = 8
+
+    def __init__(self, max_clients: int = MAX_CLIENTS) -> None:
+        """Initialize the client registry.
+
+        Args:
+            max_clients: Number of project clients kept open.
+        """
+        self._max_clients = max_clients
+        # Entries hold the credential so its id() cannot be reused while cached
+        self._clients: OrderedDict[_RegistryKey, tuple[TokenCredential, ProjectClientService]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def project_client(self, endpoint: str, credential: TokenCredential) -> ProjectClientService:
+        """Get the shared project client for an endpoint and credential.
+
+        Args:
+            endpoint: The project endpoint URL.
+            credential: Azure credential for authentication.
+
+        Returns:
+            An existing client for this endpoint and credential, or a new one.
+        """
+        key = (endpoint.rstrip("/"), id(credential))
+        evicted: list[ProjectClientService] = []
+        with self._lock:
+            entry = self._clients.get(key)
+            if entry is not None:
+                self._clients.move_to_end(key)
+                return entry[1]
+
+            client = ProjectClientService(endpoint=endpoint, credential=credential)
+            self._clients[key] = (credential, client)
+            while len(self._clients) > self._max_clients:
+                _, (_, oldest) = self._clients.popitem(last=False)
+                evicted.append(oldest)
+
+        for oldest in evicted:
+            oldest.close()
+        return client
+
+    def close(self) -> None:
+        """Close all registered clients."""
+        with self._lock:
+            clients = [client for _, client in self._clients.values()]
+            self._clients.clear()
+        for client in clients:
+            client.close()
+
+
+_registry = ClientRegistry()
+
+
+def get_client_registry() -> ClientRegistry:
+    """Get the process-wide client registry.
+
+    Returns:
+        The shared ClientRegistry.
+    """
+    return _registry
@@ -0,0 +1,161 @@
+"""Cached catalog of a project's model deployments."""
+
+import threading
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from anvil.services.cancellation import CancelToken
+
+if TYPE_CHECKING:
+    from anvil.services.project_client import Deployment
+
+
+class DeploymentCatalog:
+    """Caches a project's deployments with a TTL and a capability index.
+
+    Fresh entries are served from memory. Once the TTL has passed, the stale
+    entries are still returned immediately while a background thread fetches
+    new ones (stale-while-revalidate), so screens never wait on the network
+    except for the very first load.
+    """
+
+    # Seconds after which cached deployments are revalidated
+    DEFAULT_TTL = 300.0
+
+    def __init__(
+        self,
+        fetch: Callable[[CancelToken | None], list["Deployment"]],
+        ttl: float = DEFAULT_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the deployment catalog.
+
+        Args:
+            fetch: Callable that lists the project's deployments, given an
+                optional cancellation token.
+            ttl: Seconds a fetched listing is considered fresh.
+            clock: Monotonic clock, overridable for tests.
+        """
+        self._fetch = fetch
+        self._ttl = ttl
+        self._clock = clock
+        self._deployments: list[Deployment] = []
+        self._by_capability: dict[str, list[Deployment]] = {}
+        self._fetched_at: float | None = None
+        self._refreshing = False
+        self._lock = threading.Lock()
+        self._fetch_lock = threading.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        """Check if the catalog has been fetched at least once."""
+        return self._fetched_at is not None
+
+    @property
+    def is_stale(self) -> bool:
+        """Check if the cached deployments are older than the TTL."""
+        fetched_at = self._fetched_at
+        return fetched_at is None or self._clock() - fetched_at >= self._ttl
+
+    def deployments(self, cancel: CancelToken | None = None) -> list["Deployment"]:
+        """Get all deployments, fetching only if nothing is cached yet.
+
+        Args:
+            cancel: Token that stops the first fetch at a page boundary.
+
+        Returns:
+            Deployments sorted by name.
+
+        Raises:
+            OperationCancelled: If cancel is set while fetching.
+        """
+        deployments, _ = self._snapshot(cancel)
+        return list(deployments)
+
+    def with_capability(self, capability: str) -> list["Deployment"]:
+        """Get the deployments that support a capability.
+
+        Args:
+            capability: Capability display name, e.g. "Chat Completion".
+
+        Returns:
+            Matching deployments sorted by name.
+        """
+        _, by_capability = self._snapshot()
+        return list(by_capability.get(capability, []))
+
+    def refresh(self, cancel: CancelToken | None = None) -> list["Deployment"]:
+        """Fetch deployments now and replace the cached entries.
+
+        Args:
+            cancel: Token that stops the fetch at a page boundary. A cancelled
+                fetch leaves the cached entries untouched.
+
+        Returns:
+            The freshly fetched deployments.
+
+        Raises:
+            OperationCancelled: If cancel is set while fetching.
+        """
+        with self._fetch_lock:
+            deployments = self._fetch(cancel)
+            self._store(deployments)
+        return list(deployments)
+
+    def invalidate(self) -> None:
+        """Drop cached deployments so the next read fetches them again."""
+        with self._lock:
+            self._deployments = []
+            self._by_capability = {}
+            self._fetched_at = None
+
+    def _snapshot(
+        self, cancel: CancelToken | None = None
+    ) -> tuple[list["Deployment"], dict[str, list["Deployment"]]]:
+        """Get the cached entries, loading on first use.
+
+        Stale entries are returned as they are and revalidated in the background.
+        """
+        if not self.is_loaded:
+            with self._fetch_lock:
+                # Another thread may have loaded the catalog while we waited
+                if not self.is_loaded:
+                    self._store(self._fetch(cancel))
+
+        with self._lock:
+            snapshot = (self._deployments, self._by_capability)
+        if self.is_stale:
+            self._revalidate_in_background()
+        return snapshot
+
+    def _store(self, deployments: list["Deployment"]) -> None:
+        """Replace the cached deployments and rebuild the capability index."""
+        by_capability: dict[str, list[Deployment]] = {}
+        for deployment in deployments:
+            for capability in deployment.capabilities:
+                by_capability.setdefault(capability, []).append(deployment)
+
+        with self._lock:
+            self._deployments = list(deployments)
+            self._by_capability = by_capability
+            self._fetched_at = self._clock()
+
+    def _revalidate_in_background(self) -> None:
+        """Start a background refresh, unless one is already running."""
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def revalidate() -> None:
+            try:
+                self.refresh()
+            except Exception:
+                # Keep serving the stale entries; the next read retries
+                pass
+            finally:
+                with self._lock:
+                    self._refreshing = False
+
+        threading.Thread(target=revalidate, name="deployment-refresh", daemon=True).start()
@@ -0,0 +1,226 @@
+"""Discovery of Foundry accounts and projects across subscriptions."""
+
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any
+
+from anvil.services.cancellation import CancelToken, check_cancelled
+from anvil.services.exceptions import NetworkError, NotAuthenticated
+from anvil.services.foundry import FoundryAccount, FoundryProject, FoundryService
+from anvil.services.resource_graph import ResourceGraphService
+from anvil.services.subscriptions import Subscription
+
+
+@dataclass
+class DiscoveredProject:
+    """A Foundry project, or account, found by discovery."""
+
+    subscription: Subscription
+    account: FoundryAccount
+    project: FoundryProject | None = None  # None when projects are not listed
+
+    @property
+    def label(self) -> str:
+        """Human-readable name including the account and subscription."""
+        location = f"{self.account.name} · {self.subscription.display_name}"
+        if self.project is None:
+            return location
+        return f"{self.project.display_name or self.project.name}  ({location})"
+
+
+@dataclass
+class DiscoveryFailure:
+    """A subscription or account that could not be searched."""
+
+    subscription: Subscription
+    error: Exception
+    account: FoundryAccount | None = None
+
+
+class FoundryDiscovery:
+    """Finds Foundry accounts and projects in many subscriptions at once.
+
+    Accounts are listed for all subscriptions concurrently, and the projects
+    of each account are listed as soon as its subscription has been searched,
+    with at most max_concurrency requests in flight. Results are yielded as
+    they arrive, so a picker can show the first projects while the remaining
+    subscriptions are still being searched. A subscription that cannot be
+    searched is recorded in failures instead of stopping the discovery.
+
+    With a ResourceGraphService, accounts and projects are instead found with
+    one server-side filtered query for all subscriptions, falling back to the
+    per-subscription listings if the query fails before returning anything.
+    """
+
+    # Maximum number of listing requests in flight
+    DEFAULT_MAX_CONCURRENCY = 8
+
+    # Seconds between cancellation checks while waiting for results
+    POLL_INTERVAL = 0.1
+
+    def __init__(
+        self,
+        service_factory: Callable[[str], FoundryService],
+        include_projects: bool = True,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        resource_graph: ResourceGraphService | None = None,
+    ) -> None:
+        """Initialize the discovery.
+
+        Args:
+            service_factory: Returns the FoundryService for a subscription ID.
+                Only called from the thread iterating the results.
+            include_projects: Whether to list the projects of each account, or
+                only the accounts.
+            max_concurrency: Maximum number of listing requests in flight.
+            resource_graph: Optional Resource Graph backend to query instead
+                of listing each subscription.
+        """
+        self._service_factory = service_factory
+        self._include_projects = include_projects
+        self._max_concurrency = max(1, max_concurrency)
+        self._resource_graph = resource_graph
+        self.failures: list[DiscoveryFailure] = []
+
+    def iter_pages(
+        self,
+        subscriptions: list[Subscription],
+        cancel: CancelToken | None = None,
+    ) -> Iterator[list[DiscoveredProject]]:
+        """Search subscriptions, yielding results as they arrive.
+
+        Args:
+            subscriptions: Subscriptions to search.
+            cancel: Token checked while waiting; once set, pending requests
+                are dropped.
+
+        Yields:
+            The projects of one account, or the accounts of one subscription
+            if projects are not included. Empty results are skipped.
+
+        Raises:
+            NotAuthenticated: If the credential is rejected.
+            OperationCancelled: If cancel is set before discovery completes.
+        """
+        self.failures = []
+        if self._resource_graph is not None:
+            yielded = False
+            try:
+                for page in self._iter_graph_pages(self._resource_graph, subscriptions, cancel):
+                    yielded = True
+                    yield page
+                return
+            except NetworkError:
+                if yielded:
+                    raise
+                # Resource Graph may be unavailable or forbidden; list instead
+
+        yield from self._iter_listing_pages(subscriptions, cancel)
+
+    def _iter_listing_pages(
+        self,
+        subscriptions: list[Subscription],
+        cancel: CancelToken | None = None,
+    ) -> Iterator[list[DiscoveredProject]]:
+        """Search subscriptions with concurrent per-subscription listings."""
+        pending: dict[Future[Any], tuple[Subscription, FoundryAccount | None]] = {}
+        executor = ThreadPoolExecutor(
+            max_workers=self._max_concurrency, thread_name_prefix="discovery"
+        )
+        try:
+            for subscription in subscriptions:
+                service = self._service_factory(subscription.subscription_id)
+                pending[executor.submit(service.list_accounts)] = (subscription, None)
+
+            while pending:
+                check_cancelled(cancel)
+                done, _ = wait(pending, timeout=self.POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                for future in done:
+                    subscription, account = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except NotAuthenticated:
+                        raise
+                    except Exception as e:
+                        self.failures.append(DiscoveryFailure(subscription, e, account))
+                        continue
+
+                    if account is not None:
+                        page = [DiscoveredProject(subscription, account, p) for p in result]
+                    elif self._include_projects:
+                        service = self._service_factory(subscription.subscription_id)
+                        for found in result:
+                            future = executor.submit(
+                                service.list_projects,
+                                resource_group=found.resource_group,
+                                account_name=found.name,
+                            )
+                            pending[future] = (subscription, found)
+                        continue
+                    else:
+                        page = [DiscoveredProject(subscription, found) for found in result]
+
+                    if page:
+                        yield page
+        finally:
+            # Drop queued requests; running ones finish in the background
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _iter_graph_pages(
+        self,
+        resource_graph: ResourceGraphService,
+        subscriptions: list[Subscription],
+        cancel: CancelToken | None = None,
+    ) -> Iterator[list[DiscoveredProject]]:
+        """Search subscriptions with Resource Graph queries."""
+        by_id = {sub.subscription_id.lower(): sub for sub in subscriptions}
+        subscription_ids = [sub.subscription_id for sub in subscriptions]
+
+        accounts: dict[str, tuple[Subscription, FoundryAccount]] = {}
+        for account_page in resource_graph.iter_account_pages(subscription_ids, cancel):
+            page: list[DiscoveredProject] = []
+            for subscription_id, account in account_page:
+                subscription = by_id.get(subscription_id.lower())
+                if subscription is None:
+                    continue
+                accounts[account.id.lower()] = (subscription, account)
+                page.append(DiscoveredProject(subscription, account))
+            if page and not self._include_projects:
+                yield page
+
+        if not self._include_projects or not accounts:
+            return
+
+        for project_page in resource_graph.iter_project_pages(subscription_ids, cancel):
+            page = []
+            for account_id, project in project_page:
+                # Projects of accounts that are not AIServices are skipped
+                parent = accounts.get(account_id.lower())
+                if parent is not None:
+                    page.append(DiscoveredProject(parent[0], parent[1], project))
+            if page:
+                yield page
+
+    def discover(
+        self,
+        subscriptions: list[Subscription],
+        cancel: CancelToken | None = None,
+    ) -> list[DiscoveredProject]:
+        """Search subscriptions and collect all results.
+
+        Args:
+            subscriptions: Subscriptions to search.
+            cancel: Token checked while waiting.
+
+        Returns:
+            Everything found, sorted by label.
+
+        Raises:
+            NotAuthenticated: If the credential is rejected.
+            OperationCancelled: If cancel is set before discovery completes.
+        """
+        found: list[DiscoveredProject] = []
+        for page in self.iter_pages(subscriptions, cancel):
+            found.extend(page)
+        return sorted(found, key=lambda item: item.label.lower())
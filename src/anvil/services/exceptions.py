@@ -29,3 +29,9 @@ class ResourceNotFound(AnvilError):
     """Azure resource not found."""
 
     pass
+
+
+class OperationCancelled(AnvilError):
+    """Operation was cancelled before it completed."""
+
+    pass
@@ -1,13 +1,16 @@
 """Microsoft Foundry service for Anvil."""
 
 import re
+import threading
 from dataclasses import dataclass
+from typing import Self
 
 from azure.ai.projects import AIProjectClient
 from azure.core.credentials import TokenCredential
 from azure.core.exceptions import ClientAuthenticationError, HttpResponseError
 from azure.mgmt.cognitiveservices import CognitiveServicesManagementClient
 
+from anvil.services.client_registry import get_client_registry
 from anvil.services.exceptions import NetworkError, NotAuthenticated, ResourceNotFound
 
 
@@ -33,7 +36,12 @@ class FoundryProject:
 
 
 class FoundryService:
-    """Lists Foundry accounts and projects."""
+    """Lists Foundry accounts and projects.
+
+    A single management client is created on first use and shared by all
+    calls, so its pipeline and connections are reused. Call close() when the
+    service is no longer needed.
+    """
 
     def __init__(self, credential: TokenCredential, subscription_id: str) -> None:
         """Initialize the foundry service.
@@ -44,6 +52,57 @@ class FoundryService:
         """
         self._credential = credential
         self._subscription_id = subscription_id
+        self._client: CognitiveServicesManagementClient | None = None
+        # Prefetches create the client from worker threads; once closed it is not reopened
+        self._client_lock = threading.Lock()
+        self._closed = False
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def credential(self) -> TokenCredential:
+        """Return the credential used for requests."""
+        return self._credential
+
+    @property
+    def subscription_id(self) -> str:
+        """Return the subscription the service lists resources from."""
+        return self._subscription_id
+
+    @property
+    def client(self) -> CognitiveServicesManagementClient:
+        """Get or create the shared management client.
+
+        Returns:
+            Configured CognitiveServicesManagementClient.
+
+        Raises:
+            RuntimeError: If the service has been closed.
+        """
+        with self._client_lock:
+            if self._closed:
+                raise RuntimeError("Foundry service has been closed")
+            if self._client is None:
+                self._client = CognitiveServicesManagementClient(
+                    credential=self._credential,
+                    subscription_id=self._subscription_id,
+                )
+            return self._client
+
+    def close(self) -> None:
+        """Close the management client and release pooled connections.
+
+        Closing is final: later calls raise instead of opening a new client.
+        """
+        with self._client_lock:
+            self._closed = True
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
 
     def _extract_resource_group(self, resource_id: str) -> str:
         """Extract resource group name from Azure resource ID.
@@ -68,10 +127,7 @@ class FoundryService:
             NetworkError: If network request fails.
         """
         try:
-            client = CognitiveServicesManagementClient(
-                credential=self._credential,
-                subscription_id=self._subscription_id,
-            )
+            client = self.client
 
             accounts: list[FoundryAccount] = []
 
@@ -114,10 +170,7 @@ class FoundryService:
             ResourceNotFound: If account not found.
         """
         try:
-            client = CognitiveServicesManagementClient(
-                credential=self._credential,
-                subscription_id=self._subscription_id,
-            )
+            client = self.client
 
             projects: list[FoundryProject] = []
 
@@ -158,7 +211,10 @@ class FoundryService:
             raise NetworkError(f"Failed to list projects: {e}") from e
 
     def create_project_client(self, project_endpoint: str) -> AIProjectClient:
-        """Create AIProjectClient for data plane operations.
+        """Get the AIProjectClient for data plane operations.
+
+        The client comes from the shared client registry, so repeated calls for
+        the same project reuse one transport and connection pool.
 
         Args:
             project_endpoint: The project endpoint URL.
@@ -166,7 +222,5 @@ class FoundryService:
         Returns:
             Configured AIProjectClient.
         """
-        return AIProjectClient(
-            endpoint=project_endpoint,
-            credential=self._credential,
-        )
+        registry = get_client_registry()
+        return registry.project_client(project_endpoint, self._credential).client
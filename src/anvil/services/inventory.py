@@ -0,0 +1,172 @@
+"""On-disk cache of discovered Azure resources."""
+
+import json
+import threading
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from anvil.config.models import Inventory, InventoryEntry
+from anvil.services.foundry import FoundryAccount, FoundryProject
+from anvil.services.subscriptions import Subscription
+
+
+@dataclass
+class CachedListing[T]:
+    """Resources read from the inventory, with the time they were fetched."""
+
+    items: list[T]
+    fetched_at: datetime
+
+    @property
+    def age_seconds(self) -> float:
+        """Seconds since the listing was fetched."""
+        return (datetime.now(UTC) - self.fetched_at).total_seconds()
+
+
+class InventoryCache:
+    """Persists subscriptions, accounts and projects in inventory.json.
+
+    Lets the selection screens render the last known resources immediately
+    and revalidate them in the background. Each listing is stored with the
+    time it was fetched. The file lives next to config.json; a missing or
+    unreadable file is treated as an empty inventory.
+    """
+
+    def __init__(self, config_dir: Path | None = None) -> None:
+        """Initialize the inventory cache.
+
+        Args:
+            config_dir: Override config directory (for testing).
+        """
+        self._config_dir = config_dir or (Path.home() / ".config" / "anvil")
+        self._inventory_file = self._config_dir / "inventory.json"
+        # Workers of different screens may write concurrently
+        self._lock = threading.Lock()
+
+    @property
+    def inventory_file(self) -> Path:
+        """Return the inventory file path."""
+        return self._inventory_file
+
+    def load(self) -> Inventory:
+        """Load the inventory from disk.
+
+        Returns:
+            Inventory with cached listings, or an empty one.
+        """
+        if not self._inventory_file.exists():
+            return Inventory()
+
+        try:
+            data = json.loads(self._inventory_file.read_text())
+            return Inventory.model_validate(data)
+        except (OSError, json.JSONDecodeError, ValueError):
+            # Invalid inventory file, start over
+            return Inventory()
+
+    def get_subscriptions(self) -> CachedListing[Subscription] | None:
+        """Get the cached subscriptions.
+
+        Returns:
+            Cached subscriptions, or None if they were never fetched.
+        """
+        entry = self.load().subscriptions
+        return self._listing(entry, Subscription)
+
+    def put_subscriptions(self, subscriptions: list[Subscription]) -> None:
+        """Store freshly fetched subscriptions.
+
+        Args:
+            subscriptions: Subscriptions to cache.
+        """
+        with self._lock:
+            inventory = self.load()
+            inventory.subscriptions = self._entry(subscriptions)
+            self._save(inventory)
+
+    def get_accounts(self, subscription_id: str) -> CachedListing[FoundryAccount] | None:
+        """Get the cached Foundry accounts of a subscription.
+
+        Args:
+            subscription_id: Azure subscription ID.
+
+        Returns:
+            Cached accounts, or None if they were never fetched.
+        """
+        entry = self.load().accounts.get(subscription_id)
+        return self._listing(entry, FoundryAccount)
+
+    def put_accounts(self, subscription_id: str, accounts: list[FoundryAccount]) -> None:
+        """Store freshly fetched Foundry accounts of a subscription.
+
+        Args:
+            subscription_id: Azure subscription ID.
+            accounts: Accounts to cache.
+        """
+        with self._lock:
+            inventory = self.load()
+            inventory.accounts[subscription_id] = self._entry(accounts)
+            self._save(inventory)
+
+    def get_projects(self, account_id: str) -> CachedListing[FoundryProject] | None:
+        """Get the cached projects of a Foundry account.
+
+        Args:
+            account_id: Full Azure resource ID of the account.
+
+        Returns:
+            Cached projects, or None if they were never fetched.
+        """
+        entry = self.load().projects.get(account_id)
+        return self._listing(entry, FoundryProject)
+
+    def put_projects(self, account_id: str, projects: list[FoundryProject]) -> None:
+        """Store freshly fetched projects of a Foundry account.
+
+        Args:
+            account_id: Full Azure resource ID of the account.
+            projects: Projects to cache.
+        """
+        with self._lock:
+            inventory = self.load()
+            inventory.projects[account_id] = self._entry(projects)
+            self._save(inventory)
+
+    def clear(self) -> None:
+        """Delete the cached inventory."""
+        with self._lock:
+            self._inventory_file.unlink(missing_ok=True)
+
+    @staticmethod
+    def _entry(items: list[Any]) -> InventoryEntry:
+        """Build an inventory entry for dataclass items fetched now."""
+        return InventoryEntry(items=[asdict(item) for item in items], fetched_at=datetime.now(UTC))
+
+    @staticmethod
+    def _listing[T](entry: InventoryEntry | None, item_type: type[T]) -> CachedListing[T] | None:
+        """Rebuild dataclass items from an inventory entry."""
+        if entry is None:
+            return None
+        try:
+            items = [item_type(**item) for item in entry.items]
+        except TypeError:
+            # Written by a version with different fields; refetch
+            return None
+        fetched_at = entry.fetched_at
+        if fetched_at.tzinfo is None:
+            fetched_at = fetched_at.replace(tzinfo=UTC)
+        return CachedListing(items=items, fetched_at=fetched_at)
+
+    def _save(self, inventory: Inventory) -> None:
+        """Write the inventory atomically, so readers never see a partial file."""
+        data = inventory.model_dump(mode="json")
+        tmp_file = self._inventory_file.with_suffix(".json.tmp")
+        try:
+            self._config_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file.write_text(json.dumps(data, indent=2, default=str))
+            tmp_file.replace(self._inventory_file)
+        except OSError:
+            # The cache is best-effort; a failed write only costs a refetch
+            pass
@@ -0,0 +1,129 @@
+"""Speculative prefetching along the selection path."""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+
+class PrefetchCache:
+    """Small LRU of listings fetched in the background before they are needed.
+
+    The selection screens start fetching the children of a subscription or
+    account the user lingers on, so the next screen can usually show them
+    without waiting. Entries are futures: a screen that takes an entry still
+    being fetched waits for it instead of sending the same request again.
+    Failed and expired entries are never handed out.
+    """
+
+    # Maximum number of prefetched listings kept
+    DEFAULT_MAX_ENTRIES = 8
+
+    # Seconds after which a prefetched listing is no longer used
+    DEFAULT_MAX_AGE = 60.0
+
+    # Prefetches run in the background, so a few at a time are enough
+    DEFAULT_MAX_WORKERS = 2
+
+    # Seconds an option stays highlighted before its children are prefetched
+    DEFAULT_DWELL = 0.3
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_age: float = DEFAULT_MAX_AGE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the prefetch cache.
+
+        Args:
+            max_entries: Maximum number of prefetched listings kept.
+            max_age: Seconds a prefetched listing stays usable.
+            max_workers: Maximum number of prefetches running at once.
+            clock: Monotonic clock, overridable for tests.
+        """
+        self._max_entries = max(1, max_entries)
+        self._max_age = max_age
+        self._max_workers = max(1, max_workers)
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, Future[Any]]] = OrderedDict()
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def prefetch(self, key: Hashable, fetch: Callable[[], Any]) -> Future[Any]:
+        """Start fetching a listing unless a usable fetch is already cached.
+
+        Args:
+            key: Identifies the listing, e.g. ("projects", account_id).
+            fetch: Fetches the listing; runs in a background thread.
+
+        Returns:
+            The future of the new or already cached fetch.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._usable(entry):
+                self._entries.move_to_end(key)
+                return entry[1]
+
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="prefetch"
+                )
+            future = self._executor.submit(fetch)
+            self._entries[key] = (self._clock(), future)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                evicted.cancel()
+            return future
+
+    def take(self, key: Hashable) -> Future[Any] | None:
+        """Remove and return a cached fetch.
+
+        Args:
+            key: Identifies the listing.
+
+        Returns:
+            The fetch's future, which may still be running, or None if the
+            listing was not prefetched, has expired or failed.
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        if entry is None or not self._usable(entry):
+            return None
+        return entry[1]
+
+    def clear(self) -> None:
+        """Drop all cached fetches, cancelling those not yet started."""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for _, future in entries:
+            future.cancel()
+
+    def close(self, wait: bool = False) -> None:
+        """Drop all cached fetches and stop the background threads.
+
+        A later prefetch starts new threads, so the cache stays usable.
+
+        Args:
+            wait: Wait for fetches already running, including ones that were
+                taken, to finish. Not needed before closing clients that fail
+                once closed; avoid it on the event loop.
+        """
+        self.clear()
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _usable(self, entry: tuple[float, Future[Any]]) -> bool:
+        """Check if a cached fetch is recent and has not failed."""
+        started_at, future = entry
+        if self._clock() - started_at >= self._max_age or future.cancelled():
+            return False
+        return not (future.done() and future.exception() is not None)
@@ -1,10 +1,14 @@
 """Project client service for Azure AI Projects SDK operations."""
 
+import threading
+from collections.abc import AsyncIterator, Callable, Iterator
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
+from itertools import islice
+from typing import Any, Self
 
 from azure.ai.projects import AIProjectClient
+from azure.ai.projects.aio import AIProjectClient as AsyncAIProjectClient
 from azure.ai.projects.models import (
     CodeInterpreterTool,
     FileSearchTool,
@@ -14,8 +18,54 @@ from azure.ai.projects.models import (
 from azure.core.credentials import TokenCredential
 from azure.core.exceptions import ClientAuthenticationError, HttpResponseError
 
-from anvil.services.exceptions import NetworkError, NotAuthenticated
+from anvil.services.cancellation import CancelToken, check_cancelled
+from anvil.services.deployment_catalog import DeploymentCatalog
+from anvil.services.exceptions import NetworkError, NotAuthenticated, OperationCancelled
 from anvil.services.ssl_config import format_ssl_error_message
+from anvil.services.token_broker import AsyncCredentialAdapter
+
+# Reads a field from a payload node: (node, name, default) -> value
+_Accessor = Callable[[Any, str, Any], Any]
+
+
+def _get_item(node: Any, name: str, default: Any = None) -> Any:
+    """Read a field from a mapping-shaped payload node."""
+    return node.get(name, default)
+
+
+def _get_attr(node: Any, name: str, default: Any = None) -> Any:
+    """Read a field from an attribute-shaped payload node."""
+    return getattr(node, name, default)
+
+
+class _PayloadShape:
+    """Field accessors for the nodes of an agent payload.
+
+    The SDK returns either mappings or attribute objects. Each nesting level
+    (versions, latest version, definition, tool) is probed once, on the first
+    node seen, and the chosen accessor is reused for every later node of that
+    level, so parsing a listing does not re-check the shape per field.
+    """
+
+    __slots__ = ("_accessors",)
+
+    def __init__(self) -> None:
+        self._accessors: dict[str, _Accessor] = {}
+
+    def accessor(self, level: str, node: Any) -> _Accessor:
+        """Get the accessor for a nesting level, detecting it from node if needed."""
+        accessor = self._accessors.get(level)
+        if accessor is None:
+            accessor = _get_item if hasattr(node, "get") else _get_attr
+            self._accessors[level] = accessor
+        return accessor
+
+    def latest_of(self, agent_data: Any) -> Any:
+        """Get the versions.latest node of an agent, if any."""
+        versions = getattr(agent_data, "versions", None)
+        if not versions:
+            return None
+        return self.accessor("versions", versions)(versions, "latest", None)
 
 
 @dataclass
@@ -40,7 +90,11 @@ class ToolConfig:
 
 @dataclass
 class Agent:
-    """Agent information."""
+    """Agent information.
+
+    Agents parsed from a listing are summaries: instructions, tool_configs
+    and full_metadata are decoded from the raw payload on first access.
+    """
 
     id: str
     name: str
@@ -68,6 +122,69 @@ class Agent:
     published_protocols: list[str] | None = None
 
 
+# Marker passed to Agent for fields that are decoded on first access
+_DEFERRED: Any = object()
+
+# Serializes decoding, so agents shared between threads are decoded once
+_DECODE_LOCK = threading.Lock()
+
+
+class _DeferredField:
+    """Data descriptor for an Agent field that may be decoded lazily.
+
+    Values are stored in the instance __dict__. Assigning _DEFERRED leaves the
+    field unset; reading an unset field runs the instance's detail decoder,
+    which assigns every deferred field at once. The decoder is only dropped
+    once it has run, so a concurrent reader never sees a half-decoded agent.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        values = instance.__dict__
+        if self._name not in values:
+            with _DECODE_LOCK:
+                # Another thread may have decoded the agent while we waited
+                decode = values.get("_decode_details")
+                if self._name not in values and decode is not None:
+                    decode(instance)
+                    del values["_decode_details"]
+        return values[self._name]
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        if value is not _DEFERRED:
+            instance.__dict__[self._name] = value
+
+
+for _field_name in ("instructions", "tool_configs", "full_metadata"):
+    setattr(Agent, _field_name, _DeferredField(_field_name))
+del _field_name
+
+
+def _decode_tool_configs(tools_raw: list[Any], shape: _PayloadShape) -> list[ToolConfig]:
+    """Build ToolConfig entries for the typed tools of a definition."""
+    tool_configs: list[ToolConfig] = []
+    for tool in tools_raw:
+        get = shape.accessor("tool", tool)
+        tool_type = get(tool, "type", "")
+        if not tool_type:
+            continue
+        tool_configs.append(
+            ToolConfig(
+                type=str(tool_type),
+                display_name=str(tool_type).replace("_", " ").title(),
+                server_label=get(tool, "server_label", None),
+                server_url=get(tool, "server_url", None),
+                require_approval=get(tool, "require_approval", None),
+                project_connection_id=get(tool, "project_connection_id", None),
+            )
+        )
+    return tool_configs
+
+
 @dataclass
 class Deployment:
     """Model deployment information."""
@@ -81,13 +198,39 @@ class Deployment:
     capabilities: list[str]  # e.g., ["chat_completion", "embeddings"]
 
 
-class ProjectClientService:
-    """Service for Azure AI Projects SDK data plane operations.
+@dataclass
+class AgentDelta:
+    """Changes between two agent listings, as agent IDs."""
 
-    Provides methods for listing and managing agents and deployments
-    within a Foundry project.
+    added: list[str]
+    removed: list[str]
+    changed: list[str]
+
+    @property
+    def is_empty(self) -> bool:
+        """Check if nothing changed."""
+        return not (self.added or self.removed or self.changed)
+
+
+class _ProjectClientBase:
+    """Agent store and payload parsing shared by the project clients.
+
+    Subclasses provide the transport: ProjectClientService is blocking and
+    AsyncProjectClientService is built on the SDK's asyncio client.
     """
 
+    # Agents per page when streaming a listing without service pages
+    AGENT_PAGE_SIZE = 100
+
+    # Deployments per cancellation check when the listing has no service pages
+    DEPLOYMENT_PAGE_SIZE = 100
+
+    # Capability of deployments that agents can use
+    CHAT_COMPLETION = "Chat Completion"
+
+    # Error message fragments that identify SSL failures
+    SSL_ERROR_KEYWORDS = ("ssl", "certificate", "verify", "handshake")
+
     def __init__(self, endpoint: str, credential: TokenCredential) -> None:
         """Initialize the project client service.
 
@@ -97,21 +240,21 @@ class ProjectClientService:
         """
         self._endpoint = endpoint
         self._credential = credential
-        self._client: AIProjectClient | None = None
+        # Agent store: agents from the last listing plus later writes, keyed by ID
+        self._agent_cache: dict[str, Agent] = {}
 
     @property
-    def client(self) -> AIProjectClient:
-        """Get or create the AIProjectClient instance.
+    def cached_agents(self) -> list[Agent]:
+        """Agents known from the last listing, including agents saved since.
 
         Returns:
-            Configured AIProjectClient.
+            Cached agents without contacting the service.
         """
-        if self._client is None:
-            self._client = AIProjectClient(
-                endpoint=self._endpoint,
-                credential=self._credential,
-            )
-        return self._client
+        return list(self._agent_cache.values())
+
+    def _remember_agent(self, agent: Agent) -> None:
+        """Splice a single agent into the agent cache."""
+        self._agent_cache[agent.id] = agent
 
     def _parse_created_at(self, value: datetime | int | None) -> datetime | None:
         """Parse created_at timestamp from various formats."""
@@ -176,179 +319,394 @@ class ProjectClientService:
             return metadata.get(key, default)
         return default
 
-    def list_agents(self) -> list[Agent]:
-        """List all agents in the project.
+    def _parse_agent(self, agent_data: Any, shape: _PayloadShape | None = None) -> Agent:
+        """Build an Agent from an SDK agent object.
+
+        Args:
+            agent_data: Agent returned by the SDK (list, get, create or update).
+            shape: Accessors detected for the response; pass the same instance
+                for every agent of a listing so the shape is probed only once.
 
         Returns:
-            List of agents.
+            Parsed Agent.
+        """
+        if shape is None:
+            shape = _PayloadShape()
+
+        # The API returns data nested under versions.latest.definition
+        latest_version = shape.latest_of(agent_data)
+
+        version = "-"
+        created_at_raw = None
+        description = None
+        metadata: Any = {}
+        definition: Any = None
+        if latest_version:
+            get = shape.accessor("latest", latest_version)
+            version = str(get(latest_version, "version", "-"))
+            created_at_raw = get(latest_version, "created_at", None)
+            description = get(latest_version, "description", None) or None
+            metadata = get(latest_version, "metadata", {}) or {}
+            definition = get(latest_version, "definition", None)
+
+        # Extract from definition
+        agent_type = "Assistant"
+        model = None
+        tools_raw: list[Any] = []
+        temperature: float | None = None
+        top_p: float | None = None
+
+        if definition:
+            get = shape.accessor("definition", definition)
+            agent_type = str(get(definition, "kind", "Assistant")).title()
+            model = get(definition, "model", None)
+            tools_raw = get(definition, "tools", []) or []
+            temperature = get(definition, "temperature", None)
+            top_p = get(definition, "top_p", None)
+
+        # Extract tool names and knowledge in a single pass; full tool
+        # configs are only decoded when the agent's details are read
+        tools: list[str] = []
+        knowledge: list[str] = []
+        requires_approval = False
+
+        for tool in tools_raw:
+            get = shape.accessor("tool", tool)
+            tool_type = get(tool, "type", "")
+            server_label = get(tool, "server_label", None)
+
+            # Knowledge bases are MCP servers labelled with "kb"
+            if server_label and "kb" in server_label.lower():
+                knowledge.append(server_label)
+
+            if not tool_type:
+                continue
+
+            # Format tool type nicely for display
+            tools.append(str(tool_type).replace("_", " ").title())
+
+            # Check if any tool requires approval
+            if get(tool, "require_approval", None) == "always":
+                requires_approval = True
+
+        # Extract metadata for memory/guardrails
+        guardrails: list[str] = []
+        memory_enabled = False
+        if isinstance(metadata, dict):
+            memory_enabled = bool(metadata.get("memory_enabled", False))
+            if metadata.get("content_filter"):
+                guardrails.append("Content Filter")
+            if metadata.get("grounding"):
+                guardrails.append("Grounding")
+
+        agent = Agent(
+            id=getattr(agent_data, "id", "") or "",
+            name=getattr(agent_data, "name", "") or "",
+            version=version,
+            agent_type=agent_type,
+            created_at=self._parse_created_at(created_at_raw),
+            description=description,
+            model=model,
+            instructions=_DEFERRED,
+            tools=tools,
+            knowledge=knowledge,
+            memory_enabled=memory_enabled,
+            guardrails=guardrails,
+            temperature=temperature,
+            top_p=top_p,
+            requires_approval=requires_approval,
+            tool_configs=_DEFERRED,
+            full_metadata=_DEFERRED,
+        )
+
+        def decode_details(target: Agent) -> None:
+            target.instructions = (
+                shape.accessor("definition", definition)(definition, "instructions", None)
+                if definition
+                else None
+            )
+            target.tool_configs = _decode_tool_configs(tools_raw, shape) or None
+            # Convert metadata to string dict for full_metadata
+            target.full_metadata = (
+                {str(k): str(v) for k, v in metadata.items()}
+                if metadata and isinstance(metadata, dict)
+                else None
+            )
+
+        agent.__dict__["_decode_details"] = decode_details
+        return agent
+
+    def _latest_version_of(self, agent_data: Any, shape: _PayloadShape | None = None) -> str | None:
+        """Read versions.latest.version without parsing the whole agent."""
+        if shape is None:
+            shape = _PayloadShape()
+        latest = shape.latest_of(agent_data)
+        if not latest:
+            return None
+        version = shape.accessor("latest", latest)(latest, "version", None)
+        return str(version) if version is not None else None
+
+    def _track_agent(
+        self,
+        agent_data: Any,
+        shape: _PayloadShape,
+        previous: dict[str, Agent],
+        delta: AgentDelta,
+    ) -> Agent:
+        """Reuse the stored agent if its latest version is unchanged, else parse it.
+
+        Records the agent in delta as added or changed when it was parsed.
+        """
+        agent_id = getattr(agent_data, "id", "") or ""
+        cached = previous.get(agent_id)
+        latest = self._latest_version_of(agent_data, shape)
+        if cached is not None and latest is not None and cached.version == latest:
+            return cached
+
+        agent = self._parse_agent(agent_data, shape)
+        if cached is None:
+            delta.added.append(agent.id)
+        else:
+            delta.changed.append(agent.id)
+        return agent
+
+    def _parse_agent_page(
+        self,
+        raw_page: list[Any],
+        shape: _PayloadShape,
+        previous: dict[str, Agent],
+        current: dict[str, Agent],
+        delta: AgentDelta,
+    ) -> list[Agent]:
+        """Parse one page of an agent listing, recording its agents in current."""
+        page: list[Agent] = []
+        for agent_data in raw_page:
+            agent = self._track_agent(agent_data, shape, previous, delta)
+            current[agent.id] = agent
+            page.append(agent)
+        return page
+
+    def _finish_agent_listing(
+        self, previous: dict[str, Agent], current: dict[str, Agent], delta: AgentDelta
+    ) -> None:
+        """Record removed agents and replace the store once a listing completes."""
+        delta.removed.extend(agent_id for agent_id in previous if agent_id not in current)
+        self._agent_cache = current
+
+    @classmethod
+    def _is_ssl_error(cls, error: Exception) -> bool:
+        """Check if an error looks like an SSL or certificate failure."""
+        error_str = str(error).lower()
+        return any(keyword in error_str for keyword in cls.SSL_ERROR_KEYWORDS)
+
+    @staticmethod
+    def _sort_deployments(deployments: list[Deployment]) -> list[Deployment]:
+        """Sort deployments by name, in place."""
+        deployments.sort(key=lambda d: d.name.lower())
+        return deployments
+
+    def _parse_deployment(self, dep: Any) -> Deployment:
+        """Build a Deployment from an SDK deployment object."""
+        # Extract sku information
+        sku = getattr(dep, "sku", None)
+        sku_name = ""
+        capacity = 0
+        if sku:
+            if hasattr(sku, "get"):
+                sku_name = sku.get("name", "")
+                capacity = sku.get("capacity", 0)
+            else:
+                sku_name = getattr(sku, "name", "")
+                capacity = getattr(sku, "capacity", 0)
+
+        # Format sku name nicely (e.g., "GlobalStandard" -> "Global Standard")
+        deployment_type = ""
+        if sku_name:
+            # Insert space before capital letters
+            deployment_type = "".join(
+                " " + c if c.isupper() and i > 0 else c for i, c in enumerate(sku_name)
+            ).strip()
+
+        # Extract capabilities
+        capabilities_dict = getattr(dep, "capabilities", {}) or {}
+        capabilities = [
+            k.replace("_", " ").title()
+            for k, v in capabilities_dict.items()
+            if v == "true" or v is True
+        ]
+
+        return Deployment(
+            name=getattr(dep, "name", "") or "",
+            model_name=getattr(dep, "model_name", "") or "",
+            model_version=getattr(dep, "model_version", "") or "",
+            model_publisher=getattr(dep, "model_publisher", "") or "",
+            deployment_type=deployment_type,
+            capacity=capacity,
+            capabilities=capabilities,
+        )
+
+    def _build_tools_from_configs(
+        self, tool_configs: list[ToolConfig]
+    ) -> list[CodeInterpreterTool | FileSearchTool | MCPTool]:
+        """Build SDK tool objects from ToolConfig list."""
+        tools: list[CodeInterpreterTool | FileSearchTool | MCPTool] = []
+        for config in tool_configs:
+            if config.type == "code_interpreter":
+                # CodeInterpreterTool requires container parameter
+                tools.append(CodeInterpreterTool(container="auto"))
+            elif config.type == "file_search":
+                # FileSearchTool requires vector_store_ids
+                vs_ids = config.vector_store_ids or []
+                if vs_ids:
+                    tools.append(FileSearchTool(vector_store_ids=vs_ids))
+            elif config.type == "mcp":
+                # MCPTool requires keyword arguments
+                # require_approval must be "always" or "never"
+                require_approval_raw = config.require_approval or "always"
+                require_approval_val: str = "never" if require_approval_raw == "never" else "always"
+                mcp_tool = MCPTool(  # type: ignore[call-overload]
+                    server_label=config.server_label or "",
+                    server_url=config.server_url or "",
+                    require_approval=require_approval_val,
+                    project_connection_id=config.project_connection_id,
+                )
+                tools.append(mcp_tool)
+        return tools
+
+
+class ProjectClientService(_ProjectClientBase):
+    """Service for Azure AI Projects SDK data plane operations.
+
+    Provides methods for listing and managing agents and deployments
+    within a Foundry project.
+    """
+
+    def __init__(self, endpoint: str, credential: TokenCredential) -> None:
+        """Initialize the project client service.
+
+        Args:
+            endpoint: The project endpoint URL.
+            credential: Azure credential for authentication.
+        """
+        super().__init__(endpoint, credential)
+        self._client: AIProjectClient | None = None
+        # Warm-up loaders reach the client from several threads at once;
+        # once closed it is not reopened
+        self._client_lock = threading.Lock()
+        self._closed = False
+        self._deployment_catalog = DeploymentCatalog(self._fetch_deployments)
+
+    @property
+    def client(self) -> AIProjectClient:
+        """Get or create the AIProjectClient instance.
+
+        Returns:
+            Configured AIProjectClient.
+
+        Raises:
+            RuntimeError: If the service has been closed.
+        """
+        with self._client_lock:
+            if self._closed:
+                raise RuntimeError("Project client has been closed")
+            if self._client is None:
+                self._client = AIProjectClient(
+                    endpoint=self._endpoint,
+                    credential=self._credential,
+                )
+            return self._client
+
+    def close(self) -> None:
+        """Close the SDK client and release pooled connections.
+
+        Closing is final: a loader or worker still running fails its next
+        request instead of silently opening a new client.
+        """
+        with self._client_lock:
+            self._closed = True
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    @property
+    def deployment_catalog(self) -> DeploymentCatalog:
+        """Cached deployments of the project, shared by all screens using this service."""
+        return self._deployment_catalog
+
+    def _agent_from_response(self, agent_data: Any, agent_name: str) -> Agent:
+        """Build an Agent from a create/update response.
+
+        Falls back to a single-agent GET if the response does not include the
+        latest version.
+
+        Args:
+            agent_data: Object returned by the SDK write call.
+            agent_name: Name of the agent that was written.
+
+        Returns:
+            The written Agent.
+        """
+        versions = getattr(agent_data, "versions", None) if agent_data is not None else None
+        if not versions:
+            agent_data = self.client.agents.get(agent_name=agent_name)
+
+        agent = self._parse_agent(agent_data)
+        self._remember_agent(agent)
+        return agent
+
+    def iter_agent_pages(
+        self, page_size: int | None = None, cancel: CancelToken | None = None
+    ) -> Iterator[list[Agent]]:
+        """Iterate over the project's agents one page at a time.
+
+        Pages are yielded as soon as they are fetched and parsed, so callers
+        can render the first agents while later pages are still loading. The
+        agent store is updated once the last page has been read.
+
+        Args:
+            page_size: Agents per page when the SDK does not expose service
+                pages. Defaults to AGENT_PAGE_SIZE.
+            cancel: Token checked before each page is requested.
+
+        Yields:
+            Lists of agents, in listing order.
 
         Raises:
             NotAuthenticated: If credential is invalid.
             NetworkError: If network request fails.
+            OperationCancelled: If cancel is set before the listing completes.
         """
-        try:
-            agents: list[Agent] = []
+        yield from self._iter_agent_pages(AgentDelta([], [], []), page_size, cancel)
 
+    def _iter_agent_pages(
+        self,
+        delta: AgentDelta,
+        page_size: int | None = None,
+        cancel: CancelToken | None = None,
+    ) -> Iterator[list[Agent]]:
+        """Iterate over agent pages, recording changes against the store in delta.
+
+        Agents whose versions.latest.version matches the stored copy keep
+        their existing Agent object instead of being parsed again.
+        """
+        try:
             # The agents property provides access to agent operations
             agent_list = self.client.agents.list()
 
-            for agent_data in agent_list:
-                # The API returns data nested under versions.latest.definition
-                # Get the versions object
-                versions = getattr(agent_data, "versions", None)
-                latest_version: Any = None
-                definition: Any = None
-
-                if versions:
-                    # versions can be dict-like or have 'latest' attribute
-                    if hasattr(versions, "get"):
-                        latest_version = versions.get("latest")
-                    elif hasattr(versions, "latest"):
-                        latest_version = versions.latest
-
-                if latest_version:
-                    if hasattr(latest_version, "get"):
-                        definition = latest_version.get("definition", {})
-                    elif hasattr(latest_version, "definition"):
-                        definition = latest_version.definition
-
-                # Extract version info using safe dict/attr access
-                version = "-"
-                created_at_raw = None
-                description = None
-                if latest_version:
-                    if hasattr(latest_version, "get"):
-                        version = str(latest_version.get("version", "-"))
-                        created_at_raw = latest_version.get("created_at")
-                        description = latest_version.get("description") or None
-                    else:
-                        version = str(getattr(latest_version, "version", "-"))
-                        created_at_raw = getattr(latest_version, "created_at", None)
-                        description = getattr(latest_version, "description", None)
-
-                # Extract from definition
-                agent_type = "Assistant"
-                model = None
-                instructions = None
-                tools_raw: list[Any] = []
-                temperature: float | None = None
-                top_p: float | None = None
-
-                if definition:
-                    if hasattr(definition, "get"):
-                        agent_type = str(definition.get("kind", "Assistant")).title()
-                        model = definition.get("model")
-                        instructions = definition.get("instructions")
-                        tools_raw = definition.get("tools", []) or []
-                        temperature = definition.get("temperature")
-                        top_p = definition.get("top_p")
-                    else:
-                        agent_type = str(getattr(definition, "kind", "Assistant")).title()
-                        model = getattr(definition, "model", None)
-                        instructions = getattr(definition, "instructions", None)
-                        tools_raw = getattr(definition, "tools", []) or []
-                        temperature = getattr(definition, "temperature", None)
-                        top_p = getattr(definition, "top_p", None)
-
-                # Extract tools from definition - both simple list and full configs
-                tools: list[str] = []
-                tool_configs: list[ToolConfig] = []
-                requires_approval = False
-
-                if tools_raw:
-                    for tool in tools_raw:
-                        # Get tool type
-                        if hasattr(tool, "get"):
-                            tool_type = tool.get("type", "")
-                            server_label = tool.get("server_label")
-                            server_url = tool.get("server_url")
-                            require_approval = tool.get("require_approval")
-                            project_connection_id = tool.get("project_connection_id")
-                        else:
-                            tool_type = getattr(tool, "type", "")
-                            server_label = getattr(tool, "server_label", None)
-                            server_url = getattr(tool, "server_url", None)
-                            require_approval = getattr(tool, "require_approval", None)
-                            project_connection_id = getattr(tool, "project_connection_id", None)
-
-                        if tool_type:
-                            # Format tool type nicely for display
-                            display_name = str(tool_type).replace("_", " ").title()
-                            tools.append(display_name)
-
-                            # Build full ToolConfig
-                            tool_config = ToolConfig(
-                                type=str(tool_type),
-                                display_name=display_name,
-                                server_label=server_label,
-                                server_url=server_url,
-                                require_approval=require_approval,
-                                project_connection_id=project_connection_id,
-                            )
-                            tool_configs.append(tool_config)
-
-                            # Check if any tool requires approval
-                            if require_approval == "always":
-                                requires_approval = True
-
-                # Extract knowledge (tool resources with file_search or similar)
-                knowledge: list[str] = []
-                for tool in tools_raw or []:
-                    if hasattr(tool, "get"):
-                        server_label = tool.get("server_label", "")
-                        if server_label and "kb" in server_label.lower():
-                            knowledge.append(server_label)
-                    else:
-                        server_label = getattr(tool, "server_label", "")
-                        if server_label and "kb" in server_label.lower():
-                            knowledge.append(server_label)
-
-                # Extract metadata for memory/guardrails
-                metadata: dict[str, Any] = {}
-                if latest_version:
-                    if hasattr(latest_version, "get"):
-                        metadata = latest_version.get("metadata", {}) or {}
-                    else:
-                        metadata = getattr(latest_version, "metadata", {}) or {}
-                memory_enabled = bool(
-                    metadata.get("memory_enabled", False) if isinstance(metadata, dict) else False
-                )
+            # SDK responses are homogeneous, so probe the payload shape once
+            shape = _PayloadShape()
+            previous = self._agent_cache
+            current: dict[str, Agent] = {}
 
-                guardrails: list[str] = []
-                if isinstance(metadata, dict):
-                    if metadata.get("content_filter"):
-                        guardrails.append("Content Filter")
-                    if metadata.get("grounding"):
-                        guardrails.append("Grounding")
-
-                # Convert metadata to string dict for full_metadata
-                full_metadata: dict[str, str] | None = None
-                if metadata and isinstance(metadata, dict):
-                    full_metadata = {str(k): str(v) for k, v in metadata.items()}
-
-                agents.append(
-                    Agent(
-                        id=getattr(agent_data, "id", "") or "",
-                        name=getattr(agent_data, "name", "") or "",
-                        version=version,
-                        agent_type=agent_type,
-                        created_at=self._parse_created_at(created_at_raw),
-                        description=description if description else None,
-                        model=model,
-                        instructions=instructions,
-                        tools=tools,
-                        knowledge=knowledge,
-                        memory_enabled=memory_enabled,
-                        guardrails=guardrails,
-                        temperature=temperature,
-                        top_p=top_p,
-                        requires_approval=requires_approval,
-                        tool_configs=tool_configs if tool_configs else None,
-                        full_metadata=full_metadata,
-                    )
-                )
+            check_cancelled(cancel)
+            for raw_page in self._raw_pages(agent_list, page_size or self.AGENT_PAGE_SIZE):
+                yield self._parse_agent_page(raw_page, shape, previous, current, delta)
+                # Stop before the next page is requested
+                check_cancelled(cancel)
 
-            return agents
+            self._finish_agent_listing(previous, current, delta)
+        except OperationCancelled:
+            raise
         except ClientAuthenticationError as e:
             raise NotAuthenticated(str(e)) from e
         except HttpResponseError as e:
@@ -358,77 +716,110 @@ class ProjectClientService:
             error_msg = format_ssl_error_message(e)
             raise NetworkError(error_msg) from e
 
-    def list_deployments(self) -> list[Deployment]:
+    @staticmethod
+    def _raw_pages(agent_list: Any, page_size: int) -> Iterator[list[Any]]:
+        """Split an SDK listing into pages, using service pages when available."""
+        by_page = getattr(agent_list, "by_page", None)
+        if callable(by_page):
+            for raw_page in by_page():
+                yield list(raw_page)
+            return
+
+        iterator = iter(agent_list)
+        while page := list(islice(iterator, page_size)):
+            yield page
+
+    def refresh_agents(self, cancel: CancelToken | None = None) -> AgentDelta:
+        """Re-list agents, re-parsing only those whose latest version changed.
+
+        Agents whose versions.latest.version matches the cached copy keep
+        their existing Agent object. A cancelled refresh leaves the store as
+        it was.
+
+        Args:
+            cancel: Token checked before each page is requested.
+
+        Returns:
+            IDs of agents added, removed and changed since the previous refresh.
+
+        Raises:
+            NotAuthenticated: If credential is invalid.
+            NetworkError: If network request fails.
+            OperationCancelled: If cancel is set before the listing completes.
+        """
+        delta = AgentDelta(added=[], removed=[], changed=[])
+        for _ in self._iter_agent_pages(delta, cancel=cancel):
+            pass
+        return delta
+
+    def list_agents(self, cancel: CancelToken | None = None) -> list[Agent]:
+        """List all agents in the project.
+
+        Unchanged agents are served from the agent store; see refresh_agents.
+
+        Args:
+            cancel: Token checked before each page is requested.
+
+        Returns:
+            List of agents.
+
+        Raises:
+            NotAuthenticated: If credential is invalid.
+            NetworkError: If network request fails.
+            OperationCancelled: If cancel is set before the listing completes.
+        """
+        self.refresh_agents(cancel)
+        return self.cached_agents
+
+    def list_deployments(self, cancel: CancelToken | None = None) -> list[Deployment]:
         """List model deployments in the project.
 
+        Args:
+            cancel: Token checked before each page is requested.
+
         Returns:
-            List of deployments sorted by name.
+            List of deployments sorted by name, or an empty list if the
+            deployments API is not available.
 
         Raises:
             NotAuthenticated: If credential is invalid.
             NetworkError: If network request fails.
+            OperationCancelled: If cancel is set before the listing completes.
         """
-        try:
-            deployments: list[Deployment] = []
+        return self._list_deployments(cancel, strict=False)
 
-            # Get deployments from the deployments API
-            deployment_list = self.client.deployments.list()
+    def _fetch_deployments(self, cancel: CancelToken | None = None) -> list[Deployment]:
+        """List model deployments for the deployment catalog.
 
-            for dep in deployment_list:
-                # Extract sku information
-                sku = getattr(dep, "sku", None)
-                sku_name = ""
-                capacity = 0
-                if sku:
-                    if hasattr(sku, "get"):
-                        sku_name = sku.get("name", "")
-                        capacity = sku.get("capacity", 0)
-                    else:
-                        sku_name = getattr(sku, "name", "")
-                        capacity = getattr(sku, "capacity", 0)
-
-                # Format sku name nicely (e.g., "GlobalStandard" -> "Global Standard")
-                deployment_type = ""
-                if sku_name:
-                    # Insert space before capital letters
-                    deployment_type = "".join(
-                        " " + c if c.isupper() and i > 0 else c for i, c in enumerate(sku_name)
-                    ).strip()
-
-                # Extract capabilities
-                capabilities_dict = getattr(dep, "capabilities", {}) or {}
-                capabilities = [
-                    k.replace("_", " ").title()
-                    for k, v in capabilities_dict.items()
-                    if v == "true" or v is True
-                ]
-
-                deployments.append(
-                    Deployment(
-                        name=getattr(dep, "name", "") or "",
-                        model_name=getattr(dep, "model_name", "") or "",
-                        model_version=getattr(dep, "model_version", "") or "",
-                        model_publisher=getattr(dep, "model_publisher", "") or "",
-                        deployment_type=deployment_type,
-                        capacity=capacity,
-                        capabilities=capabilities,
-                    )
-                )
+        Unlike list_deployments, an unavailable deployments API raises, so the
+        catalog keeps its previous entries instead of caching an empty list.
+        """
+        return self._list_deployments(cancel, strict=True)
 
-            # Sort by name
-            deployments.sort(key=lambda d: d.name.lower())
-            return deployments
+    def _list_deployments(self, cancel: CancelToken | None, strict: bool) -> list[Deployment]:
+        """List model deployments, raising on any failure if strict."""
+        try:
+            # Get deployments from the deployments API
+            deployment_list = self.client.deployments.list()
+            deployments: list[Deployment] = []
+            check_cancelled(cancel)
+            for raw_page in self._raw_pages(deployment_list, self.DEPLOYMENT_PAGE_SIZE):
+                deployments.extend(self._parse_deployment(dep) for dep in raw_page)
+                check_cancelled(cancel)
+
+            return self._sort_deployments(deployments)
+        except OperationCancelled:
+            raise
         except ClientAuthenticationError as e:
             raise NotAuthenticated(str(e)) from e
         except HttpResponseError as e:
             raise NetworkError(f"Failed to list deployments: {e}") from e
         except Exception as e:
-            # Check if it's an SSL error - provide helpful guidance
-            error_str = str(e).lower()
-            ssl_keywords = ["ssl", "certificate", "verify", "handshake"]
-            if any(keyword in error_str for keyword in ssl_keywords):
-                error_msg = format_ssl_error_message(e)
-                raise NetworkError(error_msg) from e
+            # SSL errors get helpful guidance
+            if self._is_ssl_error(e):
+                raise NetworkError(format_ssl_error_message(e)) from e
+            if strict:
+                raise NetworkError(f"Failed to list deployments: {e}") from e
             # Return empty list if deployments API is not available
             return []
 
@@ -444,6 +835,7 @@ class ProjectClientService:
         """
         try:
             self.client.agents.delete(agent_id)
+            self._agent_cache.pop(agent_id, None)
         except ClientAuthenticationError as e:
             raise NotAuthenticated(str(e)) from e
         except HttpResponseError as e:
@@ -456,41 +848,13 @@ class ProjectClientService:
     def get_chat_completion_models(self) -> list[Deployment]:
         """Get deployments suitable for agents (chat completion capable).
 
-        Filters out embedding models and other non-chat models.
+        Filters out embedding models and other non-chat models. Served from the
+        deployment catalog, so only the first call lists deployments.
 
         Returns:
             List of deployments that support chat completion.
         """
-        all_deployments = self.list_deployments()
-        return [d for d in all_deployments if "Chat Completion" in d.capabilities]
-
-    def _build_tools_from_configs(
-        self, tool_configs: list[ToolConfig]
-    ) -> list[CodeInterpreterTool | FileSearchTool | MCPTool]:
-        """Build SDK tool objects from ToolConfig list."""
-        tools: list[CodeInterpreterTool | FileSearchTool | MCPTool] = []
-        for config in tool_configs:
-            if config.type == "code_interpreter":
-                # CodeInterpreterTool requires container parameter
-                tools.append(CodeInterpreterTool(container="auto"))
-            elif config.type == "file_search":
-                # FileSearchTool requires vector_store_ids
-                vs_ids = config.vector_store_ids or []
-                if vs_ids:
-                    tools.append(FileSearchTool(vector_store_ids=vs_ids))
-            elif config.type == "mcp":
-                # MCPTool requires keyword arguments
-                # require_approval must be "always" or "never"
-                require_approval_raw = config.require_approval or "always"
-                require_approval_val: str = "never" if require_approval_raw == "never" else "always"
-                mcp_tool = MCPTool(  # type: ignore[call-overload]
-                    server_label=config.server_label or "",
-                    server_url=config.server_url or "",
-                    require_approval=require_approval_val,
-                    project_connection_id=config.project_connection_id,
-                )
-                tools.append(mcp_tool)
-        return tools
+        return self._deployment_catalog.with_capability(self.CHAT_COMPLETION)
 
     def create_agent(
         self,
@@ -536,21 +900,14 @@ class ProjectClientService:
             )
 
             # Create the agent
-            self.client.agents.create(
+            created = self.client.agents.create(
                 name=name,
                 definition=definition,
                 description=description,
                 metadata=metadata,
             )
 
-            # Refresh and return the created agent
-            agents = self.list_agents()
-            for agent in agents:
-                if agent.name == name:
-                    return agent
-
-            # Fallback if not found (shouldn't happen)
-            raise NetworkError(f"Agent '{name}' created but not found in list")
+            return self._agent_from_response(created, name)
         except ClientAuthenticationError as e:
             raise NotAuthenticated(str(e)) from e
         except HttpResponseError as e:
@@ -604,21 +961,14 @@ class ProjectClientService:
             )
 
             # Update the agent
-            self.client.agents.update(
+            updated = self.client.agents.update(
                 agent_name=agent_name,
                 definition=definition,
                 description=description,
                 metadata=metadata,
             )
 
-            # Refresh and return the updated agent
-            agents = self.list_agents()
-            for agent in agents:
-                if agent.name == agent_name:
-                    return agent
-
-            # Fallback if not found (shouldn't happen)
-            raise NetworkError(f"Agent '{agent_name}' updated but not found in list")
+            return self._agent_from_response(updated, agent_name)
         except ClientAuthenticationError as e:
             raise NotAuthenticated(str(e)) from e
         except HttpResponseError as e:
@@ -627,3 +977,198 @@ class ProjectClientService:
             # Format SSL errors with helpful guidance
             error_msg = format_ssl_error_message(e)
             raise NetworkError(error_msg) from e
+
+
+class AsyncProjectClientService(_ProjectClientBase):
+    """Asyncio variant of ProjectClientService built on the SDK's aio client.
+
+    Listings are coroutines and async iterators returning the same Agent and
+    Deployment types, so several can be awaited concurrently from an event
+    loop. Cancelling the awaiting task stops a listing at its next await; the
+    agent store is only updated by listings that run to completion.
+
+    Not used by the screens yet, which run ProjectClientService in thread
+    workers. Parsing lives in _ProjectClientBase, so both return the same
+    results.
+    """
+
+    def __init__(self, endpoint: str, credential: TokenCredential) -> None:
+        """Initialize the async project client service.
+
+        Args:
+            endpoint: The project endpoint URL.
+            credential: Azure credential for authentication. Token requests
+                are run in a worker thread so they never block the event loop.
+        """
+        super().__init__(endpoint, credential)
+        self._client: AsyncAIProjectClient | None = None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    @property
+    def client(self) -> AsyncAIProjectClient:
+        """Get or create the async AIProjectClient instance.
+
+        Returns:
+            Configured asyncio AIProjectClient.
+        """
+        if self._client is None:
+            self._client = AsyncAIProjectClient(
+                endpoint=self._endpoint,
+                credential=AsyncCredentialAdapter(self._credential),
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close the SDK client and its transport."""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+    async def iter_agent_pages(self, page_size: int | None = None) -> AsyncIterator[list[Agent]]:
+        """Iterate over the project's agents one page at a time.
+
+        Args:
+            page_size: Agents per page when the SDK does not expose service
+                pages. Defaults to AGENT_PAGE_SIZE.
+
+        Yields:
+            Lists of agents, in listing order.
+
+        Raises:
+            NotAuthenticated: If credential is invalid.
+            NetworkError: If network request fails.
+        """
+        async for page in self._iter_agent_pages(AgentDelta([], [], []), page_size):
+            yield page
+
+    async def _iter_agent_pages(
+        self, delta: AgentDelta, page_size: int | None = None
+    ) -> AsyncIterator[list[Agent]]:
+        """Iterate over agent pages, recording changes against the store in delta."""
+        try:
+            agent_list = self.client.agents.list()
+
+            shape = _PayloadShape()
+            previous = self._agent_cache
+            current: dict[str, Agent] = {}
+
+            async for raw_page in self._raw_pages(agent_list, page_size or self.AGENT_PAGE_SIZE):
+                yield self._parse_agent_page(raw_page, shape, previous, current, delta)
+
+            self._finish_agent_listing(previous, current, delta)
+        except ClientAuthenticationError as e:
+            raise NotAuthenticated(str(e)) from e
+        except HttpResponseError as e:
+            raise NetworkError(f"Failed to list agents: {e}") from e
+        except Exception as e:
+            # Format SSL errors with helpful guidance
+            error_msg = format_ssl_error_message(e)
+            raise NetworkError(error_msg) from e
+
+    @staticmethod
+    async def _raw_pages(agent_list: Any, page_size: int) -> AsyncIterator[list[Any]]:
+        """Split an async SDK listing into pages, using service pages when available."""
+        by_page = getattr(agent_list, "by_page", None)
+        if callable(by_page):
+            async for raw_page in by_page():
+                yield [item async for item in raw_page]
+            return
+
+        page: list[Any] = []
+        async for item in agent_list:
+            page.append(item)
+            if len(page) >= page_size:
+                yield page
+                page = []
+        if page:
+            yield page
+
+    async def refresh_agents(self) -> AgentDelta:
+        """Re-list agents, re-parsing only those whose latest version changed.
+
+        Returns:
+            IDs of agents added, removed and changed since the previous refresh.
+
+        Raises:
+            NotAuthenticated: If credential is invalid.
+            NetworkError: If network request fails.
+        """
+        delta = AgentDelta(added=[], removed=[], changed=[])
+        async for _ in self._iter_agent_pages(delta):
+            pass
+        return delta
+
+    async def list_agents(self) -> list[Agent]:
+        """List all agents in the project.
+
+        Returns:
+            List of agents.
+
+        Raises:
+            NotAuthenticated: If credential is invalid.
+            NetworkError: If network request fails.
+        """
+        await self.refresh_agents()
+        return self.cached_agents
+
+    async def list_deployments(self) -> list[Deployment]:
+        """List model deployments in the project.
+
+        Returns:
+            List of deployments sorted by name.
+
+        Raises:
+            NotAuthenticated: If credential is invalid.
+            NetworkError: If network request fails.
+        """
+        try:
+            deployments = [
+                self._parse_deployment(dep) async for dep in self.client.deployments.list()
+            ]
+            return self._sort_deployments(deployments)
+        except ClientAuthenticationError as e:
+            raise NotAuthenticated(str(e)) from e
+        except HttpResponseError as e:
+            raise NetworkError(f"Failed to list deployments: {e}") from e
+        except Exception as e:
+            # SSL errors get helpful guidance
+            if self._is_ssl_error(e):
+                raise NetworkError(format_ssl_error_message(e)) from e
+            # Return empty list if deployments API is not available
+            return []
+
+    async def get_chat_completion_models(self) -> list[Deployment]:
+        """Get deployments suitable for agents (chat completion capable).
+
+        Returns:
+            List of deployments that support chat completion.
+        """
+        deployments = await self.list_deployments()
+        return [d for d in deployments if self.CHAT_COMPLETION in d.capabilities]
+
+    async def delete_agent(self, agent_id: str) -> None:
+        """Delete an agent.
+
+        Args:
+            agent_id: The agent ID to delete.
+
+        Raises:
+            NotAuthenticated: If credential is invalid.
+            NetworkError: If network request fails.
+        """
+        try:
+            await self.client.agents.delete(agent_id)
+            self._agent_cache.pop(agent_id, None)
+        except ClientAuthenticationError as e:
+            raise NotAuthenticated(str(e)) from e
+        except HttpResponseError as e:
+            raise NetworkError(f"Failed to delete agent: {e}") from e
+        except Exception as e:
+            # Format SSL errors with helpful guidance
+            error_msg = format_ssl_error_message(e)
+            raise NetworkError(error_msg) from e
@@ -0,0 +1,263 @@
+"""Azure Resource Graph queries for Foundry discovery."""
+
+import re
+import time
+from collections.abc import Iterator
+from typing import Any, Self
+
+import httpx
+from azure.core.credentials import TokenCredential
+
+from anvil.services.arm_client import retry_delay
+from anvil.services.cancellation import CancelToken, check_cancelled
+from anvil.services.exceptions import NetworkError, NotAuthenticated
+from anvil.services.foundry import FoundryAccount, FoundryProject
+from anvil.services.ssl_config import format_ssl_error_message, get_ssl_verify
+
+
+class ResourceGraphService:
+    """Finds Foundry accounts and projects with Azure Resource Graph.
+
+    Resource Graph filters resources server-side across many subscriptions,
+    so all AIServices accounts, or all of their projects, are found with one
+    paged query instead of one listing per subscription and account.
+    """
+
+    URL = "https://management.azure.com/providers/Microsoft.ResourceGraph/resources"
+    API_VERSION = "2022-10-01"
+
+    # Rows per page, the maximum Resource Graph returns
+    PAGE_SIZE = 1000
+
+    # Subscriptions Resource Graph accepts in a single query
+    MAX_SUBSCRIPTIONS_PER_QUERY = 1000
+
+    # Retry policy for throttled queries
+    DEFAULT_MAX_RETRIES = 3
+    RETRY_BACKOFF_BASE = 1.0
+    RETRY_BACKOFF_MAX = 60.0
+    MAX_RETRY_AFTER = 60.0
+
+    ACCOUNTS_QUERY = (
+        "resources"
+        " | where type =~ 'microsoft.cognitiveservices/accounts' and kind =~ 'AIServices'"
+        " | project id, name, resourceGroup, location, subscriptionId,"
+        " endpoint = tostring(properties.endpoint)"
+        " | order by id asc"
+    )
+
+    PROJECTS_QUERY = (
+        "resources"
+        " | where type =~ 'microsoft.cognitiveservices/accounts/projects'"
+        " | project id, name, subscriptionId,"
+        " displayName = tostring(properties.displayName), endpoints = properties.endpoints"
+        " | order by id asc"
+    )
+
+    def __init__(
+        self,
+        credential: TokenCredential,
+        transport: httpx.BaseTransport | None = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> None:
+        """Initialize the Resource Graph service.
+
+        Args:
+            credential: Azure credential for authentication.
+            transport: Optional HTTP transport, e.g. httpx.MockTransport in tests.
+            max_retries: Maximum number of retries for throttled queries.
+        """
+        self._credential = credential
+        self._transport = transport
+        self._max_retries = max_retries
+        self._http_client: httpx.Client | None = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def credential(self) -> TokenCredential:
+        """Return the credential used for requests."""
+        return self._credential
+
+    @property
+    def http_client(self) -> httpx.Client:
+        """Get or create the shared HTTP client.
+
+        Returns:
+            Configured httpx.Client.
+        """
+        if self._http_client is None:
+            self._http_client = httpx.Client(
+                timeout=30.0,
+                verify=get_ssl_verify(),
+                transport=self._transport,
+            )
+        return self._http_client
+
+    def close(self) -> None:
+        """Close the shared HTTP client and release pooled connections."""
+        if self._http_client is not None:
+            self._http_client.close()
+            self._http_client = None
+
+    def iter_account_pages(
+        self, subscription_ids: list[str], cancel: CancelToken | None = None
+    ) -> Iterator[list[tuple[str, FoundryAccount]]]:
+        """Find the AIServices accounts of several subscriptions, page by page.
+
+        Args:
+            subscription_ids: Subscriptions to search.
+            cancel: Token checked before each page is requested.
+
+        Yields:
+            (subscription ID, account) pairs, one list per result page.
+
+        Raises:
+            NotAuthenticated: If authentication fails.
+            NetworkError: If a query fails.
+            OperationCancelled: If cancel is set before the query completes.
+        """
+        for rows in self.query(self.ACCOUNTS_QUERY, subscription_ids, cancel):
+            yield [
+                (
+                    row.get("subscriptionId", ""),
+                    FoundryAccount(
+                        id=row.get("id", ""),
+                        name=row.get("name", ""),
+                        resource_group=row.get("resourceGroup", ""),
+                        location=row.get("location", ""),
+                        endpoint=row.get("endpoint") or "",
+                    ),
+                )
+                for row in rows
+            ]
+
+    def iter_project_pages(
+        self, subscription_ids: list[str], cancel: CancelToken | None = None
+    ) -> Iterator[list[tuple[str, FoundryProject]]]:
+        """Find the Foundry projects of several subscriptions, page by page.
+
+        Args:
+            subscription_ids: Subscriptions to search.
+            cancel: Token checked before each page is requested.
+
+        Yields:
+            (account ID, project) pairs, one list per result page.
+
+        Raises:
+            NotAuthenticated: If authentication fails.
+            NetworkError: If a query fails.
+            OperationCancelled: If cancel is set before the query completes.
+        """
+        for rows in self.query(self.PROJECTS_QUERY, subscription_ids, cancel):
+            page: list[tuple[str, FoundryProject]] = []
+            for row in rows:
+                project_id = row.get("id", "")
+                name = row.get("name", "")
+                endpoints = row.get("endpoints")
+                endpoint = ""
+                if endpoints and isinstance(endpoints, dict):
+                    endpoint = next(iter(endpoints.values()), "")
+                # Resource Graph names child resources "account/project"
+                name = name.rsplit("/", 1)[-1]
+                project = FoundryProject(
+                    id=project_id,
+                    name=name,
+                    display_name=row.get("displayName") or name,
+                    endpoint=endpoint,
+                )
+                page.append((self._parent_account_id(project_id), project))
+            yield page
+
+    def query(
+        self,
+        query: str,
+        subscription_ids: list[str],
+        cancel: CancelToken | None = None,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Run a Resource Graph query, following $skipToken page by page.
+
+        Args:
+            query: Kusto query to run.
+            subscription_ids: Subscriptions to query.
+            cancel: Token checked before each page is requested.
+
+        Yields:
+            Result rows, one list per page.
+
+        Raises:
+            NotAuthenticated: If authentication fails.
+            NetworkError: If a query fails.
+            OperationCancelled: If cancel is set before the query completes.
+        """
+        size = self.MAX_SUBSCRIPTIONS_PER_QUERY
+        for start in range(0, len(subscription_ids), size):
+            subscriptions = subscription_ids[start : start + size]
+            skip_token: str | None = None
+            while True:
+                check_cancelled(cancel)
+                options: dict[str, Any] = {"$top": self.PAGE_SIZE, "resultFormat": "objectArray"}
+                if skip_token:
+                    options["$skipToken"] = skip_token
+                body = self._post(
+                    {"subscriptions": subscriptions, "query": query, "options": options}
+                )
+                yield body.get("data", [])
+                skip_token = body.get("$skipToken")
+                if not skip_token:
+                    break
+
+    @staticmethod
+    def _parent_account_id(project_id: str) -> str:
+        """Get the account resource ID from a project resource ID."""
+        return re.sub(r"/projects/[^/]+$", "", project_id, flags=re.IGNORECASE)
+
+    def _post(self, body: dict[str, Any]) -> dict[str, Any]:
+        """Send a query, retrying while it is throttled.
+
+        Args:
+            body: Query request body.
+
+        Returns:
+            Response JSON as a dictionary.
+
+        Raises:
+            NotAuthenticated: If authentication fails.
+            NetworkError: If the request fails.
+        """
+        token = self._credential.get_token("https://management.azure.com/.default")
+        headers = {
+            "Authorization": f"Bearer {token.token}",
+            "Content-Type": "application/json",
+        }
+        url = f"{self.URL}?api-version={self.API_VERSION}"
+
+        try:
+            attempt = 0
+            while True:
+                response = self.http_client.post(url, headers=headers, json=body)
+                if response.status_code != 429 or attempt >= self._max_retries:
+                    break
+                time.sleep(
+                    retry_delay(
+                        response,
+                        attempt,
+                        self.RETRY_BACKOFF_BASE,
+                        self.RETRY_BACKOFF_MAX,
+                        self.MAX_RETRY_AFTER,
+                    )
+                )
+                attempt += 1
+        except httpx.RequestError as e:
+            raise NetworkError(format_ssl_error_message(e)) from e
+
+        if response.status_code == 401:
+            raise NotAuthenticated("Resource Graph authentication failed")
+        if response.status_code >= 400:
+            raise NetworkError(f"Resource Graph query failed: {response.text}")
+        result: dict[str, Any] = response.json()
+        return result
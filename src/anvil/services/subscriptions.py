@@ -1,6 +1,8 @@
 """Azure Subscriptions service for Anvil."""
 
+import threading
 from dataclasses import dataclass
+from typing import Self
 
 from azure.core.credentials import TokenCredential
 from azure.core.exceptions import ClientAuthenticationError, HttpResponseError
@@ -20,7 +22,11 @@ class Subscription:
 
 
 class SubscriptionService:
-    """Lists and filters Azure subscriptions."""
+    """Lists and filters Azure subscriptions.
+
+    The SubscriptionClient is created on first use and shared by all calls.
+    Call close() when the service is no longer needed.
+    """
 
     def __init__(self, credential: TokenCredential) -> None:
         """Initialize the subscription service.
@@ -29,6 +35,49 @@ class SubscriptionService:
             credential: Azure credential for authentication.
         """
         self._credential = credential
+        self._client: SubscriptionClient | None = None
+        # Screens use the client from worker threads; once closed it is not reopened
+        self._client_lock = threading.Lock()
+        self._closed = False
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def credential(self) -> TokenCredential:
+        """Return the credential used for requests."""
+        return self._credential
+
+    @property
+    def client(self) -> SubscriptionClient:
+        """Get or create the shared subscription client.
+
+        Returns:
+            Configured SubscriptionClient.
+
+        Raises:
+            RuntimeError: If the service has been closed.
+        """
+        with self._client_lock:
+            if self._closed:
+                raise RuntimeError("Subscription service has been closed")
+            if self._client is None:
+                self._client = SubscriptionClient(self._credential)
+            return self._client
+
+    def close(self) -> None:
+        """Close the subscription client and release pooled connections.
+
+        Closing is final: later calls raise instead of opening a new client.
+        """
+        with self._client_lock:
+            self._closed = True
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()  # type: ignore[no-untyped-call]
 
     def list_subscriptions(self) -> list[Subscription]:
         """List all subscriptions user has access to.
@@ -41,7 +90,8 @@ class SubscriptionService:
             NetworkError: If network request fails.
         """
         try:
-            client = SubscriptionClient(self._credential)
+            client = self.client
+
             subscriptions: list[Subscription] = []
 
             for sub in client.subscriptions.list():
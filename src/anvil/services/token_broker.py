@@ -0,0 +1,210 @@
+"""Access token caching for Azure credentials."""
+
+import asyncio
+import threading
+import time
+from typing import Any, Self
+
+from azure.core.credentials import AccessToken, TokenCredential
+
+_CacheKey = tuple[tuple[str, ...], tuple[tuple[str, Any], ...]]
+
+
+class TokenBroker:
+    """Caches access tokens per scope and refreshes them before they expire.
+
+    Implements the TokenCredential protocol, so a single broker can be shared
+    by the ARM client and all Azure SDK clients. Tokens are served from memory;
+    once a token enters the refresh window a background thread fetches a new
+    one, so callers never wait on the underlying credential (for example an
+    `az` subprocess) except for the very first request of a scope.
+    """
+
+    # Start refreshing a token this many seconds before it expires
+    DEFAULT_REFRESH_MARGIN = 300
+
+    # Tokens closer than this to expiry are never handed out
+    EXPIRY_BUFFER = 30
+
+    def __init__(
+        self,
+        credential: TokenCredential,
+        refresh_margin: float = DEFAULT_REFRESH_MARGIN,
+    ) -> None:
+        """Initialize the token broker.
+
+        Args:
+            credential: Underlying Azure credential used to acquire tokens.
+            refresh_margin: Seconds before expiry at which a background refresh starts.
+        """
+        self._credential = credential
+        self._refresh_margin = refresh_margin
+        self._tokens: dict[_CacheKey, AccessToken] = {}
+        self._fetch_locks: dict[_CacheKey, threading.Lock] = {}
+        self._refreshing: set[_CacheKey] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def credential(self) -> TokenCredential:
+        """Return the wrapped credential."""
+        return self._credential
+
+    def get_token(
+        self,
+        *scopes: str,
+        claims: str | None = None,
+        tenant_id: str | None = None,
+        **kwargs: Any,
+    ) -> AccessToken:
+        """Get an access token for the given scopes.
+
+        Args:
+            *scopes: Scopes the token is requested for.
+            claims: Additional claims (e.g. from a CAE challenge). Bypasses the cache.
+            tenant_id: Optional tenant to request the token from.
+            **kwargs: Additional keyword arguments passed to the credential.
+
+        Returns:
+            A cached or freshly acquired AccessToken.
+        """
+        if tenant_id is not None:
+            kwargs["tenant_id"] = tenant_id
+
+        # Claims challenges must always reach the credential
+        if claims:
+            return self._credential.get_token(*scopes, claims=claims, **kwargs)
+
+        key: _CacheKey = (tuple(scopes), tuple(sorted(kwargs.items())))
+        with self._lock:
+            token = self._tokens.get(key)
+
+        remaining = token.expires_on - time.time() if token else 0
+        if token is None or remaining <= self.EXPIRY_BUFFER:
+            return self._fetch(key, scopes, kwargs, stale=token)
+
+        if remaining <= self._refresh_margin:
+            self._refresh_in_background(key, scopes, kwargs)
+
+        return token
+
+    def invalidate(self) -> None:
+        """Drop all cached tokens."""
+        with self._lock:
+            self._tokens.clear()
+
+    def close(self) -> None:
+        """Drop cached tokens and close the wrapped credential if supported."""
+        self.invalidate()
+        close = getattr(self._credential, "close", None)
+        if callable(close):
+            close()
+
+    def _fetch(
+        self,
+        key: _CacheKey,
+        scopes: tuple[str, ...],
+        kwargs: dict[str, Any],
+        stale: AccessToken | None = None,
+    ) -> AccessToken:
+        """Acquire a token from the credential, one request per scope at a time.
+
+        Args:
+            key: Cache key for the scopes and options.
+            scopes: Scopes the token is requested for.
+            kwargs: Keyword arguments passed to the credential.
+            stale: The cached token the caller considered unusable, if any.
+
+        Returns:
+            The newly acquired (or concurrently refreshed) AccessToken.
+        """
+        with self._lock:
+            fetch_lock = self._fetch_locks.setdefault(key, threading.Lock())
+
+        with fetch_lock:
+            # Another thread may have refreshed the token while we waited
+            with self._lock:
+                current = self._tokens.get(key)
+            if (
+                current is not None
+                and current is not stale
+                and current.expires_on - time.time() > self.EXPIRY_BUFFER
+            ):
+                return current
+
+            token = self._credential.get_token(*scopes, **kwargs)
+            with self._lock:
+                self._tokens[key] = token
+            return token
+
+    def _refresh_in_background(
+        self, key: _CacheKey, scopes: tuple[str, ...], kwargs: dict[str, Any]
+    ) -> None:
+        """Start a background refresh for a token, unless one is already running."""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            stale = self._tokens.get(key)
+
+        def refresh() -> None:
+            try:
+                self._fetch(key, scopes, kwargs, stale=stale)
+            except Exception:
+                # The cached token is still valid; the next request past the
+                # expiry buffer will retry synchronously and surface errors.
+                pass
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, name="token-refresh", daemon=True).start()
+
+
+class AsyncCredentialAdapter:
+    """Exposes a synchronous TokenCredential as an AsyncTokenCredential.
+
+    Token requests run in a worker thread, so a blocking credential (such as
+    an `az` subprocess) never stalls the event loop. Wrapping a TokenBroker
+    keeps the async clients on the same token cache as the sync ones.
+    """
+
+    def __init__(self, credential: TokenCredential) -> None:
+        """Initialize the adapter.
+
+        Args:
+            credential: Synchronous credential to delegate to.
+        """
+        self._credential = credential
+
+    async def get_token(
+        self,
+        *scopes: str,
+        claims: str | None = None,
+        tenant_id: str | None = None,
+        **kwargs: Any,
+    ) -> AccessToken:
+        """Get an access token for the given scopes.
+
+        Args:
+            *scopes: Scopes the token is requested for.
+            claims: Additional claims, e.g. from a CAE challenge.
+            tenant_id: Optional tenant to request the token from.
+            **kwargs: Additional keyword arguments passed to the credential.
+
+        Returns:
+            AccessToken from the wrapped credential.
+        """
+        if claims is not None:
+            kwargs["claims"] = claims
+        if tenant_id is not None:
+            kwargs["tenant_id"] = tenant_id
+        return await asyncio.to_thread(self._credential.get_token, *scopes, **kwargs)
+
+    async def close(self) -> None:
+        """Do nothing; the wrapped credential is owned by the caller."""
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
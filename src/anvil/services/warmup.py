@@ -0,0 +1,164 @@
+"""Concurrent warm-up of a project's resources."""
+
+import threading
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
+
+from anvil.services.cancellation import CancelToken
+from anvil.services.exceptions import OperationCancelled
+
+# Loads one resource as a sequence of pages, stopping when the token is set
+PageLoader = Callable[[CancelToken], Iterable[list[Any]]]
+
+
+class WarmupState(Enum):
+    """Loading state of a warmed-up resource."""
+
+    PENDING = "pending"
+    LOADING = "loading"
+    DONE = "done"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+@dataclass
+class WarmupProgress:
+    """Progress of one resource in a warm-up."""
+
+    resource: str
+    state: WarmupState
+    items: list[Any] = field(default_factory=list)  # Everything loaded so far
+    error: Exception | None = None
+
+    @property
+    def loaded(self) -> int:
+        """Number of items loaded so far."""
+        return len(self.items)
+
+    @property
+    def finished(self) -> bool:
+        """Check if the resource is no longer loading."""
+        return self.state not in (WarmupState.PENDING, WarmupState.LOADING)
+
+
+class ProjectWarmup:
+    """Loads a project's resources concurrently as soon as it is opened.
+
+    Each resource is loaded page by page in its own background thread, and
+    every page is reported through on_progress, so screens can render partial
+    results and show per-resource progress. Loaders fill the services' own
+    caches (agent store, deployment catalog), which makes later views of the
+    same resource instant. Cancelling stops every loader at its next page.
+    """
+
+    def __init__(
+        self,
+        loaders: dict[str, PageLoader],
+        on_progress: Callable[[WarmupProgress], None] | None = None,
+    ) -> None:
+        """Initialize the warm-up.
+
+        Args:
+            loaders: Page loaders keyed by resource name. Each is passed the
+                warm-up's cancellation token.
+            on_progress: Called from the loader threads after every change.
+        """
+        self._loaders = loaders
+        self._on_progress = on_progress
+        self._progress = {
+            resource: WarmupProgress(resource, WarmupState.PENDING) for resource in loaders
+        }
+        self._threads: list[threading.Thread] = []
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def started(self) -> bool:
+        """Check if the loaders have been started."""
+        return bool(self._threads)
+
+    @property
+    def is_cancelled(self) -> bool:
+        """Check if the warm-up has been cancelled."""
+        return self._cancelled.is_set()
+
+    def start(self) -> None:
+        """Start loading all resources concurrently."""
+        if self._threads:
+            return
+        for resource, loader in self._loaders.items():
+            thread = threading.Thread(
+                target=self._run,
+                args=(resource, loader),
+                name=f"warmup-{resource}",
+                daemon=True,
+            )
+            self._threads.append(thread)
+            thread.start()
+
+    def cancel(self) -> None:
+        """Stop all loaders at their next page boundary."""
+        self._cancelled.set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Wait for all loaders to finish.
+
+        Args:
+            timeout: Seconds to wait for each loader, or None to wait indefinitely.
+
+        Returns:
+            True if every loader has finished.
+        """
+        for thread in self._threads:
+            thread.join(timeout)
+        return all(progress.finished for progress in self.snapshot())
+
+    def progress(self, resource: str) -> WarmupProgress | None:
+        """Get the latest progress of a resource.
+
+        Args:
+            resource: Resource name as passed in loaders.
+
+        Returns:
+            The latest progress, or None if the resource is not warmed up.
+        """
+        with self._lock:
+            return self._progress.get(resource)
+
+    def snapshot(self) -> list[WarmupProgress]:
+        """Get the latest progress of every resource.
+
+        Returns:
+            Progress per resource, in loader order.
+        """
+        with self._lock:
+            return list(self._progress.values())
+
+    def _run(self, resource: str, loader: PageLoader) -> None:
+        """Load one resource page by page, reporting progress as it goes."""
+        items: list[Any] = []
+        state = WarmupState.DONE
+        self._report(WarmupProgress(resource, WarmupState.LOADING))
+        try:
+            for page in loader(self._cancelled):
+                if self._cancelled.is_set():
+                    state = WarmupState.CANCELLED
+                    break
+                items.extend(page)
+                self._report(WarmupProgress(resource, WarmupState.LOADING, list(items)))
+        except OperationCancelled:
+            state = WarmupState.CANCELLED
+        except Exception as e:
+            self._report(WarmupProgress(resource, WarmupState.FAILED, items, error=e))
+            return
+
+        self._report(WarmupProgress(resource, state, items))
+
+    def _report(self, progress: WarmupProgress) -> None:
+        """Record a resource's progress and notify the listener."""
+        with self._lock:
+            self._progress[progress.resource] = progress
+        if self._on_progress is not None:
+            self._on_progress(progress)
@@ -42,6 +42,20 @@ class SearchableList[T](Widget):
             self.label = label
             super().__init__()
 
+    class Highlighted(Message):
+        """Posted when the highlighted option changes."""
+
+        def __init__(self, value: Any, label: str) -> None:
+            """Initialize the highlighted message.
+
+            Args:
+                value: The value associated with the highlighted option.
+                label: The display label of the highlighted option.
+            """
+            self.value = value
+            self.label = label
+            super().__init__()
+
     def __init__(
         self,
         placeholder: str = "Type to search...",
@@ -73,27 +87,43 @@ class SearchableList[T](Widget):
     def set_options(self, options: list[tuple[str, Any]]) -> None:
         """Set the list of options.
 
+        The current search query is kept, and the highlighted option stays
+        highlighted if it is still listed, so options can be replaced while
+        the user is browsing them.
+
         Args:
             options: List of (label, value) tuples.
         """
+        query = self.query_one("#search-input", Input).value.lower()
+        current = self._highlighted_value()
         self._all_options = options
-        self._update_display("")
+        self._update_display(query, keep_value=current)
+
+    def _highlighted_value(self) -> Any:
+        """Return the value of the highlighted option, if any."""
+        index = self.query_one("#options", OptionList).highlighted
+        if index is not None and index < len(self._filtered_options):
+            return self._filtered_options[index][1]
+        return None
 
     def on_input_changed(self, event: Input.Changed) -> None:
         """Filter options based on search input."""
         self._update_display(event.value.lower())
 
-    def _update_display(self, query: str) -> None:
+    def _update_display(self, query: str, keep_value: Any = None) -> None:
         """Update displayed options based on filter.
 
         Args:
             query: Search query (lowercase).
+            keep_value: Value to keep highlighted, taking precedence over the
+                last used value.
         """
         option_list = self.query_one("#options", OptionList)
         option_list.clear_options()
 
         self._filtered_options = []
         highlight_index: int | None = None
+        keep_index: int | None = None
 
         for label, value in self._all_options:
             if not query or query in label.lower():
@@ -104,9 +134,13 @@ class SearchableList[T](Widget):
                 # Check if this should be highlighted (last used)
                 if self._highlight_value is not None and value == self._highlight_value:
                     highlight_index = idx
+                if keep_value is not None and value == keep_value:
+                    keep_index = idx
 
-        # Pre-select the previously used option, or first option if none
-        if highlight_index is not None:
+        # Keep the current option, else pre-select the previously used one, or the first
+        if keep_index is not None:
+            option_list.highlighted = keep_index
+        elif highlight_index is not None:
             option_list.highlighted = highlight_index
         elif self._filtered_options:
             option_list.highlighted = 0
@@ -117,6 +151,12 @@ class SearchableList[T](Widget):
             label, value = self._filtered_options[event.option_index]
             self.post_message(self.Selected(value, label))
 
+    def on_option_list_option_highlighted(self, event: OptionList.OptionHighlighted) -> None:
+        """Handle option highlight changes."""
+        if event.option_index is not None and event.option_index < len(self._filtered_options):
+            label, value = self._filtered_options[event.option_index]
+            self.post_message(self.Highlighted(value, label))
+
     def focus_search(self) -> None:
         """Focus the search input."""
         self.query_one("#search-input", Input).focus()
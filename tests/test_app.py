@@ -1,7 +1,8 @@
 """Tests for the main Anvil application."""
 
+import threading
 from datetime import datetime
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -42,6 +43,7 @@ def mock_config_with_selection(tmp_path):
 
     with patch("anvil.app.ConfigManager") as mock_cls:
         mock_manager = mock_cls.return_value
+        mock_manager.config_dir = tmp_path
         mock_manager.load.return_value = config
         mock_manager.get_last_subscription_id.return_value = selection.subscription_id
         mock_manager.get_last_account_name.return_value = selection.account_name
@@ -50,12 +52,13 @@ def mock_config_with_selection(tmp_path):
 
 
 @pytest.fixture
-def mock_config_empty():
+def mock_config_empty(tmp_path):
     """Mock config manager with no cached selection."""
     from anvil.config import AppConfig
 
     with patch("anvil.app.ConfigManager") as mock_cls:
         mock_manager = mock_cls.return_value
+        mock_manager.config_dir = tmp_path
         mock_manager.load.return_value = AppConfig()
         mock_manager.get_last_subscription_id.return_value = None
         mock_manager.get_last_account_name.return_value = None
@@ -100,6 +103,110 @@ async def test_app_shows_selection_without_cache(
             assert isinstance(app.screen, SubscriptionSelectScreen)
 
 
+async def test_subscriptions_shown_from_inventory(
+    mock_auth_authenticated, mock_config_empty
+) -> None:
+    """Test that cached subscriptions are listed before the refresh completes."""
+    from anvil.services.subscriptions import Subscription
+    from anvil.widgets import SearchableList
+
+    cached = Subscription(
+        id="/subscriptions/sub-1", subscription_id="sub-1", display_name="Dev", state="Enabled"
+    )
+    fresh = Subscription(
+        id="/subscriptions/sub-2", subscription_id="sub-2", display_name="Prod", state="Enabled"
+    )
+    with (
+        patch("anvil.app.SubscriptionService") as mock_service,
+        patch("anvil.app.FoundryService"),
+    ):
+        mock_service.return_value.list_subscriptions.return_value = [cached, fresh]
+        app = AnvilApp()
+        app.inventory.put_subscriptions([cached])
+        async with app.run_test() as pilot:
+            screen = app.screen
+            assert isinstance(screen, SubscriptionSelectScreen)
+            await pilot.pause()
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            assert screen.query_one("#subscription-list", SearchableList).display
+            assert screen._subscriptions == [cached, fresh]
+            assert app.inventory.get_subscriptions().items == [cached, fresh]
+
+
+async def test_find_project_opens_discovered_project(
+    mock_auth_authenticated, mock_config_with_selection
+) -> None:
+    """Test that a project picked from discovery becomes the current selection."""
+    from anvil.screens.project_discovery import ProjectDiscoveryScreen
+    from anvil.services.foundry import FoundryAccount, FoundryProject
+    from anvil.services.subscriptions import Subscription
+    from anvil.widgets import SearchableList
+
+    subscription = Subscription(
+        id="/subscriptions/sub-9", subscription_id="sub-9", display_name="Prod", state="Enabled"
+    )
+    account = FoundryAccount(
+        id="/accounts/acct", name="acct", resource_group="rg", location="", endpoint=""
+    )
+    project = FoundryProject(
+        id="/projects/found", name="found", display_name="Found", endpoint="https://found"
+    )
+    with (
+        patch("anvil.app.SubscriptionService") as mock_subscriptions,
+        patch("anvil.app.FoundryService") as mock_foundry,
+    ):
+        mock_subscriptions.return_value.list_subscriptions.return_value = [subscription]
+        mock_foundry.return_value.list_accounts.return_value = [account]
+        mock_foundry.return_value.list_projects.return_value = [project]
+        app = AnvilApp()
+        async with app.run_test() as pilot:
+            await pilot.press("enter")
+            app.action_find_project()
+            await pilot.pause()
+            screen = app.screen
+            assert isinstance(screen, ProjectDiscoveryScreen)
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            search_list = screen.query_one("#project-list", SearchableList)
+            assert search_list.option_count == 1
+            search_list.post_message(SearchableList.Selected("/projects/found", "Found"))
+            await pilot.pause()
+
+            assert app.current_selection.subscription_id == "sub-9"
+            assert app.current_selection.project_endpoint == "https://found"
+
+
+async def test_prefetched_projects_reach_project_screen(
+    mock_auth_authenticated, mock_config_empty
+) -> None:
+    """Test that projects prefetched for an instance are handed to its project screen."""
+    from anvil.screens.project_select import ProjectSelectScreen
+    from anvil.services.foundry import FoundryAccount
+    from anvil.services.subscriptions import Subscription
+
+    subscription = Subscription(
+        id="/subscriptions/sub-1", subscription_id="sub-1", display_name="Dev", state="Enabled"
+    )
+    account = FoundryAccount(
+        id="/accounts/acct", name="acct", resource_group="rg", location="", endpoint=""
+    )
+    with patch("anvil.app.SubscriptionService"):
+        app = AnvilApp()
+        async with app.run_test() as pilot:
+            service = MagicMock()
+            service.list_projects.return_value = []
+            app._prefetch_projects(service, account)
+            app._select_project(subscription, account, service)
+            await pilot.pause()
+            await app.workers.wait_for_complete()
+
+            assert isinstance(app.screen, ProjectSelectScreen)
+            service.list_projects.assert_called_once_with(resource_group="rg", account_name="acct")
+
+
 async def test_quit_binding_on_home(mock_auth_authenticated, mock_config_with_selection) -> None:
     """Test that pressing 'q' quits the application from home screen."""
     app = AnvilApp()
@@ -110,3 +217,44 @@ async def test_quit_binding_on_home(mock_auth_authenticated, mock_config_with_se
         assert isinstance(app.screen, HomeScreen)
         await pilot.press("q")
         assert not app.is_running
+
+
+async def test_selection_services_are_reused(mock_auth_authenticated, mock_config_empty) -> None:
+    """Test that the selection flow keeps one service per subscription until exit."""
+    with (
+        patch("anvil.app.SubscriptionService") as mock_subscriptions,
+        patch("anvil.app.FoundryService") as mock_foundry,
+    ):
+        mock_subscriptions.side_effect = lambda credential: MagicMock(credential=credential)
+        mock_foundry.side_effect = lambda **kwargs: MagicMock(credential=kwargs["credential"])
+        app = AnvilApp()
+        async with app.run_test():
+            assert app._get_subscription_service() is app._get_subscription_service()
+            foundry = app._get_foundry_service("sub-1")
+            assert app._get_foundry_service("sub-1") is foundry
+            assert app._get_foundry_service("sub-2") is not foundry
+
+        foundry.close.assert_called_once()
+
+
+async def test_exit_does_not_wait_for_running_prefetches(
+    mock_auth_authenticated, mock_config_empty
+) -> None:
+    """Test that closing the selection services does not block on a running prefetch."""
+    release = threading.Event()
+    started = threading.Event()
+
+    def slow_fetch() -> list:
+        started.set()
+        release.wait(5)
+        return []
+
+    with patch("anvil.app.SubscriptionService"):
+        app = AnvilApp()
+        async with app.run_test():
+            future = app._get_prefetch().prefetch(("projects", "acct"), slow_fetch)
+            assert started.wait(5)
+
+        assert not future.done()
+    release.set()
+    future.result(timeout=5)
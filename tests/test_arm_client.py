@@ -1,11 +1,23 @@
 """Tests for ArmClientService - ARM API operations."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from anvil.services.arm_client import ArmClientService, PublishedAgent
-from anvil.services.exceptions import NetworkError, NotAuthenticated
+from anvil.services.arm_client import (
+    ArmClientService,
+    AsyncArmClientService,
+    PublishedAgent,
+    PublishedDeployment,
+    UnpublishResult,
+)
+from anvil.services.exceptions import NetworkError, NotAuthenticated, OperationCancelled
 
 
 class TestArmClientServiceInit:
@@ -337,6 +349,182 @@ class TestGetPublishedAgent:
 
         assert result is None
 
+    def _mock_project(self, mock_httpx) -> MagicMock:
+        """Mock a project with two applications, each serving one agent."""
+        apps_response = MagicMock()
+        apps_response.status_code = 200
+        apps_response.text = "apps"
+        apps_response.json.return_value = {
+            "value": [
+                {
+                    "name": f"app-{i}",
+                    "properties": {
+                        "baseUrl": f"https://test.url/app-{i}",
+                        "isEnabled": True,
+                        "agents": [{"agentName": f"agent-{i}"}],
+                    },
+                }
+                for i in range(2)
+            ]
+        }
+
+        def deployments_response(app_name: str) -> MagicMock:
+            response = MagicMock()
+            response.status_code = 200
+            response.text = "deployments"
+            response.json.return_value = {
+                "value": [
+                    {
+                        "name": f"{app_name}-dep",
+                        "properties": {
+                            "agents": [{"agentName": app_name.replace("app", "agent")}],
+                            "state": "Running",
+                        },
+                    }
+                ]
+            }
+            return response
+
+        def mock_get(url, headers):
+            if "/applications?" in url:
+                return apps_response
+            return deployments_response(url.split("/applications/")[1].split("/")[0])
+
+        mock_client_instance = MagicMock()
+        mock_client_instance.get.side_effect = mock_get
+        mock_httpx.return_value = mock_client_instance
+        return mock_client_instance
+
+    @patch("anvil.services.arm_client.httpx.Client")
+    def test_targeted_lookup_after_listing(self, mock_httpx, service):
+        """Test that a known agent costs a single deployments request."""
+        client = self._mock_project(mock_httpx)
+        service.list_published_agents()
+        client.get.reset_mock()
+
+        result = service.get_published_agent("agent-1")
+
+        assert result is not None
+        assert result.application_name == "app-1"
+        assert result.deployment_name == "app-1-dep"
+        assert client.get.call_count == 1
+        assert "/applications/app-1/agentdeployments?" in client.get.call_args.args[0]
+
+    @patch("anvil.services.arm_client.httpx.Client")
+    def test_unpublished_agent_after_listing_needs_no_requests(self, mock_httpx, service):
+        """Test that an agent missing from a complete listing is not looked up."""
+        client = self._mock_project(mock_httpx)
+        service.list_published_agents()
+        client.get.reset_mock()
+
+        assert service.get_published_agent("draft-agent") is None
+        assert client.get.call_count == 0
+
+    @patch("anvil.services.arm_client.httpx.Client")
+    def test_unpublished_agent_without_listing_scans_applications_only(self, mock_httpx, service):
+        """Test that a cold lookup of an unpublished agent fetches no deployments."""
+        client = self._mock_project(mock_httpx)
+
+        assert service.get_published_agent("draft-agent") is None
+        urls = [call.args[0] for call in client.get.call_args_list]
+        assert len(urls) == 1
+        assert "/applications?" in urls[0]
+
+    @patch("anvil.services.arm_client.httpx.Client")
+    def test_cold_lookup_fetches_serving_application_only(self, mock_httpx, service):
+        """Test that a cold lookup fetches deployments of the serving application only."""
+        client = self._mock_project(mock_httpx)
+
+        result = service.get_published_agent("agent-1")
+
+        assert result is not None
+        assert result.deployment_name == "app-1-dep"
+        urls = [call.args[0] for call in client.get.call_args_list]
+        assert len(urls) == 2
+        assert "/applications/app-1/agentdeployments?" in urls[1]
+
+    @patch("anvil.services.arm_client.httpx.Client")
+    def test_unpublish_invalidates_index(self, mock_httpx, service):
+        """Test that unpublishing falls back to a scan for that application."""
+        client = self._mock_project(mock_httpx)
+        delete_response = MagicMock()
+        delete_response.status_code = 204
+        client.delete.return_value = delete_response
+        service.list_published_agents()
+
+        service.unpublish_agent("app-1", "app-1-dep")
+        client.get.reset_mock()
+        result = service.get_published_agent("agent-1")
+
+        assert result is not None
+        urls = [call.args[0] for call in client.get.call_args_list]
+        assert any("/applications?" in url for url in urls)
+
+    @patch("anvil.services.arm_client.httpx.Client")
+    def test_targeted_lookup_falls_back_when_application_fails(self, mock_httpx, service):
+        """Test that a failing targeted lookup rescans the project."""
+        client = self._mock_project(mock_httpx)
+        service.list_published_agents()
+        healthy_get = client.get.side_effect
+        failed = MagicMock()
+        failed.status_code = 404
+        failed.text = "Not found"
+
+        def mock_get(url, headers):
+            if "/applications/app-1/" in url and client.get.call_count == 1:
+                return failed
+            return healthy_get(url, headers)
+
+        client.get.reset_mock()
+        client.get.side_effect = mock_get
+        result = service.get_published_agent("agent-1")
+
+        assert result is not None
+        assert result.application_name == "app-1"
+        assert client.get.call_count > 1
+
+
+class TestAgentApplicationIndex:
+    """Tests for the agent -> application index shared between threads."""
+
+    def test_concurrent_updates(self):
+        """Test that listings and invalidations can update the index at once."""
+        service = ArmClientService(
+            subscription_id="sub-123",
+            resource_group="rg-test",
+            account_name="test-account",
+            project_name="proj-default",
+            credential=MagicMock(),
+        )
+        apps = [
+            {"name": f"app-{i % 4}", "properties": {"agents": [{"agentName": f"agent-{i}"}]}}
+            for i in range(200)
+        ]
+        errors: list[Exception] = []
+
+        def churn(worker: int) -> None:
+            try:
+                for _ in range(50):
+                    seen = service._remember_applications(apps)
+                    service._forget_application(f"app-{worker % 4}")
+                    service._forget_agents_except(seen)
+                    service._application_for("agent-1")
+            except Exception as e:
+                errors.append(e)
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=churn, args=(i,)) for i in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        assert errors == []
+
 
 class TestUnpublishAgent:
     """Tests for unpublish_agent method."""
@@ -390,3 +578,1016 @@ class TestUnpublishAgent:
 
         with pytest.raises(NetworkError):
             service.unpublish_agent("my-app", "my-deployment")
+
+
+class TestUnpublishAgents:
+    """Tests for unpublishing several deployments in one call."""
+
+    @pytest.fixture
+    def service(self):
+        """Create an ArmClientService for testing."""
+        mock_cred = MagicMock()
+        mock_cred.get_token.return_value = MagicMock(token="test-token")
+        return ArmClientService(
+            subscription_id="sub-123",
+            resource_group="rg-test",
+            account_name="test-account",
+            project_name="proj-default",
+            credential=mock_cred,
+        )
+
+    @patch("anvil.services.arm_client.httpx.Client")
+    def test_returns_result_per_target(self, mock_httpx, service):
+        """Test that failures are reported per item without stopping the batch."""
+        ok_response = MagicMock()
+        ok_response.status_code = 204
+        failed_response = MagicMock()
+        failed_response.status_code = 409
+        failed_response.text = "Conflict"
+
+        mock_client = MagicMock()
+        mock_client.delete.side_effect = lambda url, headers: (
+            failed_response if "/dep-1?" in url else ok_response
+        )
+        mock_httpx.return_value = mock_client
+
+        targets = [("app", f"dep-{i}") for i in range(4)]
+        results = service.unpublish_agents(targets)
+
+        assert [(r.application_name, r.deployment_name) for r in results] == targets
+        assert [r.succeeded for r in results] == [True, False, True, True]
+        assert "Conflict" in (results[1].error or "")
+        assert mock_client.delete.call_count == 4
+
+    def test_bounded_concurrency(self, service):
+        """Test that no more than max_concurrency deletions run at once."""
+        service._max_concurrency = 2
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def slow_unpublish(application_name, deployment_name):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+
+        with patch.object(service, "unpublish_agent", side_effect=slow_unpublish):
+            results = service.unpublish_agents([("app", f"dep-{i}") for i in range(6)])
+
+        assert all(r.succeeded for r in results)
+        assert peak == 2
+
+    @patch("anvil.services.arm_client.httpx.Client")
+    def test_concurrent_targets_in_one_application(self, mock_httpx, service):
+        """Test that targets sharing an application are all deleted."""
+        ok_response = MagicMock()
+        ok_response.status_code = 204
+        mock_client = MagicMock()
+        mock_client.delete.return_value = ok_response
+        mock_httpx.return_value = mock_client
+        service._remember_applications(
+            [
+                {
+                    "name": "app",
+                    "properties": {"agents": [{"agentName": f"agent-{i}"} for i in range(100)]},
+                }
+            ]
+        )
+        targets = [("app", f"dep-{i}") for i in range(8)]
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            results = service.unpublish_agents(targets)
+        finally:
+            sys.setswitchinterval(interval)
+
+        assert all(r.succeeded for r in results), [r.error for r in results]
+        assert mock_client.delete.call_count == 8
+        assert service._application_for("agent-0") is None
+
+    def test_unpublish_result_succeeded(self):
+        """Test the succeeded flag of UnpublishResult."""
+        assert UnpublishResult("app", "dep").succeeded
+        assert not UnpublishResult("app", "dep", error="boom").succeeded
+
+
+class TestHttpClientLifecycle:
+    """Tests for the shared, connection-pooled HTTP client."""
+
+    @pytest.fixture
+    def service(self):
+        """Create an ArmClientService for testing."""
+        mock_cred = MagicMock()
+        mock_cred.get_token.return_value = MagicMock(token="test-token")
+        return ArmClientService(
+            subscription_id="sub-123",
+            resource_group="rg-test",
+            account_name="test-account",
+            project_name="proj-default",
+            credential=mock_cred,
+        )
+
+    @patch("anvil.services.arm_client.httpx.Client")
+    def test_reuses_client_across_requests(self, mock_httpx, service):
+        """Test that a single HTTP client is shared by all requests."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.text = '{"value": []}'
+        mock_response.json.return_value = {"value": []}
+        mock_httpx.return_value.get.return_value = mock_response
+
+        service.list_published_agents()
+        service.list_published_agents()
+
+        mock_httpx.assert_called_once()
+        assert mock_httpx.return_value.get.call_count == 2
+
+    @patch("anvil.services.arm_client.httpx.Client")
+    def test_client_uses_configured_pool_limits(self, mock_httpx):
+        """Test that pool limits are passed to the HTTP client."""
+        service = ArmClientService(
+            subscription_id="sub-123",
+            resource_group="rg-test",
+            account_name="test-account",
+            project_name="proj-default",
+            credential=MagicMock(),
+            max_connections=4,
+            max_keepalive_connections=2,
+        )
+
+        _ = service.http_client
+
+        limits = mock_httpx.call_args.kwargs["limits"]
+        assert limits.max_connections == 4
+        assert limits.max_keepalive_connections == 2
+
+    @patch("anvil.services.arm_client.httpx.Client")
+    def test_close_releases_client(self, mock_httpx, service):
+        """Test that close() closes the client and does not let it reopen."""
+        client = service.http_client
+
+        service.close()
+
+        client.close.assert_called_once()
+        with pytest.raises(RuntimeError):
+            _ = service.http_client
+        mock_httpx.assert_called_once()
+
+    @patch("anvil.services.arm_client.httpx.Client")
+    def test_concurrent_first_use_creates_one_client(self, mock_httpx, service):
+        """Test that threads racing on first use share a single client."""
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            clients = list(executor.map(lambda _: service.http_client, range(32)))
+
+        mock_httpx.assert_called_once()
+        assert all(client is clients[0] for client in clients)
+
+    @patch("anvil.services.arm_client.httpx.Client")
+    def test_context_manager_closes_client(self, mock_httpx, service):
+        """Test that the service closes its client when used as a context manager."""
+        with service as svc:
+            client = svc.http_client
+
+        client.close.assert_called_once()
+
+
+class TestConcurrentDeploymentLookups:
+    """Tests for the bounded-concurrency fan-out in list_published_agents."""
+
+    def _make_service(self, max_concurrency: int) -> ArmClientService:
+        mock_cred = MagicMock()
+        mock_cred.get_token.return_value = MagicMock(token="test-token")
+        return ArmClientService(
+            subscription_id="sub-123",
+            resource_group="rg-test",
+            account_name="test-account",
+            project_name="proj-default",
+            credential=mock_cred,
+            max_concurrency=max_concurrency,
+        )
+
+    def _response(self, payload: dict, status_code: int = 200) -> MagicMock:
+        response = MagicMock()
+        response.status_code = status_code
+        response.text = "payload"
+        response.json.return_value = payload
+        return response
+
+    def _configure(self, mock_httpx, app_count: int, failing: set[str] | None = None) -> None:
+        failing = failing or set()
+        apps = {
+            "value": [
+                {
+                    "name": f"app-{i}",
+                    "properties": {
+                        "baseUrl": f"https://test.url/app-{i}",
+                        "isEnabled": True,
+                        "agents": [{"agentName": f"agent-{i}"}],
+                    },
+                }
+                for i in range(app_count)
+            ]
+        }
+
+        def mock_get(url, headers):
+            if "/applications?" in url:
+                return self._response(apps)
+            app_name = url.split("/applications/")[1].split("/")[0]
+            if app_name in failing:
+                return self._response({}, status_code=500)
+            return self._response(
+                {
+                    "value": [
+                        {
+                            "name": f"{app_name}-deployment",
+                            "properties": {
+                                "agents": [{"agentName": app_name.replace("app", "agent")}],
+                                "protocols": [{"protocol": "Responses"}],
+                                "state": "Running",
+                            },
+                        }
+                    ]
+                }
+            )
+
+        mock_httpx.return_value.get.side_effect = mock_get
+
+    @pytest.mark.parametrize("max_concurrency", [1, 4])
+    @patch("anvil.services.arm_client.httpx.Client")
+    def test_preserves_application_order(self, mock_httpx, max_concurrency):
+        """Test that results keep the application order regardless of concurrency."""
+        self._configure(mock_httpx, app_count=12)
+        service = self._make_service(max_concurrency)
+
+        published = service.list_published_agents()
+
+        assert [p.agent_name for p in published] == [f"agent-{i}" for i in range(12)]
+        assert all(p.deployment_name == f"app-{i}-deployment" for i, p in enumerate(published))
+
+    @patch("anvil.services.arm_client.ThreadPoolExecutor", wraps=ThreadPoolExecutor)
+    @patch("anvil.services.arm_client.httpx.Client")
+    def test_reuses_one_thread_pool(self, mock_httpx, mock_executor):
+        """Test that repeated listings share the client's thread pool."""
+        self._configure(mock_httpx, app_count=6)
+        service = self._make_service(max_concurrency=4)
+
+        service.list_published_agents()
+        service.list_published_agents()
+        service.unpublish_agents([("app-0", "dep-0"), ("app-1", "dep-1")])
+
+        mock_executor.assert_called_once()
+        service.close()
+        with pytest.raises(RuntimeError):
+            _ = service.executor
+
+    @patch("anvil.services.arm_client.httpx.Client")
+    def test_tolerates_failure_of_single_application(self, mock_httpx):
+        """Test that a failed deployment lookup only affects its own application."""
+        self._configure(mock_httpx, app_count=3, failing={"app-1"})
+        service = self._make_service(max_concurrency=4)
+
+        published = service.list_published_agents()
+
+        assert len(published) == 3
+        assert published[0].deployments
+        assert published[1].deployments == []
+        assert published[2].deployments
+
+
+def _synthetic_deployments(agent_count: int, versions_per_agent: int) -> list[dict]:
+    """Build a deployment payload with several versions per agent."""
+    return [
+        {
+            "name": f"agent-{a}-v{v}",
+            "properties": {
+                "agents": [{"agentName": f"agent-{a}"}],
+                "protocols": [{"protocol": "Responses"}, {"protocol": "ActivityProtocol"}],
+                "state": "Running" if v == 0 else "Stopped",
+            },
+        }
+        for v in range(versions_per_agent)
+        for a in range(agent_count)
+    ]
+
+
+def _naive_match(
+    agent_names: list[str], deployments: list[dict]
+) -> dict[str, list[PublishedDeployment]]:
+    """Reference implementation: rescan all deployments for every agent."""
+    result: dict[str, list[PublishedDeployment]] = {}
+    for agent_name in agent_names:
+        matches: list[PublishedDeployment] = []
+        for deployment in deployments:
+            dep_props = deployment.get("properties", {})
+            for dep_agent in dep_props.get("agents", []):
+                if dep_agent.get("agentName") == agent_name:
+                    protocols = [
+                        p.get("protocol", "")
+                        for p in dep_props.get("protocols", [])
+                        if p.get("protocol", "")
+                    ]
+                    matches.append(
+                        PublishedDeployment(
+                            deployment_name=deployment.get("name", ""),
+                            state=dep_props.get("state", "Unknown"),
+                            protocols=protocols,
+                        )
+                    )
+                    break
+        result[agent_name] = matches
+    return result
+
+
+class TestIndexDeployments:
+    """Tests for the agent name -> deployments index."""
+
+    def test_groups_deployments_by_agent_in_payload_order(self):
+        """Test that each agent gets its deployments in payload order."""
+        deployments = _synthetic_deployments(agent_count=2, versions_per_agent=3)
+
+        index = ArmClientService._index_deployments(deployments)
+
+        assert [d.deployment_name for d in index["agent-0"]] == [
+            "agent-0-v0",
+            "agent-0-v1",
+            "agent-0-v2",
+        ]
+        assert index["agent-1"][0].state == "Running"
+        assert index["agent-1"][0].protocols == ["Responses", "ActivityProtocol"]
+
+    def test_deployment_serving_several_agents(self):
+        """Test that a shared deployment is listed for every agent it contains."""
+        deployments = [
+            {
+                "name": "shared",
+                "properties": {
+                    "agents": [{"agentName": "a"}, {"agentName": "b"}, {"agentName": "a"}],
+                    "state": "Running",
+                },
+            }
+        ]
+
+        index = ArmClientService._index_deployments(deployments)
+
+        assert [d.deployment_name for d in index["a"]] == ["shared"]
+        assert [d.deployment_name for d in index["b"]] == ["shared"]
+
+    def test_skips_deployments_without_agents(self):
+        """Test that deployments without agents are ignored."""
+        index = ArmClientService._index_deployments([{"name": "empty", "properties": {}}])
+
+        assert index == {}
+
+    def test_matches_naive_scan(self):
+        """Test that the index gives the same result as rescanning per agent."""
+        deployments = _synthetic_deployments(agent_count=20, versions_per_agent=5)
+        agent_names = [f"agent-{a}" for a in range(25)]  # includes unpublished agents
+
+        index = ArmClientService._index_deployments(deployments)
+
+        expected = _naive_match(agent_names, deployments)
+        assert {name: index.get(name, []) for name in agent_names} == expected
+
+
+class _CountingDeployment(dict):
+    """Deployment payload that counts how often its properties are read."""
+
+    reads = 0
+
+    def get(self, key, default=None):
+        if key == "properties":
+            self.reads += 1
+        return super().get(key, default)
+
+
+class TestPublishedAgentsScaling:
+    """Tests for matching agents to deployments on large projects.
+
+    Uses synthetic payloads with hundreds of applications and thousands of
+    deployments to check that the index parses each deployment once, where
+    the per-agent rescan parses it once per agent.
+    """
+
+    APP_COUNT = 200
+    AGENTS_PER_APP = 20
+    VERSIONS_PER_AGENT = 3  # 60 deployments per app, 12,000 in total
+
+    def test_index_matches_rescan(self):
+        """Test that the index finds the same deployments as rescanning per agent."""
+        agent_names = [f"agent-{a}" for a in range(self.AGENTS_PER_APP)]
+        for _ in range(self.APP_COUNT):
+            deployments = _synthetic_deployments(self.AGENTS_PER_APP, self.VERSIONS_PER_AGENT)
+
+            index = ArmClientService._index_deployments(deployments)
+
+            assert {name: index.get(name, []) for name in agent_names} == _naive_match(
+                agent_names, deployments
+            )
+
+    def test_index_scales_with_deployments_not_agents(self):
+        """Test that each deployment is read once, however many agents are looked up."""
+        agent_names = [f"agent-{a}" for a in range(self.AGENTS_PER_APP)]
+        deployments = [
+            _CountingDeployment(deployment)
+            for deployment in _synthetic_deployments(self.AGENTS_PER_APP, self.VERSIONS_PER_AGENT)
+        ]
+
+        index = ArmClientService._index_deployments(deployments)
+        for name in agent_names:
+            assert len(index[name]) == self.VERSIONS_PER_AGENT
+
+        assert all(deployment.reads == 1 for deployment in deployments)
+
+
+class TestPagination:
+    """Tests for following ARM nextLink pagination."""
+
+    @pytest.fixture
+    def service(self):
+        """Create an ArmClientService for testing."""
+        mock_cred = MagicMock()
+        mock_cred.get_token.return_value = MagicMock(token="test-token")
+        return ArmClientService(
+            subscription_id="sub-123",
+            resource_group="rg-test",
+            account_name="test-account",
+            project_name="proj-default",
+            credential=mock_cred,
+        )
+
+    def _response(self, payload: dict) -> MagicMock:
+        response = MagicMock()
+        response.status_code = 200
+        response.text = "payload"
+        response.json.return_value = payload
+        return response
+
+    def _app(self, name: str) -> dict:
+        return {
+            "name": name,
+            "properties": {
+                "baseUrl": f"https://test.url/{name}",
+                "isEnabled": True,
+                "agents": [{"agentName": f"{name}-agent"}],
+            },
+        }
+
+    @patch("anvil.services.arm_client.httpx.Client")
+    def test_iter_applications_follows_next_link(self, mock_httpx, service):
+        """Test that all pages of applications are returned."""
+        next_link = "https://management.azure.com/next-page?$skipToken=abc"
+        pages = {
+            "first": {"value": [self._app("app-1")], "nextLink": next_link},
+            "second": {"value": [self._app("app-2")]},
+        }
+
+        def mock_get(url, headers):
+            return self._response(pages["second" if url == next_link else "first"])
+
+        mock_httpx.return_value.get.side_effect = mock_get
+
+        apps = list(service.iter_applications())
+
+        assert [app["name"] for app in apps] == ["app-1", "app-2"]
+        assert mock_httpx.return_value.get.call_args_list[1].args[0] == next_link
+
+    @patch("anvil.services.arm_client.httpx.Client")
+    def test_iter_applications_is_lazy(self, mock_httpx, service):
+        """Test that later pages are only requested when consumed."""
+        mock_httpx.return_value.get.return_value = self._response(
+            {"value": [self._app("app-1")], "nextLink": "https://management.azure.com/next"}
+        )
+
+        apps = service.iter_applications()
+        first = next(apps)
+
+        assert first["name"] == "app-1"
+        assert mock_httpx.return_value.get.call_count == 1
+
+    @patch("anvil.services.arm_client.httpx.Client")
+    def test_iter_applications_stops_when_cancelled(self, mock_httpx, service):
+        """Test that a set token stops the listing before the next page."""
+        cancel = threading.Event()
+        mock_httpx.return_value.get.return_value = self._response(
+            {"value": [self._app("app-1")], "nextLink": "https://management.azure.com/next"}
+        )
+
+        apps = service.iter_applications(cancel)
+        next(apps)
+        cancel.set()
+
+        with pytest.raises(OperationCancelled):
+            next(apps)
+        assert mock_httpx.return_value.get.call_count == 1
+
+    @patch("anvil.services.arm_client.httpx.Client")
+    def test_iter_agent_deployments_follows_next_link(self, mock_httpx, service):
+        """Test that deployments from every page are returned."""
+        next_link = "https://management.azure.com/deployments-next"
+
+        def mock_get(url, headers):
+            if url == next_link:
+                return self._response({"value": [{"name": "dep-2"}]})
+            return self._response({"value": [{"name": "dep-1"}], "nextLink": next_link})
+
+        mock_httpx.return_value.get.side_effect = mock_get
+
+        deployments = list(service.iter_agent_deployments("my-app"))
+
+        assert [d["name"] for d in deployments] == ["dep-1", "dep-2"]
+        assert (
+            "/applications/my-app/agentdeployments?"
+            in (mock_httpx.return_value.get.call_args_list[0].args[0])
+        )
+
+    @patch("anvil.services.arm_client.httpx.Client")
+    def test_list_published_agents_includes_later_pages(self, mock_httpx, service):
+        """Test that published agents from every applications page are listed."""
+        next_link = "https://management.azure.com/apps-next"
+
+        def mock_get(url, headers):
+            if url == next_link:
+                return self._response({"value": [self._app("app-2")]})
+            if "/agentdeployments?" in url:
+                return self._response({"value": []})
+            return self._response({"value": [self._app("app-1")], "nextLink": next_link})
+
+        mock_httpx.return_value.get.side_effect = mock_get
+
+        pages = list(service.iter_published_agent_pages())
+        published = service.list_published_agents()
+
+        assert [[p.agent_name for p in page] for page in pages] == [
+            ["app-1-agent"],
+            ["app-2-agent"],
+        ]
+        assert [p.application_name for p in published] == ["app-1", "app-2"]
+
+    @patch("anvil.services.arm_client.httpx.Client")
+    def test_cancel_stops_before_next_page(self, mock_httpx, service):
+        """Test that a cancelled listing requests no further pages."""
+        mock_httpx.return_value.get.side_effect = lambda url, headers: self._response(
+            {"value": [], "nextLink": "https://management.azure.com/apps-next"}
+        )
+        cancel = threading.Event()
+
+        pages = service.iter_published_agent_pages(cancel)
+        next(pages)
+        cancel.set()
+
+        with pytest.raises(OperationCancelled):
+            next(pages)
+        assert mock_httpx.return_value.get.call_count == 1
+
+
+class TestRetryAndRateLimits:
+    """Tests for throttling-aware retries and rate limit tracking."""
+
+    @pytest.fixture
+    def service(self):
+        """Create an ArmClientService for testing."""
+        mock_cred = MagicMock()
+        mock_cred.get_token.return_value = MagicMock(token="test-token")
+        return ArmClientService(
+            subscription_id="sub-123",
+            resource_group="rg-test",
+            account_name="test-account",
+            project_name="proj-default",
+            credential=mock_cred,
+        )
+
+    def _response(self, status_code: int, headers: dict | None = None) -> MagicMock:
+        response = MagicMock()
+        response.status_code = status_code
+        response.text = '{"value": []}' if status_code < 400 else "error"
+        response.json.return_value = {"value": []}
+        response.headers = headers or {}
+        return response
+
+    @patch("anvil.services.arm_client.time.sleep")
+    @patch("anvil.services.arm_client.httpx.Client")
+    def test_retries_throttled_request_honouring_retry_after(self, mock_httpx, mock_sleep, service):
+        """Test that a 429 is retried after the Retry-After delay."""
+        mock_httpx.return_value.get.side_effect = [
+            self._response(429, {"Retry-After": "7"}),
+            self._response(200),
+        ]
+
+        assert service.list_published_agents() == []
+
+        mock_sleep.assert_called_once_with(7.0)
+        assert mock_httpx.return_value.get.call_count == 2
+
+    @patch("anvil.services.arm_client.time.sleep")
+    @patch("anvil.services.arm_client.httpx.Client")
+    def test_uses_jittered_backoff_without_retry_after(self, mock_httpx, mock_sleep, service):
+        """Test exponential backoff with jitter when no Retry-After is sent."""
+        mock_httpx.return_value.get.side_effect = [
+            self._response(503),
+            self._response(503),
+            self._response(200),
+        ]
+
+        service.list_published_agents()
+
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        base = ArmClientService.RETRY_BACKOFF_BASE
+        assert base * 0.5 <= delays[0] <= base
+        assert base <= delays[1] <= base * 2
+
+    @patch("anvil.services.arm_client.time.sleep")
+    @patch("anvil.services.arm_client.httpx.Client")
+    def test_gives_up_after_max_retries(self, mock_httpx, mock_sleep, service):
+        """Test that NetworkError is raised once retries are exhausted."""
+        mock_httpx.return_value.get.return_value = self._response(503)
+
+        with pytest.raises(NetworkError):
+            service.list_published_agents()
+
+        assert mock_httpx.return_value.get.call_count == ArmClientService.DEFAULT_MAX_RETRIES + 1
+
+    @patch("anvil.services.arm_client.time.sleep")
+    @patch("anvil.services.arm_client.httpx.Client")
+    def test_does_not_retry_non_idempotent_server_error(self, mock_httpx, mock_sleep, service):
+        """Test that POST requests are not retried on transient server errors."""
+        mock_httpx.return_value.post.return_value = self._response(503)
+
+        with pytest.raises(NetworkError):
+            service._make_request("POST", "/applications/my-app/start", {})
+
+        assert mock_httpx.return_value.post.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @patch("anvil.services.arm_client.time.sleep")
+    @patch("anvil.services.arm_client.httpx.Client")
+    def test_tracks_remaining_budget(self, mock_httpx, mock_sleep, service):
+        """Test that x-ms-ratelimit-remaining-* headers are exposed as a metric."""
+        mock_httpx.return_value.get.return_value = self._response(
+            200,
+            {
+                "x-ms-ratelimit-remaining-subscription-reads": "11990",
+                "x-ms-ratelimit-remaining-tenant-reads": "450",
+            },
+        )
+
+        service.list_published_agents()
+
+        assert service.rate_limit_remaining == {
+            "subscription-reads": 11990,
+            "tenant-reads": 450,
+        }
+        assert service.remaining_budget("GET") == 450
+        assert service.remaining_budget("DELETE") is None
+
+    @patch("anvil.services.arm_client.time.sleep")
+    @patch("anvil.services.arm_client.httpx.Client")
+    def test_paces_requests_when_budget_runs_low(self, mock_httpx, mock_sleep, service):
+        """Test that requests slow down before the budget is exhausted."""
+        mock_httpx.return_value.get.return_value = self._response(
+            200, {"x-ms-ratelimit-remaining-subscription-reads": "3"}
+        )
+
+        service.list_published_agents()
+        mock_sleep.assert_not_called()
+
+        service.list_published_agents()
+        mock_sleep.assert_called_once_with(ArmClientService.RATE_LIMIT_PACING_DELAY)
+
+    def test_budget_reads_are_safe_while_threads_record(self, service):
+        """Test that pacing can read budgets while fan-out threads record new ones."""
+        responses = [
+            SimpleNamespace(headers={f"x-ms-ratelimit-remaining-budget-{i}-reads": str(i)})
+            for i in range(20000)
+        ]
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                recording = [pool.submit(service._record_rate_limits, r) for r in responses]
+                while not recording[-1].done():
+                    service.remaining_budget("GET")
+                for future in recording:
+                    future.result()
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        assert len(service.rate_limit_remaining) == 20000
+        assert service.remaining_budget("GET") == 0
+
+
+class TestConditionalRequests:
+    """Tests for ETag/Last-Modified caching of GET responses."""
+
+    @pytest.fixture
+    def service(self):
+        """Create an ArmClientService for testing."""
+        mock_cred = MagicMock()
+        mock_cred.get_token.return_value = MagicMock(token="test-token")
+        return ArmClientService(
+            subscription_id="sub-123",
+            resource_group="rg-test",
+            account_name="test-account",
+            project_name="proj-default",
+            credential=mock_cred,
+        )
+
+    def _response(self, status_code: int, headers: dict, payload: dict | None = None) -> MagicMock:
+        response = MagicMock()
+        response.status_code = status_code
+        response.headers = headers
+        response.text = "payload" if payload is not None else ""
+        response.json.return_value = payload
+        return response
+
+    @patch("anvil.services.arm_client.httpx.Client")
+    def test_not_modified_reuses_parsed_body(self, mock_httpx, service):
+        """Test that a 304 returns the body parsed for the previous response."""
+        fresh = self._response(200, {"ETag": '"v1"'}, {"value": [{"name": "app"}]})
+        not_modified = self._response(304, {"ETag": '"v1"'})
+        mock_client = MagicMock()
+        mock_client.get.side_effect = [fresh, not_modified]
+        mock_httpx.return_value = mock_client
+
+        first = service._make_request("GET", "/applications")
+        second = service._make_request("GET", "/applications")
+
+        assert second is first
+        assert "If-None-Match" not in mock_client.get.call_args_list[0].kwargs["headers"]
+        assert mock_client.get.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+        not_modified.json.assert_not_called()
+
+    @patch("anvil.services.arm_client.httpx.Client")
+    def test_not_modified_after_eviction_refetches(self, mock_httpx, service):
+        """Test that a 304 for an evicted entry is retried without validators."""
+        responses = [
+            self._response(200, {"ETag": '"v1"'}, {"value": [1]}),
+            self._response(304, {"ETag": '"v1"'}),
+            self._response(200, {"ETag": '"v1"'}, {"value": [1]}),
+        ]
+
+        def mock_get(url, headers):
+            response = responses.pop(0)
+            if response.status_code == 304:
+                # Another request evicted the entry after the validators were sent
+                service.clear_response_cache()
+            return response
+
+        mock_client = MagicMock()
+        mock_client.get.side_effect = mock_get
+        mock_httpx.return_value = mock_client
+
+        service._make_request("GET", "/applications")
+        result = service._make_request("GET", "/applications")
+
+        assert result == {"value": [1]}
+        assert mock_client.get.call_count == 3
+        assert mock_client.get.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+        assert "If-None-Match" not in mock_client.get.call_args.kwargs["headers"]
+
+    @patch("anvil.services.arm_client.httpx.Client")
+    def test_sends_if_modified_since(self, mock_httpx, service):
+        """Test that Last-Modified is echoed back as If-Modified-Since."""
+        stamp = "Wed, 21 Oct 2026 07:28:00 GMT"
+        fresh = self._response(200, {"Last-Modified": stamp}, {"value": []})
+        mock_client = MagicMock()
+        mock_client.get.return_value = fresh
+        mock_httpx.return_value = mock_client
+
+        service._make_request("GET", "/applications")
+        service._make_request("GET", "/applications")
+
+        assert mock_client.get.call_args.kwargs["headers"]["If-Modified-Since"] == stamp
+
+    @patch("anvil.services.arm_client.httpx.Client")
+    def test_changed_payload_replaces_cache(self, mock_httpx, service):
+        """Test that a new 200 response replaces the cached body and ETag."""
+        mock_client = MagicMock()
+        mock_client.get.side_effect = [
+            self._response(200, {"ETag": '"v1"'}, {"value": [1]}),
+            self._response(200, {"ETag": '"v2"'}, {"value": [2]}),
+            self._response(304, {}),
+        ]
+        mock_httpx.return_value = mock_client
+
+        service._make_request("GET", "/applications")
+        service._make_request("GET", "/applications")
+        result = service._make_request("GET", "/applications")
+
+        assert result == {"value": [2]}
+        assert mock_client.get.call_args.kwargs["headers"]["If-None-Match"] == '"v2"'
+
+    @patch("anvil.services.arm_client.httpx.Client")
+    def test_cache_is_bounded(self, mock_httpx, service):
+        """Test that the least recently used responses are evicted."""
+        service.MAX_CACHED_RESPONSES = 2
+        mock_client = MagicMock()
+        mock_client.get.side_effect = lambda url, headers: self._response(
+            200, {"ETag": '"v"'}, {"value": []}
+        )
+        mock_httpx.return_value = mock_client
+
+        for name in ("a", "b", "c"):
+            service._make_request("GET", f"/applications/{name}")
+
+        assert len(service._response_cache) == 2
+        assert not any("/applications/a?" in url for url in service._response_cache)
+
+    @patch("anvil.services.arm_client.httpx.Client")
+    def test_non_get_requests_are_not_cached(self, mock_httpx, service):
+        """Test that writes neither send validators nor populate the cache."""
+        mock_client = MagicMock()
+        mock_client.delete.return_value = self._response(200, {"ETag": '"v1"'}, {})
+        mock_httpx.return_value = mock_client
+
+        service._make_request("DELETE", "/applications/a")
+
+        assert service._response_cache == {}
+
+
+class TestAsyncArmClientService:
+    """Tests for the asyncio ARM client."""
+
+    @pytest.fixture
+    def service(self):
+        """Create an AsyncArmClientService for testing."""
+        mock_cred = MagicMock()
+        mock_cred.get_token.return_value = MagicMock(token="test-token")
+        return AsyncArmClientService(
+            subscription_id="sub-123",
+            resource_group="rg-test",
+            account_name="test-account",
+            project_name="proj-default",
+            credential=mock_cred,
+        )
+
+    def _response(self, payload: dict, status_code: int = 200) -> MagicMock:
+        response = MagicMock()
+        response.status_code = status_code
+        response.text = "payload" if payload else ""
+        response.json.return_value = payload
+        return response
+
+    def _app(self, name: str) -> dict:
+        return {
+            "name": name,
+            "properties": {
+                "baseUrl": f"https://test.url/{name}",
+                "isEnabled": True,
+                "agents": [{"agentName": f"{name}-agent"}],
+            },
+        }
+
+    def _deployment(self, app_name: str) -> dict:
+        return {
+            "name": f"{app_name}-deployment",
+            "properties": {
+                "agents": [{"agentName": f"{app_name}-agent", "agentVersion": "1"}],
+                "state": "Running",
+            },
+        }
+
+    @patch("anvil.services.arm_client.httpx.AsyncClient")
+    async def test_list_published_agents(self, mock_httpx, service):
+        """Test listing published agents across pages of applications."""
+        mock_client = MagicMock()
+        mock_client.aclose = AsyncMock()
+        mock_httpx.return_value = mock_client
+
+        async def mock_request(method, url, headers, json):
+            if url.endswith("/applications?page=2"):
+                return self._response({"value": [self._app("app-b")]})
+            if "/applications?" in url:
+                return self._response(
+                    {
+                        "value": [self._app("app-a")],
+                        "nextLink": "https://management.azure.com/applications?page=2",
+                    }
+                )
+            app_name = url.split("/applications/")[1].split("/")[0]
+            return self._response({"value": [self._deployment(app_name)]})
+
+        mock_client.request = AsyncMock(side_effect=mock_request)
+
+        async with service:
+            agents = await service.list_published_agents()
+
+        assert [a.agent_name for a in agents] == ["app-a-agent", "app-b-agent"]
+        assert agents[0].deployments[0].state == "Running"
+        mock_client.aclose.assert_awaited_once()
+
+    @patch("anvil.services.arm_client.httpx.AsyncClient")
+    async def test_get_published_agent_fetches_serving_application_only(self, mock_httpx, service):
+        """Test that a cold lookup fetches deployments of the serving application only."""
+        mock_client = MagicMock()
+
+        async def mock_request(method, url, headers, json):
+            if "/applications?" in url:
+                return self._response({"value": [self._app("app-a"), self._app("app-b")]})
+            app_name = url.split("/applications/")[1].split("/")[0]
+            return self._response({"value": [self._deployment(app_name)]})
+
+        mock_client.request = AsyncMock(side_effect=mock_request)
+        mock_httpx.return_value = mock_client
+
+        found = await service.get_published_agent("app-b-agent")
+        missing = await service.get_published_agent("draft-agent")
+
+        assert found is not None
+        assert found.application_name == "app-b"
+        assert missing is None
+        urls = [call.args[1] for call in mock_client.request.call_args_list]
+        assert sum("/agentdeployments?" in url for url in urls) == 1
+
+    @patch("anvil.services.arm_client.httpx.AsyncClient")
+    async def test_iter_applications_stops_when_cancelled(self, mock_httpx, service):
+        """Test that a set token stops the listing before the next page."""
+        cancel = threading.Event()
+        mock_client = MagicMock()
+        mock_client.request = AsyncMock(
+            return_value=self._response(
+                {
+                    "value": [self._app("app-a")],
+                    "nextLink": "https://management.azure.com/applications?page=2",
+                }
+            )
+        )
+        mock_httpx.return_value = mock_client
+
+        apps = service.iter_applications(cancel)
+        await anext(apps)
+        cancel.set()
+
+        with pytest.raises(OperationCancelled):
+            await anext(apps)
+        mock_client.request.assert_awaited_once()
+
+    @patch("anvil.services.arm_client.httpx.AsyncClient")
+    async def test_deployment_lookups_respect_concurrency_limit(self, mock_httpx, service):
+        """Test that deployment lookups never exceed max_concurrency in flight."""
+        service._max_concurrency = 2
+        mock_client = MagicMock()
+        mock_httpx.return_value = mock_client
+        in_flight = 0
+        peak = 0
+
+        async def mock_request(method, url, headers, json):
+            nonlocal in_flight, peak
+            if "/applications?" in url:
+                return self._response({"value": [self._app(f"app-{i}") for i in range(6)]})
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            app_name = url.split("/applications/")[1].split("/")[0]
+            return self._response({"value": [self._deployment(app_name)]})
+
+        mock_client.request = AsyncMock(side_effect=mock_request)
+
+        agents = await service.list_published_agents()
+
+        assert [a.agent_name for a in agents] == [f"app-{i}-agent" for i in range(6)]
+        assert peak == 2
+
+    @patch("anvil.services.arm_client.asyncio.sleep", new_callable=AsyncMock)
+    @patch("anvil.services.arm_client.httpx.AsyncClient")
+    async def test_retries_throttled_request(self, mock_httpx, mock_sleep, service):
+        """Test that a 429 is retried after the Retry-After delay."""
+        mock_client = MagicMock()
+        mock_httpx.return_value = mock_client
+        throttled = self._response({}, status_code=429)
+        throttled.headers = {"Retry-After": "2"}
+        mock_client.request = AsyncMock(side_effect=[throttled, self._response({"value": []})])
+
+        agents = await service.list_published_agents()
+
+        assert agents == []
+        assert mock_client.request.await_count == 2
+        mock_sleep.assert_awaited_with(2.0)
+
+    @patch("anvil.services.arm_client.httpx.AsyncClient")
+    async def test_unauthorized_raises(self, mock_httpx, service):
+        """Test that a 401 surfaces as NotAuthenticated."""
+        mock_client = MagicMock()
+        mock_httpx.return_value = mock_client
+        mock_client.request = AsyncMock(return_value=self._response({}, status_code=401))
+
+        with pytest.raises(NotAuthenticated):
+            await service.list_published_agents()
+
+    @patch("anvil.services.arm_client.httpx.AsyncClient")
+    async def test_unpublish_agent(self, mock_httpx, service):
+        """Test that unpublishing sends a DELETE for the deployment."""
+        mock_client = MagicMock()
+        mock_httpx.return_value = mock_client
+        mock_client.request = AsyncMock(return_value=self._response({}, status_code=204))
+
+        await service.unpublish_agent("my-app", "my-deployment")
+
+        method, url = mock_client.request.await_args.args
+        assert method == "DELETE"
+        assert "/applications/my-app/agentdeployments/my-deployment?" in url
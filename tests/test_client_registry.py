@@ -0,0 +1,75 @@
+"""Tests for ClientRegistry - shared project clients per endpoint."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from anvil.services.client_registry import ClientRegistry
+
+ENDPOINT = "https://account.services.ai.azure.com/api/projects/proj"
+
+
+class TestClientRegistry:
+    """Tests for handing out and closing shared project clients."""
+
+    @pytest.fixture
+    def mock_client(self):
+        """Create a mock AIProjectClient."""
+        with patch("anvil.services.project_client.AIProjectClient") as mock:
+            mock.side_effect = lambda **_: MagicMock()
+            yield mock
+
+    def test_reuses_client_for_same_endpoint_and_credential(self, mock_client):
+        """Test that the same project returns the same warm client."""
+        registry = ClientRegistry()
+        credential = MagicMock()
+
+        first = registry.project_client(ENDPOINT, credential)
+        second = registry.project_client(ENDPOINT + "/", credential)
+
+        assert second is first
+        assert second.client is first.client
+        mock_client.assert_called_once()
+
+    def test_separate_clients_per_credential(self, mock_client):
+        """Test that a different credential gets its own client."""
+        registry = ClientRegistry()
+
+        first = registry.project_client(ENDPOINT, MagicMock())
+        second = registry.project_client(ENDPOINT, MagicMock())
+
+        assert second is not first
+
+    def test_evicts_least_recently_used(self, mock_client):
+        """Test that clients beyond max_clients are closed oldest first."""
+        registry = ClientRegistry(max_clients=2)
+        credential = MagicMock()
+
+        a = registry.project_client("https://a", credential)
+        sdk_a = a.client
+        b = registry.project_client("https://b", credential)
+        sdk_b = b.client
+        registry.project_client("https://a", credential)
+        registry.project_client("https://c", credential)
+
+        sdk_a.close.assert_not_called()
+        sdk_b.close.assert_called_once()
+        assert registry.project_client("https://a", credential) is a
+        assert registry.project_client("https://b", credential) is not b
+        with pytest.raises(RuntimeError):
+            _ = b.client
+
+    def test_close_closes_all_clients(self, mock_client):
+        """Test that close() releases every SDK client."""
+        registry = ClientRegistry()
+        credential = MagicMock()
+        sdk_clients = [
+            registry.project_client(endpoint, credential).client
+            for endpoint in ("https://a", "https://b")
+        ]
+
+        registry.close()
+
+        for sdk_client in sdk_clients:
+            sdk_client.close.assert_called_once()
+        assert registry.project_client("https://a", credential).client is not sdk_clients[0]
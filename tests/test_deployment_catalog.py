@@ -0,0 +1,138 @@
+"""Tests for DeploymentCatalog - cached deployments with stale-while-revalidate."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from anvil.services.deployment_catalog import DeploymentCatalog
+from anvil.services.exceptions import OperationCancelled
+from anvil.services.project_client import Deployment
+
+
+def _deployment(name: str, *capabilities: str) -> Deployment:
+    return Deployment(
+        name=name,
+        model_name=name,
+        model_version="1",
+        model_publisher="OpenAI",
+        deployment_type="Global Standard",
+        capacity=100,
+        capabilities=list(capabilities),
+    )
+
+
+def _wait_for(condition, timeout: float = 2.0) -> bool:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestDeploymentCatalog:
+    """Tests for serving deployments from the catalog."""
+
+    def test_fetches_once_while_fresh(self):
+        """Test that repeated reads within the TTL hit the service once."""
+        fetch = MagicMock(return_value=[_deployment("gpt-4o", "Chat Completion")])
+        catalog = DeploymentCatalog(fetch, ttl=60, clock=FakeClock())
+
+        catalog.deployments()
+        catalog.with_capability("Chat Completion")
+        catalog.deployments()
+
+        fetch.assert_called_once()
+
+    def test_capability_index(self):
+        """Test that capability lookups return only matching deployments."""
+        catalog = DeploymentCatalog(
+            MagicMock(
+                return_value=[
+                    _deployment("gpt-4o", "Chat Completion", "Responses"),
+                    _deployment("embed", "Embeddings"),
+                    _deployment("gpt-4o-mini", "Chat Completion"),
+                ]
+            )
+        )
+
+        chat = catalog.with_capability("Chat Completion")
+
+        assert [d.name for d in chat] == ["gpt-4o", "gpt-4o-mini"]
+        assert [d.name for d in catalog.with_capability("Embeddings")] == ["embed"]
+        assert catalog.with_capability("Audio") == []
+
+    def test_stale_entries_are_served_while_revalidating(self):
+        """Test that a stale read returns cached data and refreshes in the background."""
+        clock = FakeClock()
+        fetch = MagicMock(
+            side_effect=[[_deployment("old", "Chat Completion")], [_deployment("new")]]
+        )
+        catalog = DeploymentCatalog(fetch, ttl=60, clock=clock)
+        catalog.deployments()
+
+        clock.now = 120
+        stale = catalog.deployments()
+
+        assert [d.name for d in stale] == ["old"]
+        assert _wait_for(lambda: [d.name for d in catalog.deployments()] == ["new"])
+        assert catalog.with_capability("Chat Completion") == []
+
+    def test_failed_revalidation_keeps_stale_entries(self):
+        """Test that a failed background refresh keeps serving cached data."""
+        clock = FakeClock()
+        fetch = MagicMock(side_effect=[[_deployment("old")], RuntimeError("offline")])
+        catalog = DeploymentCatalog(fetch, ttl=60, clock=clock)
+        catalog.deployments()
+
+        clock.now = 120
+        catalog.deployments()
+
+        assert _wait_for(lambda: not catalog._refreshing)
+        assert [d.name for d in catalog.deployments()] == ["old"]
+
+    def test_refresh_forces_fetch(self):
+        """Test that refresh() bypasses a fresh cache."""
+        fetch = MagicMock(return_value=[])
+        catalog = DeploymentCatalog(fetch, ttl=60, clock=FakeClock())
+
+        catalog.deployments()
+        catalog.refresh()
+
+        assert fetch.call_count == 2
+
+    def test_invalidate(self):
+        """Test that invalidate() forces a synchronous fetch on next read."""
+        fetch = MagicMock(return_value=[])
+        catalog = DeploymentCatalog(fetch, ttl=60, clock=FakeClock())
+
+        catalog.deployments()
+        catalog.invalidate()
+
+        assert not catalog.is_loaded
+        catalog.deployments()
+        assert fetch.call_count == 2
+
+    def test_cancel_token_is_passed_to_fetch(self):
+        """Test that a cancelled first load leaves the catalog empty."""
+        cancel = threading.Event()
+        fetch = MagicMock(side_effect=OperationCancelled("cancelled"))
+        catalog = DeploymentCatalog(fetch, ttl=60, clock=FakeClock())
+
+        with pytest.raises(OperationCancelled):
+            catalog.deployments(cancel)
+
+        fetch.assert_called_once_with(cancel)
+        assert not catalog.is_loaded
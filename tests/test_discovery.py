@@ -0,0 +1,176 @@
+"""Tests for FoundryDiscovery - cross-subscription project discovery."""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from anvil.services.discovery import FoundryDiscovery
+from anvil.services.exceptions import NetworkError, NotAuthenticated, OperationCancelled
+from anvil.services.foundry import FoundryAccount, FoundryProject
+from anvil.services.subscriptions import Subscription
+
+
+def make_subscription(subscription_id: str) -> Subscription:
+    """Create a test subscription."""
+    return Subscription(
+        id=f"/subscriptions/{subscription_id}",
+        subscription_id=subscription_id,
+        display_name=f"Sub {subscription_id}",
+        state="Enabled",
+    )
+
+
+def make_account(name: str) -> FoundryAccount:
+    """Create a test Foundry account."""
+    return FoundryAccount(
+        id=f"/accounts/{name}",
+        name=name,
+        resource_group="rg",
+        location="swedencentral",
+        endpoint=f"https://{name}.services.ai.azure.com",
+    )
+
+
+def make_project(name: str) -> FoundryProject:
+    """Create a test Foundry project."""
+    return FoundryProject(id=f"/projects/{name}", name=name, display_name=name, endpoint="")
+
+
+@pytest.fixture
+def services():
+    """Create mock foundry services for two subscriptions."""
+    first = MagicMock()
+    first.list_accounts.return_value = [make_account("a1"), make_account("a2")]
+    first.list_projects.side_effect = lambda resource_group, account_name: [
+        make_project(f"{account_name}-p")
+    ]
+    second = MagicMock()
+    second.list_accounts.return_value = [make_account("b1")]
+    second.list_projects.return_value = [make_project("b1-p"), make_project("b1-q")]
+    return {"sub-1": first, "sub-2": second}
+
+
+class TestFoundryDiscovery:
+    """Tests for searching several subscriptions concurrently."""
+
+    def test_discovers_projects_in_all_subscriptions(self, services):
+        """Test that every account's projects are found and labelled."""
+        discovery = FoundryDiscovery(services.__getitem__)
+
+        found = discovery.discover([make_subscription("sub-1"), make_subscription("sub-2")])
+
+        assert [item.project.name for item in found] == ["a1-p", "a2-p", "b1-p", "b1-q"]
+        assert found[0].subscription.subscription_id == "sub-1"
+        assert found[0].account.name == "a1"
+        assert found[0].label == "a1-p  (a1 · Sub sub-1)"
+        services["sub-2"].list_projects.assert_called_once_with(
+            resource_group="rg", account_name="b1"
+        )
+
+    def test_yields_one_page_per_account(self, services):
+        """Test that results are streamed per account as they arrive."""
+        discovery = FoundryDiscovery(services.__getitem__)
+
+        pages = list(discovery.iter_pages([make_subscription("sub-2")]))
+
+        assert [[item.project.name for item in page] for page in pages] == [["b1-p", "b1-q"]]
+
+    def test_accounts_only(self, services):
+        """Test that projects are not listed when not requested."""
+        discovery = FoundryDiscovery(services.__getitem__, include_projects=False)
+
+        found = discovery.discover([make_subscription("sub-1")])
+
+        assert [item.account.name for item in found] == ["a1", "a2"]
+        assert all(item.project is None for item in found)
+        services["sub-1"].list_projects.assert_not_called()
+
+    def test_failed_subscription_is_recorded(self, services):
+        """Test that one failing subscription does not stop the others."""
+        services["sub-1"].list_accounts.side_effect = NetworkError("forbidden")
+        discovery = FoundryDiscovery(services.__getitem__)
+
+        found = discovery.discover([make_subscription("sub-1"), make_subscription("sub-2")])
+
+        assert [item.project.name for item in found] == ["b1-p", "b1-q"]
+        assert len(discovery.failures) == 1
+        assert discovery.failures[0].subscription.subscription_id == "sub-1"
+        assert discovery.failures[0].account is None
+
+    def test_authentication_error_propagates(self, services):
+        """Test that an expired login stops discovery."""
+        services["sub-2"].list_accounts.side_effect = NotAuthenticated("expired")
+        discovery = FoundryDiscovery(services.__getitem__)
+
+        with pytest.raises(NotAuthenticated):
+            discovery.discover([make_subscription("sub-1"), make_subscription("sub-2")])
+
+    def test_concurrency_is_bounded(self):
+        """Test that no more than max_concurrency requests run at once."""
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        def list_accounts():
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            threading.Event().wait(0.02)
+            with lock:
+                running -= 1
+            return []
+
+        service = MagicMock()
+        service.list_accounts.side_effect = list_accounts
+        discovery = FoundryDiscovery(lambda _: service, max_concurrency=3)
+
+        discovery.discover([make_subscription(f"sub-{i}") for i in range(10)])
+
+        assert service.list_accounts.call_count == 10
+        assert 1 < peak <= 3
+
+    def test_cancel_stops_discovery(self, services):
+        """Test that a set token stops discovery before results are yielded."""
+        cancel = threading.Event()
+        cancel.set()
+        discovery = FoundryDiscovery(services.__getitem__)
+
+        with pytest.raises(OperationCancelled):
+            discovery.discover([make_subscription("sub-1")], cancel)
+
+
+class TestResourceGraphBackend:
+    """Tests for discovery through Resource Graph."""
+
+    @pytest.fixture
+    def graph(self):
+        """Create a mock Resource Graph service."""
+        graph = MagicMock()
+        graph.iter_account_pages.return_value = iter(
+            [[("SUB-1", make_account("a1")), ("sub-3", make_account("other"))]]
+        )
+        graph.iter_project_pages.return_value = iter(
+            [[("/accounts/a1", make_project("p1")), ("/accounts/openai", make_project("x"))]]
+        )
+        return graph
+
+    def test_uses_one_query_for_all_subscriptions(self, services, graph):
+        """Test that projects are found without listing each subscription."""
+        discovery = FoundryDiscovery(services.__getitem__, resource_graph=graph)
+
+        found = discovery.discover([make_subscription("sub-1"), make_subscription("sub-2")])
+
+        assert [(item.account.name, item.project.name) for item in found] == [("a1", "p1")]
+        graph.iter_account_pages.assert_called_once_with(["sub-1", "sub-2"], None)
+        services["sub-1"].list_accounts.assert_not_called()
+
+    def test_falls_back_to_listing_on_failure(self, services, graph):
+        """Test that a failing query falls back to per-subscription listings."""
+        graph.iter_account_pages.side_effect = NetworkError("forbidden")
+        discovery = FoundryDiscovery(services.__getitem__, resource_graph=graph)
+
+        found = discovery.discover([make_subscription("sub-2")])
+
+        assert [item.project.name for item in found] == ["b1-p", "b1-q"]
@@ -0,0 +1,49 @@
+"""Tests for FoundryService - Foundry account and project listing."""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from anvil.services.foundry import FoundryService
+
+
+class TestManagementClientReuse:
+    """Tests for sharing one management client across calls."""
+
+    @pytest.fixture
+    def mock_client(self):
+        """Create a mock CognitiveServicesManagementClient."""
+        with patch("anvil.services.foundry.CognitiveServicesManagementClient") as mock:
+            mock.return_value.accounts.list.return_value = []
+            mock.return_value.projects.list.return_value = []
+            yield mock
+
+    def test_client_created_once(self, mock_client):
+        """Test that listing accounts and projects reuses one client."""
+        service = FoundryService(credential=MagicMock(), subscription_id="sub-id")
+
+        service.list_accounts()
+        service.list_projects("rg", "account")
+        service.list_accounts()
+
+        mock_client.assert_called_once()
+
+    def test_close_releases_client(self, mock_client):
+        """Test that close() closes the client and a later call does not reopen it."""
+        with FoundryService(credential=MagicMock(), subscription_id="sub-id") as service:
+            service.list_accounts()
+
+        mock_client.return_value.close.assert_called_once()
+        with pytest.raises(RuntimeError):
+            service.list_accounts()
+        mock_client.assert_called_once()
+
+    def test_concurrent_first_use_creates_one_client(self, mock_client):
+        """Test that prefetches racing on first use share a single client."""
+        service = FoundryService(credential=MagicMock(), subscription_id="sub-id")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: service.list_accounts(), range(32)))
+
+        mock_client.assert_called_once()
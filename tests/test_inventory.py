@@ -0,0 +1,123 @@
+"""Tests for InventoryCache - on-disk cache of discovered resources."""
+
+import json
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from anvil.services.foundry import FoundryAccount, FoundryProject
+from anvil.services.inventory import InventoryCache
+from anvil.services.subscriptions import Subscription
+
+ACCOUNT_ID = (
+    "/subscriptions/sub-1/resourceGroups/rg/providers/Microsoft.CognitiveServices/accounts/acct"
+)
+
+
+@pytest.fixture
+def inventory(tmp_path):
+    """Create an inventory cache in a temporary config directory."""
+    return InventoryCache(tmp_path)
+
+
+def make_subscription(subscription_id: str = "sub-1") -> Subscription:
+    """Create a test subscription."""
+    return Subscription(
+        id=f"/subscriptions/{subscription_id}",
+        subscription_id=subscription_id,
+        display_name="Dev",
+        state="Enabled",
+    )
+
+
+class TestInventoryCache:
+    """Tests for storing and reading cached listings."""
+
+    def test_empty_when_missing(self, inventory):
+        """Test that nothing is cached before the first write."""
+        assert inventory.get_subscriptions() is None
+        assert inventory.get_accounts("sub-1") is None
+        assert inventory.get_projects(ACCOUNT_ID) is None
+
+    def test_subscriptions_round_trip(self, inventory):
+        """Test that stored subscriptions are read back with a timestamp."""
+        before = datetime.now(UTC)
+        inventory.put_subscriptions([make_subscription()])
+
+        cached = inventory.get_subscriptions()
+
+        assert cached is not None
+        assert cached.items == [make_subscription()]
+        assert cached.fetched_at >= before
+        assert cached.age_seconds >= 0
+
+    def test_accounts_and_projects_keyed_by_parent(self, inventory):
+        """Test that accounts and projects are stored per parent resource."""
+        account = FoundryAccount(
+            id=ACCOUNT_ID,
+            name="acct",
+            resource_group="rg",
+            location="swedencentral",
+            endpoint="https://acct.services.ai.azure.com",
+        )
+        project = FoundryProject(
+            id=f"{ACCOUNT_ID}/projects/proj",
+            name="proj",
+            display_name="Project",
+            endpoint="https://acct.services.ai.azure.com/api/projects/proj",
+        )
+
+        inventory.put_accounts("sub-1", [account])
+        inventory.put_projects(ACCOUNT_ID, [project])
+
+        assert inventory.get_accounts("sub-1").items == [account]
+        assert inventory.get_accounts("sub-2") is None
+        assert inventory.get_projects(ACCOUNT_ID).items == [project]
+
+    def test_entries_keep_their_own_timestamps(self, inventory, tmp_path):
+        """Test that updating one listing leaves the others untouched."""
+        inventory.put_subscriptions([make_subscription()])
+        data = json.loads(inventory.inventory_file.read_text())
+        old = datetime.now(UTC) - timedelta(days=1)
+        data["subscriptions"]["fetched_at"] = old.isoformat()
+        inventory.inventory_file.write_text(json.dumps(data))
+
+        inventory.put_accounts("sub-1", [])
+
+        assert inventory.get_subscriptions().fetched_at == old
+        assert inventory.get_accounts("sub-1").age_seconds < 60
+
+    def test_shared_across_instances(self, inventory, tmp_path):
+        """Test that the cache survives a restart."""
+        inventory.put_subscriptions([make_subscription()])
+
+        reloaded = InventoryCache(tmp_path)
+
+        assert reloaded.get_subscriptions().items == [make_subscription()]
+
+    def test_corrupt_file_is_ignored(self, inventory):
+        """Test that an unreadable file is treated as an empty inventory."""
+        inventory.inventory_file.write_text("{not json")
+
+        assert inventory.get_subscriptions() is None
+
+        inventory.put_subscriptions([make_subscription()])
+        assert inventory.get_subscriptions() is not None
+
+    def test_outdated_fields_are_ignored(self, inventory):
+        """Test that entries written with different fields are refetched."""
+        inventory.put_subscriptions([make_subscription()])
+        data = json.loads(inventory.inventory_file.read_text())
+        data["subscriptions"]["items"][0]["tenant"] = "unknown"
+        inventory.inventory_file.write_text(json.dumps(data))
+
+        assert inventory.get_subscriptions() is None
+
+    def test_clear(self, inventory):
+        """Test that clear() removes the cached inventory."""
+        inventory.put_subscriptions([make_subscription()])
+
+        inventory.clear()
+
+        assert not inventory.inventory_file.exists()
+        assert inventory.get_subscriptions() is None
@@ -0,0 +1,115 @@
+"""Tests for PrefetchCache - speculative prefetching of listings."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+from anvil.services.prefetch import PrefetchCache
+
+
+class TestPrefetchCache:
+    """Tests for caching background fetches."""
+
+    def test_prefetch_runs_in_background(self):
+        """Test that a prefetched listing can be taken once it is fetched."""
+        cache = PrefetchCache()
+
+        cache.prefetch("key", lambda: ["item"])
+        future = cache.take("key")
+
+        assert future is not None
+        assert future.result(timeout=5) == ["item"]
+        cache.close()
+
+    def test_repeated_prefetch_reuses_fetch(self):
+        """Test that prefetching the same key again does not fetch twice."""
+        cache = PrefetchCache()
+        fetch = MagicMock(return_value=[])
+
+        first = cache.prefetch("key", fetch)
+        second = cache.prefetch("key", fetch)
+
+        assert first is second
+        first.result(timeout=5)
+        fetch.assert_called_once()
+        cache.close()
+
+    def test_take_removes_entry(self):
+        """Test that a taken listing is fetched again next time."""
+        cache = PrefetchCache()
+        cache.prefetch("key", lambda: []).result(timeout=5)
+
+        assert cache.take("key") is not None
+        assert cache.take("key") is None
+        cache.close()
+
+    def test_take_returns_running_fetch(self):
+        """Test that a fetch still in flight is handed out to wait on."""
+        cache = PrefetchCache()
+        release = threading.Event()
+        cache.prefetch("key", lambda: release.wait(5) and ["late"])
+
+        future = cache.take("key")
+        release.set()
+
+        assert future is not None
+        assert future.result(timeout=5) == ["late"]
+        cache.close()
+
+    def test_failed_fetch_is_not_used(self):
+        """Test that a failed prefetch is dropped so the listing is refetched."""
+        cache = PrefetchCache()
+        cache.prefetch("key", MagicMock(side_effect=RuntimeError("boom"))).exception(timeout=5)
+
+        assert cache.take("key") is None
+        cache.close()
+
+    def test_expired_fetch_is_not_used(self):
+        """Test that listings older than max_age are not handed out."""
+        now = [0.0]
+        cache = PrefetchCache(max_age=10.0, clock=lambda: now[0])
+        cache.prefetch("key", lambda: []).result(timeout=5)
+
+        now[0] = 11.0
+
+        assert cache.take("key") is None
+        cache.close()
+
+    def test_least_recently_used_is_evicted(self):
+        """Test that the cache keeps at most max_entries listings."""
+        cache = PrefetchCache(max_entries=2)
+        for key in ("a", "b"):
+            cache.prefetch(key, lambda: []).result(timeout=5)
+        cache.prefetch("a", lambda: [])
+        cache.prefetch("c", lambda: []).result(timeout=5)
+
+        assert cache.take("b") is None
+        assert cache.take("a") is not None
+        assert cache.take("c") is not None
+        cache.close()
+
+    def test_close_waits_for_running_fetches(self):
+        """Test that close(wait=True) returns only once running fetches finish."""
+        cache = PrefetchCache()
+        started = threading.Event()
+        finished = threading.Event()
+
+        def fetch() -> list[str]:
+            started.set()
+            time.sleep(0.05)
+            finished.set()
+            return []
+
+        cache.prefetch("key", fetch)
+        assert started.wait(5)
+        cache.close(wait=True)
+
+        assert finished.is_set()
+
+    def test_usable_after_close(self):
+        """Test that prefetching after close starts new background threads."""
+        cache = PrefetchCache()
+        cache.close(wait=True)
+
+        assert cache.prefetch("key", lambda: ["item"]).result(timeout=5) == ["item"]
+        cache.close()
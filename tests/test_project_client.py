@@ -1,11 +1,17 @@
 """Tests for ProjectClientService - especially API response parsing."""
 
+import asyncio
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from anvil.services.project_client import Agent, ProjectClientService
+from anvil.services.exceptions import NetworkError, NotAuthenticated, OperationCancelled
+from anvil.services.project_client import Agent, AsyncProjectClientService, ProjectClientService
 
 
 class TestListAgentsParsing:
@@ -760,6 +766,73 @@ class TestGetChatCompletionModels:
 
         assert models == []
 
+    def test_served_from_deployment_catalog(self, service, mock_client):
+        """Test that repeated lookups reuse the cached deployment listing."""
+        mock_client.return_value.deployments.list.return_value = [
+            self._create_mock_deployment("gpt-4o", "gpt-4o", {"chat_completion": "true"}),
+        ]
+
+        service.get_chat_completion_models()
+        models = service.get_chat_completion_models()
+
+        assert [m.name for m in models] == ["gpt-4o"]
+        mock_client.return_value.deployments.list.assert_called_once()
+
+    def test_failed_listing_is_not_cached(self, service, mock_client):
+        """Test that a failed listing raises and is fetched again on the next lookup."""
+        mock_client.return_value.deployments.list.side_effect = [
+            RuntimeError("Deployments API unavailable"),
+            [self._create_mock_deployment("gpt-4o", "gpt-4o", {"chat_completion": "true"})],
+        ]
+
+        with pytest.raises(NetworkError):
+            service.get_chat_completion_models()
+        assert not service.deployment_catalog.is_loaded
+
+        models = service.get_chat_completion_models()
+
+        assert [m.name for m in models] == ["gpt-4o"]
+
+
+class TestSharedClient:
+    """Tests for the lazily created SDK client."""
+
+    @pytest.fixture
+    def mock_client(self):
+        """Create a mock AIProjectClient returning a new instance per call."""
+        with patch("anvil.services.project_client.AIProjectClient") as mock:
+            mock.side_effect = lambda **_: MagicMock()
+            yield mock
+
+    def test_concurrent_first_use_creates_one_client(self, mock_client):
+        """Test that warm-up loaders racing on first use share a single client."""
+        service = ProjectClientService(endpoint="https://test.endpoint", credential=MagicMock())
+        barrier = threading.Barrier(8)
+
+        def get_client(_: int) -> object:
+            barrier.wait()
+            return service.client
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            clients = list(executor.map(get_client, range(8)))
+
+        mock_client.assert_called_once()
+        assert all(client is clients[0] for client in clients)
+
+    def test_close_is_final(self, mock_client):
+        """Test that a closed service does not reopen its client."""
+        service = ProjectClientService(endpoint="https://test.endpoint", credential=MagicMock())
+        sdk_client = service.client
+
+        service.close()
+
+        sdk_client.close.assert_called_once()
+        with pytest.raises(RuntimeError):
+            _ = service.client
+        with pytest.raises(NetworkError):
+            service.list_agents()
+        mock_client.assert_called_once()
+
 
 class TestAgentPublishingFields:
     """Tests for Agent dataclass publishing fields."""
@@ -901,3 +974,525 @@ class TestBuildToolsFromConfigs:
         tools = service._build_tools_from_configs(configs)
 
         assert len(tools) == 2
+
+
+def _sdk_agent(name: str, version: str = "1", model: str = "gpt-4o") -> MagicMock:
+    """Create a mock SDK agent as returned by list/get/create/update."""
+    mock_agent = MagicMock()
+    mock_agent.id = name
+    mock_agent.name = name
+    mock_agent.versions = {
+        "latest": {
+            "version": version,
+            "created_at": 1734500000,
+            "description": "",
+            "metadata": {},
+            "definition": {"kind": "prompt", "model": model, "instructions": "Hi", "tools": []},
+        }
+    }
+    return mock_agent
+
+
+class TestSaveAgentWithoutRelist:
+    """Tests for building the saved agent without listing the whole project."""
+
+    @pytest.fixture
+    def mock_client(self):
+        """Create a mock AIProjectClient."""
+        with patch("anvil.services.project_client.AIProjectClient") as mock:
+            yield mock
+
+    @pytest.fixture
+    def service(self, mock_client):
+        """Create a ProjectClientService with mocked client."""
+        return ProjectClientService(endpoint="https://test.endpoint", credential=MagicMock())
+
+    def test_create_uses_response(self, service, mock_client):
+        """Test that create_agent parses the create response directly."""
+        agents_ops = mock_client.return_value.agents
+        agents_ops.create.return_value = _sdk_agent("new-agent", model="gpt-4.1")
+
+        agent = service.create_agent(name="new-agent", model="gpt-4.1", instructions="Hi")
+
+        assert agent.name == "new-agent"
+        assert agent.model == "gpt-4.1"
+        agents_ops.list.assert_not_called()
+        agents_ops.get.assert_not_called()
+
+    def test_update_falls_back_to_single_get(self, service, mock_client):
+        """Test that a response without versions triggers one GET, not a list."""
+        agents_ops = mock_client.return_value.agents
+        agents_ops.update.return_value = None
+        agents_ops.get.return_value = _sdk_agent("my-agent", version="2")
+
+        agent = service.update_agent(agent_name="my-agent", model="gpt-4o", instructions="Hi")
+
+        assert agent.version == "2"
+        agents_ops.get.assert_called_once_with(agent_name="my-agent")
+        agents_ops.list.assert_not_called()
+
+    def test_saved_agent_is_spliced_into_cache(self, service, mock_client):
+        """Test that saving replaces the cached copy of the agent."""
+        agents_ops = mock_client.return_value.agents
+        agents_ops.list.return_value = [_sdk_agent("a"), _sdk_agent("b")]
+        agents_ops.update.return_value = _sdk_agent("b", version="2")
+
+        service.list_agents()
+        service.update_agent(agent_name="b", model="gpt-4o", instructions="Hi")
+
+        assert [(a.name, a.version) for a in service.cached_agents] == [("a", "1"), ("b", "2")]
+
+    def test_delete_removes_agent_from_cache(self, service, mock_client):
+        """Test that deleting an agent drops it from the cache."""
+        mock_client.return_value.agents.list.return_value = [_sdk_agent("a")]
+
+        service.list_agents()
+        service.delete_agent("a")
+
+        assert service.cached_agents == []
+
+
+class TestRefreshAgents:
+    """Tests for the incremental agent store."""
+
+    @pytest.fixture
+    def mock_client(self):
+        """Create a mock AIProjectClient."""
+        with patch("anvil.services.project_client.AIProjectClient") as mock:
+            yield mock
+
+    @pytest.fixture
+    def service(self, mock_client):
+        """Create a ProjectClientService with mocked client."""
+        return ProjectClientService(endpoint="https://test.endpoint", credential=MagicMock())
+
+    def test_first_refresh_reports_all_added(self, service, mock_client):
+        """Test that every agent is new on the first refresh."""
+        mock_client.return_value.agents.list.return_value = [_sdk_agent("a"), _sdk_agent("b")]
+
+        delta = service.refresh_agents()
+
+        assert delta.added == ["a", "b"]
+        assert delta.removed == []
+        assert delta.changed == []
+
+    def test_reports_delta_and_reuses_unchanged_agents(self, service, mock_client):
+        """Test that only agents with a new version are re-parsed."""
+        agents_ops = mock_client.return_value.agents
+        agents_ops.list.return_value = [_sdk_agent("a"), _sdk_agent("b"), _sdk_agent("c")]
+        before = {agent.id: agent for agent in service.list_agents()}
+
+        agents_ops.list.return_value = [
+            _sdk_agent("a"),
+            _sdk_agent("b", version="2"),
+            _sdk_agent("d"),
+        ]
+        with patch.object(service, "_parse_agent", wraps=service._parse_agent) as parse:
+            delta = service.refresh_agents()
+
+        assert delta.added == ["d"]
+        assert delta.removed == ["c"]
+        assert delta.changed == ["b"]
+        assert parse.call_count == 2
+        after = {agent.id: agent for agent in service.cached_agents}
+        assert after["a"] is before["a"]
+        assert after["b"].version == "2"
+
+    def test_unchanged_listing_is_empty_delta(self, service, mock_client):
+        """Test that an identical listing parses nothing."""
+        mock_client.return_value.agents.list.return_value = [_sdk_agent("a")]
+        service.refresh_agents()
+
+        with patch.object(service, "_parse_agent") as parse:
+            delta = service.refresh_agents()
+
+        assert delta.is_empty
+        parse.assert_not_called()
+
+
+def _synthetic_payload(index: int, as_mapping: bool) -> SimpleNamespace:
+    """Create a realistic agent payload as mappings or attribute objects."""
+    wrap = (lambda **fields: fields) if as_mapping else SimpleNamespace
+    tools = [
+        wrap(type="code_interpreter"),
+        wrap(
+            type="mcp",
+            server_label=f"kb_docs_{index}",
+            server_url="https://search.example/kb",
+            require_approval="never",
+            project_connection_id="kb-docs",
+        ),
+    ]
+    latest = wrap(
+        version=str(index % 7 + 1),
+        created_at=1734500000 + index,
+        description=f"Agent {index}",
+        metadata={"memory_enabled": "true", "owner": "team"},
+        definition=wrap(
+            kind="prompt",
+            model="gpt-4o",
+            instructions="You are a helpful assistant. " * 20,
+            tools=tools,
+            temperature=0.7,
+            top_p=1.0,
+        ),
+    )
+    return SimpleNamespace(id=f"agent-{index}", name=f"agent-{index}", versions=wrap(latest=latest))
+
+
+class TestParsePayloadShapes:
+    """Tests for the shape-detecting payload accessors."""
+
+    @pytest.fixture
+    def service(self):
+        """Create a ProjectClientService without a live client."""
+        return ProjectClientService(endpoint="https://test.endpoint", credential=MagicMock())
+
+    def test_mapping_and_attribute_payloads_parse_identically(self, service):
+        """Test that both payload shapes produce the same Agent."""
+        from_mapping = service._parse_agent(_synthetic_payload(3, as_mapping=True))
+        from_attributes = service._parse_agent(_synthetic_payload(3, as_mapping=False))
+
+        assert from_mapping == from_attributes
+        assert from_mapping.version == "4"
+        assert from_mapping.tools == ["Code Interpreter", "Mcp"]
+        assert from_mapping.knowledge == ["kb_docs_3"]
+        assert from_mapping.memory_enabled is True
+        assert from_mapping.temperature == 0.7
+
+    def test_missing_versions(self, service):
+        """Test that an agent without versions falls back to defaults."""
+        agent = service._parse_agent(SimpleNamespace(id="a", name="a", versions=None))
+
+        assert agent.version == "-"
+        assert agent.agent_type == "Assistant"
+        assert agent.tool_configs is None
+
+
+class TestParseAgentsBenchmark:
+    """Tests for parsing large agent listings."""
+
+    AGENT_COUNT = 10_000
+
+    @pytest.mark.parametrize("as_mapping", [True, False], ids=["mapping", "attribute"])
+    def test_parses_10k_agents(self, as_mapping):
+        """Test that a 10k-agent listing is parsed completely."""
+        payloads = [_synthetic_payload(i, as_mapping) for i in range(self.AGENT_COUNT)]
+
+        with patch("anvil.services.project_client.AIProjectClient") as mock_client:
+            mock_client.return_value.agents.list.return_value = payloads
+            service = ProjectClientService(endpoint="https://test.endpoint", credential=MagicMock())
+
+            agents = service.list_agents()
+
+        assert len(agents) == self.AGENT_COUNT
+        assert agents[-1].knowledge == [f"kb_docs_{self.AGENT_COUNT - 1}"]
+
+
+class TestLazyAgentDetails:
+    """Tests for decoding heavy agent fields on first access."""
+
+    @pytest.fixture
+    def service(self):
+        """Create a ProjectClientService without a live client."""
+        return ProjectClientService(endpoint="https://test.endpoint", credential=MagicMock())
+
+    def test_details_are_not_decoded_by_parsing(self, service):
+        """Test that a parsed agent leaves its detail fields undecoded."""
+        agent = service._parse_agent(_synthetic_payload(1, as_mapping=True))
+
+        assert agent.name == "agent-1"
+        assert agent.tools == ["Code Interpreter", "Mcp"]
+        for name in ("instructions", "tool_configs", "full_metadata"):
+            assert name not in vars(agent)
+
+    def test_first_access_decodes_all_details(self, service):
+        """Test that reading one detail field decodes the others too."""
+        agent = service._parse_agent(_synthetic_payload(1, as_mapping=True))
+
+        assert agent.instructions is not None
+        assert agent.instructions.startswith("You are a helpful assistant.")
+        assert "tool_configs" in vars(agent)
+        assert agent.tool_configs is not None
+        assert [c.type for c in agent.tool_configs] == ["code_interpreter", "mcp"]
+        assert agent.tool_configs[1].require_approval == "never"
+        assert agent.full_metadata == {"memory_enabled": "true", "owner": "team"}
+
+    def test_concurrent_first_access(self, service):
+        """Test that threads reading details of a fresh agent all see them decoded."""
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for i in range(50):
+                agent = service._parse_agent(_synthetic_payload(i, as_mapping=True))
+                barrier = threading.Barrier(4)
+
+                def read(name: str, agent: Agent = agent, barrier=barrier) -> object:
+                    barrier.wait()
+                    return getattr(agent, name)
+
+                names = ["instructions", "tool_configs", "full_metadata", "instructions"]
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    values = list(executor.map(read, names))
+
+                assert all(value is not None for value in values)
+                assert "_decode_details" not in vars(agent)
+        finally:
+            sys.setswitchinterval(interval)
+
+    def test_explicit_values_are_kept(self):
+        """Test that agents built directly behave like plain dataclasses."""
+        agent = Agent(
+            id="a",
+            name="a",
+            version="1",
+            agent_type="Prompt",
+            created_at=None,
+            description=None,
+            model=None,
+            instructions="Be brief",
+            tools=[],
+            knowledge=[],
+            memory_enabled=False,
+            guardrails=[],
+        )
+
+        assert agent.instructions == "Be brief"
+        assert agent.tool_configs is None
+        agent.tool_configs = []
+        assert agent.tool_configs == []
+
+
+class TestIterAgentPages:
+    """Tests for streaming agent listings page by page."""
+
+    @pytest.fixture
+    def mock_client(self):
+        """Create a mock AIProjectClient."""
+        with patch("anvil.services.project_client.AIProjectClient") as mock:
+            yield mock
+
+    @pytest.fixture
+    def service(self, mock_client):
+        """Create a ProjectClientService with mocked client."""
+        return ProjectClientService(endpoint="https://test.endpoint", credential=MagicMock())
+
+    def test_chunks_plain_iterables(self, service, mock_client):
+        """Test that listings without service pages are split by page_size."""
+        mock_client.return_value.agents.list.return_value = [_sdk_agent(str(i)) for i in range(5)]
+
+        pages = list(service.iter_agent_pages(page_size=2))
+
+        assert [[a.id for a in page] for page in pages] == [["0", "1"], ["2", "3"], ["4"]]
+
+    def test_uses_service_pages(self, service, mock_client):
+        """Test that SDK pages are yielded as they arrive."""
+        paged = MagicMock()
+        paged.by_page.return_value = iter([[_sdk_agent("a"), _sdk_agent("b")], [_sdk_agent("c")]])
+        mock_client.return_value.agents.list.return_value = paged
+
+        pages = list(service.iter_agent_pages())
+
+        assert [[a.id for a in page] for page in pages] == [["a", "b"], ["c"]]
+        assert [a.id for a in service.cached_agents] == ["a", "b", "c"]
+
+    def test_first_page_arrives_before_listing_finishes(self, service, mock_client):
+        """Test that the first page is available before later pages are fetched."""
+        fetched: list[str] = []
+
+        def raw_pages():
+            for name in ("a", "b"):
+                fetched.append(name)
+                yield [_sdk_agent(name)]
+
+        paged = MagicMock()
+        paged.by_page.return_value = raw_pages()
+        mock_client.return_value.agents.list.return_value = paged
+
+        pages = service.iter_agent_pages()
+        first = next(pages)
+
+        assert [a.id for a in first] == ["a"]
+        assert fetched == ["a"]
+        # The store is only replaced once the listing is complete
+        assert service.cached_agents == []
+        list(pages)
+        assert [a.id for a in service.cached_agents] == ["a", "b"]
+
+    def test_cancel_stops_before_next_page(self, service, mock_client):
+        """Test that a cancelled listing fetches no more pages and keeps the store."""
+        fetched: list[str] = []
+
+        def raw_pages():
+            for name in ("a", "b"):
+                fetched.append(name)
+                yield [_sdk_agent(name)]
+
+        paged = MagicMock()
+        paged.by_page.return_value = raw_pages()
+        mock_client.return_value.agents.list.return_value = paged
+        cancel = threading.Event()
+
+        pages = service.iter_agent_pages(cancel=cancel)
+        next(pages)
+        cancel.set()
+
+        with pytest.raises(OperationCancelled):
+            next(pages)
+        assert fetched == ["a"]
+        assert service.cached_agents == []
+
+    def test_cancelled_deployment_listing(self, service, mock_client):
+        """Test that listing deployments honours a set cancel token."""
+        mock_client.return_value.deployments.list.return_value = [MagicMock()]
+        cancel = threading.Event()
+        cancel.set()
+
+        with pytest.raises(OperationCancelled):
+            service.list_deployments(cancel)
+
+
+class _AsyncListing:
+    """Async iterable standing in for the aio SDK's AsyncItemPaged."""
+
+    def __init__(self, items, pages=None):
+        self._items = items
+        self._pages = pages
+
+    async def __aiter__(self):
+        for item in self._items:
+            yield item
+
+
+class _AsyncPagedListing(_AsyncListing):
+    """Async listing that also exposes service pages via by_page()."""
+
+    async def _by_page(self):
+        for page in self._pages:
+            yield _AsyncListing(page)
+
+    def by_page(self):
+        return self._by_page()
+
+
+class TestAsyncProjectClientService:
+    """Tests for the asyncio project client."""
+
+    @pytest.fixture
+    def mock_client(self):
+        """Create a mock async AIProjectClient."""
+        with patch("anvil.services.project_client.AsyncAIProjectClient") as mock:
+            mock.return_value.close = AsyncMock()
+            mock.return_value.agents.delete = AsyncMock()
+            yield mock
+
+    @pytest.fixture
+    def service(self, mock_client):
+        """Create an AsyncProjectClientService with mocked client."""
+        return AsyncProjectClientService(endpoint="https://test.endpoint", credential=MagicMock())
+
+    async def test_list_agents(self, service, mock_client):
+        """Test that agents are parsed the same way as the sync client."""
+        mock_client.return_value.agents.list.return_value = _AsyncListing(
+            [_sdk_agent("a", model="gpt-4.1"), _sdk_agent("b")]
+        )
+
+        agents = await service.list_agents()
+
+        assert [(a.name, a.model) for a in agents] == [("a", "gpt-4.1"), ("b", "gpt-4o")]
+
+    async def test_iter_agent_pages_uses_service_pages(self, service, mock_client):
+        """Test that SDK pages are yielded as they arrive."""
+        mock_client.return_value.agents.list.return_value = _AsyncPagedListing(
+            [], pages=[[_sdk_agent("a"), _sdk_agent("b")], [_sdk_agent("c")]]
+        )
+
+        pages = [page async for page in service.iter_agent_pages()]
+
+        assert [[a.id for a in page] for page in pages] == [["a", "b"], ["c"]]
+        assert [a.id for a in service.cached_agents] == ["a", "b", "c"]
+
+    async def test_iter_agent_pages_chunks_plain_listings(self, service, mock_client):
+        """Test that listings without service pages are split by page_size."""
+        mock_client.return_value.agents.list.return_value = _AsyncListing(
+            [_sdk_agent(str(i)) for i in range(3)]
+        )
+
+        pages = [page async for page in service.iter_agent_pages(page_size=2)]
+
+        assert [[a.id for a in page] for page in pages] == [["0", "1"], ["2"]]
+
+    async def test_refresh_reports_delta(self, service, mock_client):
+        """Test that refresh_agents tracks changes across listings."""
+        agents_ops = mock_client.return_value.agents
+        agents_ops.list.return_value = _AsyncListing([_sdk_agent("a"), _sdk_agent("b")])
+        await service.refresh_agents()
+
+        agents_ops.list.return_value = _AsyncListing([_sdk_agent("a", version="2")])
+        delta = await service.refresh_agents()
+
+        assert delta.changed == ["a"]
+        assert delta.removed == ["b"]
+
+    async def test_cancelled_listing_keeps_previous_store(self, service, mock_client):
+        """Test that cancelling a listing mid-way leaves the store untouched."""
+        agents_ops = mock_client.return_value.agents
+        agents_ops.list.return_value = _AsyncListing([_sdk_agent("a")])
+        await service.list_agents()
+
+        blocked = asyncio.Event()
+
+        async def slow_listing():
+            yield _sdk_agent("b")
+            await blocked.wait()
+            yield _sdk_agent("c")
+
+        listing = MagicMock(spec=["__aiter__"])
+        listing.__aiter__ = lambda _self: slow_listing()
+        agents_ops.list.return_value = listing
+
+        task = asyncio.create_task(service.list_agents())
+        await asyncio.sleep(0)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert [a.id for a in service.cached_agents] == ["a"]
+
+    async def test_list_agents_auth_error(self, service, mock_client):
+        """Test that authentication errors raise NotAuthenticated."""
+        from azure.core.exceptions import ClientAuthenticationError
+
+        mock_client.return_value.agents.list.side_effect = ClientAuthenticationError("expired")
+
+        with pytest.raises(NotAuthenticated):
+            await service.list_agents()
+
+    async def test_chat_completion_models(self, service, mock_client):
+        """Test filtering deployments by chat completion capability."""
+        chat = MagicMock(model_name="gpt-4o", capabilities={"chat_completion": "true"})
+        chat.name = "chat"
+        embed = MagicMock(model_name="ada", capabilities={"embeddings": "true"})
+        embed.name = "embed"
+        mock_client.return_value.deployments.list.return_value = _AsyncListing([embed, chat])
+
+        models = await service.get_chat_completion_models()
+
+        assert [d.name for d in models] == ["chat"]
+
+    async def test_delete_removes_agent_from_cache(self, service, mock_client):
+        """Test that deleting an agent drops it from the cache."""
+        mock_client.return_value.agents.list.return_value = _AsyncListing([_sdk_agent("a")])
+        await service.list_agents()
+
+        await service.delete_agent("a")
+
+        mock_client.return_value.agents.delete.assert_awaited_once_with("a")
+        assert service.cached_agents == []
+
+    async def test_context_manager_closes_client(self, service, mock_client):
+        """Test that leaving the context closes the SDK client."""
+        async with service:
+            assert service.client is not None
+
+        mock_client.return_value.close.assert_awaited_once()
@@ -0,0 +1,173 @@
+"""Tests for ResourceGraphService - Resource Graph queries for discovery."""
+
+import json
+import threading
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from anvil.services.exceptions import NetworkError, NotAuthenticated, OperationCancelled
+from anvil.services.resource_graph import ResourceGraphService
+
+ACCOUNT_ID = (
+    "/subscriptions/sub-1/resourceGroups/rg/providers/Microsoft.CognitiveServices/accounts/acct"
+)
+
+
+def make_service(handler) -> ResourceGraphService:
+    """Create a service that sends requests to a stub transport."""
+    credential = MagicMock()
+    credential.get_token.return_value = MagicMock(token="test-token")
+    return ResourceGraphService(credential, transport=httpx.MockTransport(handler))
+
+
+class TestResourceGraphQuery:
+    """Tests for running paged queries."""
+
+    def test_follows_skip_token(self):
+        """Test that pages are requested until no $skipToken is returned."""
+        requests: list[dict] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            body = json.loads(request.content)
+            requests.append(body)
+            if "$skipToken" not in body["options"]:
+                return httpx.Response(200, json={"data": [{"id": "1"}], "$skipToken": "next"})
+            return httpx.Response(200, json={"data": [{"id": "2"}]})
+
+        service = make_service(handler)
+
+        pages = list(service.query("resources", ["sub-1", "sub-2"]))
+
+        assert pages == [[{"id": "1"}], [{"id": "2"}]]
+        assert requests[0]["subscriptions"] == ["sub-1", "sub-2"]
+        assert requests[0]["query"] == "resources"
+        assert requests[1]["options"]["$skipToken"] == "next"
+
+    def test_sends_bearer_token(self):
+        """Test that queries are authenticated and versioned."""
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json={"data": []})
+
+        list(make_service(handler).query("resources", ["sub-1"]))
+
+        assert seen[0].method == "POST"
+        assert seen[0].headers["Authorization"] == "Bearer test-token"
+        assert seen[0].url.params["api-version"] == ResourceGraphService.API_VERSION
+
+    def test_splits_many_subscriptions(self):
+        """Test that subscriptions are queried in batches the API accepts."""
+        batches: list[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            batches.append(len(json.loads(request.content)["subscriptions"]))
+            return httpx.Response(200, json={"data": []})
+
+        service = make_service(handler)
+        with patch.object(ResourceGraphService, "MAX_SUBSCRIPTIONS_PER_QUERY", 2):
+            list(service.query("resources", ["a", "b", "c"]))
+
+        assert batches == [2, 1]
+
+    def test_raises_not_authenticated_on_401(self):
+        """Test that a rejected token is reported as NotAuthenticated."""
+        service = make_service(lambda request: httpx.Response(401))
+
+        with pytest.raises(NotAuthenticated):
+            list(service.query("resources", ["sub-1"]))
+
+    def test_raises_network_error_on_failure(self):
+        """Test that a failed query is reported as NetworkError."""
+        service = make_service(lambda request: httpx.Response(400, text="bad query"))
+
+        with pytest.raises(NetworkError, match="bad query"):
+            list(service.query("resources", ["sub-1"]))
+
+    def test_retries_throttled_query(self):
+        """Test that a 429 is retried after Retry-After."""
+        responses = iter(
+            [
+                httpx.Response(429, headers={"Retry-After": "0"}),
+                httpx.Response(200, json={"data": [{"id": "1"}]}),
+            ]
+        )
+        service = make_service(lambda request: next(responses))
+
+        assert list(service.query("resources", ["sub-1"])) == [[{"id": "1"}]]
+
+    def test_honours_retry_after_date(self):
+        """Test that a Retry-After given as an HTTP date is honoured."""
+        retry_at = format_datetime(datetime.now(UTC) + timedelta(seconds=30), usegmt=True)
+        responses = iter(
+            [
+                httpx.Response(429, headers={"Retry-After": retry_at}),
+                httpx.Response(200, json={"data": []}),
+            ]
+        )
+        service = make_service(lambda request: next(responses))
+
+        with patch("anvil.services.resource_graph.time.sleep") as sleep:
+            list(service.query("resources", ["sub-1"]))
+
+        assert 20 < sleep.call_args.args[0] <= 30
+
+    def test_cancel_stops_before_next_page(self):
+        """Test that a set token stops paging at the page boundary."""
+        cancel = threading.Event()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            cancel.set()
+            return httpx.Response(200, json={"data": [{"id": "1"}], "$skipToken": "next"})
+
+        pages = make_service(handler).query("resources", ["sub-1"], cancel)
+
+        assert next(pages) == [{"id": "1"}]
+        with pytest.raises(OperationCancelled):
+            next(pages)
+
+
+class TestResourceGraphDiscovery:
+    """Tests for mapping query rows to accounts and projects."""
+
+    def test_parses_accounts(self):
+        """Test that account rows become FoundryAccounts with their subscription."""
+        row = {
+            "id": ACCOUNT_ID,
+            "name": "acct",
+            "resourceGroup": "rg",
+            "location": "swedencentral",
+            "subscriptionId": "sub-1",
+            "endpoint": "https://acct.cognitiveservices.azure.com/",
+        }
+        service = make_service(lambda request: httpx.Response(200, json={"data": [row]}))
+
+        [[(subscription_id, account)]] = list(service.iter_account_pages(["sub-1"]))
+
+        assert subscription_id == "sub-1"
+        assert account.id == ACCOUNT_ID
+        assert account.resource_group == "rg"
+        assert account.endpoint == "https://acct.cognitiveservices.azure.com/"
+
+    def test_parses_projects(self):
+        """Test that project rows are linked to their parent account."""
+        row = {
+            "id": f"{ACCOUNT_ID}/projects/proj",
+            "name": "acct/proj",
+            "subscriptionId": "sub-1",
+            "displayName": "",
+            "endpoints": {"AI Foundry API": "https://acct.services.ai.azure.com/api/projects/proj"},
+        }
+        service = make_service(lambda request: httpx.Response(200, json={"data": [row]}))
+
+        [[(account_id, project)]] = list(service.iter_project_pages(["sub-1"]))
+
+        assert account_id == ACCOUNT_ID
+        assert project.name == "proj"
+        assert project.display_name == "proj"
+        assert project.endpoint == "https://acct.services.ai.azure.com/api/projects/proj"
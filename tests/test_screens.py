@@ -10,10 +10,11 @@ from anvil.config import AppConfig, FoundrySelection
 from anvil.screens.home import HomeScreen
 from anvil.services.auth import AuthResult, AuthStatus
 from anvil.services.project_client import Agent, Deployment, ToolConfig
+from anvil.services.warmup import ProjectWarmup, WarmupState
 
 
 @pytest.fixture
-def mock_auth_and_config():
+def mock_auth_and_config(tmp_path):
     """Mock both auth and config for testing home screen."""
     selection = FoundrySelection(
         subscription_id="test-sub-id",
@@ -37,6 +38,7 @@ def mock_auth_and_config():
         mock_auth.get_credential.return_value = None
 
         mock_config = mock_config_cls.return_value
+        mock_config.config_dir = tmp_path
         mock_config.load.return_value = config
         mock_config.get_last_subscription_id.return_value = selection.subscription_id
         mock_config.get_last_account_name.return_value = selection.account_name
@@ -369,6 +371,414 @@ class TestViewSwitchingRaceCondition:
         assert populate_called, "Table SHOULD be populated when still on agents view"
 
 
+class TestBulkUnpublish:
+    """Tests for unpublishing several deployments from the home screen."""
+
+    @pytest.fixture
+    def home_screen(self):
+        """Create a HomeScreen with mocked notifications and workers."""
+        screen = HomeScreen()
+        screen.notify = MagicMock()
+        screen.run_worker = MagicMock()
+        screen._arm_client = MagicMock()
+        return screen
+
+    def test_refreshes_published_state_once(self, home_screen):
+        """Test that a batch triggers a single published-state refresh."""
+        from anvil.services.arm_client import UnpublishResult
+
+        home_screen._report_bulk_unpublish(
+            [UnpublishResult("app", "dep-1"), UnpublishResult("app", "dep-2")]
+        )
+
+        home_screen.run_worker.assert_called_once()
+        assert home_screen.run_worker.call_args.kwargs["name"] == "fetch_published"
+        assert "Unpublished 2" in home_screen.notify.call_args.args[0]
+
+    def test_reports_failures(self, home_screen):
+        """Test that failed deployments are named in the summary."""
+        from anvil.services.arm_client import UnpublishResult
+
+        home_screen._report_bulk_unpublish(
+            [UnpublishResult("app", "dep-1"), UnpublishResult("app", "dep-2", error="boom")]
+        )
+
+        message = home_screen.notify.call_args.args[0]
+        assert "1 of 2" in message
+        assert "dep-2" in message
+        assert home_screen.notify.call_args.kwargs["severity"] == "error"
+
+    def test_no_refresh_when_everything_failed(self, home_screen):
+        """Test that nothing is reloaded when no deployment was removed."""
+        from anvil.services.arm_client import UnpublishResult
+
+        home_screen._report_bulk_unpublish([UnpublishResult("app", "dep-1", error="boom")])
+
+        home_screen.run_worker.assert_not_called()
+
+
+class TestSpliceSavedAgent:
+    """Tests for updating the agent list after a save without reloading."""
+
+    def _agent(self, agent_id: str, version: str = "1") -> Agent:
+        return Agent(
+            id=agent_id,
+            name=agent_id,
+            version=version,
+            agent_type="Prompt",
+            created_at=None,
+            description=None,
+            model="gpt-4o",
+            instructions=None,
+            tools=[],
+            knowledge=[],
+            memory_enabled=False,
+            guardrails=[],
+        )
+
+    @pytest.fixture
+    def home_screen(self):
+        """Create a HomeScreen with loading and rendering mocked out."""
+        screen = HomeScreen()
+        screen.notify = MagicMock()
+        screen._load_agents = MagicMock()
+        screen._populate_agents_table = MagicMock()
+        screen._current_resource = "agents"
+        return screen
+
+    def test_replaces_existing_agent(self, home_screen):
+        """Test that a saved agent replaces its previous version in place."""
+        home_screen._agents = [self._agent("a"), self._agent("b")]
+
+        home_screen._on_edit_screen_dismiss(self._agent("a", version="2"))
+
+        assert [(a.id, a.version) for a in home_screen._agents] == [("a", "2"), ("b", "1")]
+        home_screen._load_agents.assert_not_called()
+        home_screen._populate_agents_table.assert_called_once()
+
+    def test_appends_new_agent(self, home_screen):
+        """Test that a created agent is appended to the list."""
+        home_screen._agents = [self._agent("a")]
+
+        home_screen._on_edit_screen_dismiss(self._agent("b"))
+
+        assert [a.id for a in home_screen._agents] == ["a", "b"]
+        home_screen._load_agents.assert_not_called()
+
+
+class TestAgentsTableReconciliation:
+    """Tests for updating only changed rows of the agents table."""
+
+    def _agent(self, agent_id: str, version: str = "1") -> Agent:
+        return Agent(
+            id=agent_id,
+            name=agent_id,
+            version=version,
+            agent_type="Prompt",
+            created_at=None,
+            description=None,
+            model="gpt-4o",
+            instructions=None,
+            tools=[],
+            knowledge=[],
+            memory_enabled=False,
+            guardrails=[],
+        )
+
+    @pytest.fixture
+    def table(self):
+        """Create a fake DataTable that tracks its row count."""
+        table = MagicMock()
+        table.row_count = 0
+
+        def add_row(*cells, key):
+            table.row_count += 1
+
+        def remove_row(key):
+            table.row_count -= 1
+
+        def clear():
+            table.row_count = 0
+
+        table.add_row.side_effect = add_row
+        table.remove_row.side_effect = remove_row
+        table.clear.side_effect = clear
+        return table
+
+    @pytest.fixture
+    def home_screen(self, table):
+        """Create a HomeScreen rendering into the fake table."""
+        screen = HomeScreen()
+        screen.query_one = MagicMock(return_value=table)
+        screen._agent_columns = [f"col-{i}" for i in range(8)]
+        return screen
+
+    def test_only_changed_cells_are_updated(self, home_screen, table):
+        """Test that a refresh touches only the rows that changed."""
+        home_screen._agents = [self._agent("a"), self._agent("b"), self._agent("c")]
+        home_screen._populate_agents_table()
+        table.reset_mock()
+
+        home_screen._agents = [self._agent("a"), self._agent("b", version="2"), self._agent("d")]
+        home_screen._populate_agents_table()
+
+        table.clear.assert_not_called()
+        table.remove_row.assert_called_once_with("c")
+        table.update_cell.assert_called_once_with("b", "col-2", "2")
+        assert table.add_row.call_args.kwargs["key"] == "d"
+        assert table.add_row.call_count == 1
+
+    def test_reordered_rows_trigger_rebuild(self, home_screen, table):
+        """Test that a changed order falls back to rebuilding the table."""
+        home_screen._agents = [self._agent("a"), self._agent("b")]
+        home_screen._populate_agents_table()
+        table.reset_mock()
+
+        home_screen._agents = [self._agent("b"), self._agent("a")]
+        home_screen._populate_agents_table()
+
+        table.clear.assert_called_once()
+        assert [c.kwargs["key"] for c in table.add_row.call_args_list] == ["b", "a"]
+
+    def test_missing_and_duplicate_ids_keep_their_rows(self, home_screen, table):
+        """Test that agents without a unique ID still get a row each."""
+        unnamed = self._agent("")
+        unnamed.name = "draft"
+        duplicate = self._agent("a", version="2")
+        home_screen._agents = [self._agent("a"), duplicate, unnamed, self._agent("")]
+
+        home_screen._populate_agents_table()
+
+        keys = [c.kwargs["key"] for c in table.add_row.call_args_list]
+        assert keys == ["a", "a#1", "draft", "#3"]
+        assert table.row_count == 4
+        assert home_screen._get_agent_by_row_key("a#1") is duplicate
+        assert home_screen._get_agent_by_row_key("draft") is unnamed
+
+
+class TestStreamAgentPages:
+    """Tests for rendering agents while later pages are loading."""
+
+    @pytest.fixture
+    def home_screen(self):
+        """Create a HomeScreen with rendering mocked out."""
+        screen = HomeScreen()
+        screen._populate_agents_table = MagicMock()
+        return screen
+
+    @pytest.fixture
+    def sample_agent(self):
+        """Create a sample agent."""
+        return Agent(
+            id="agent-1",
+            name="agent-1",
+            version="1",
+            agent_type="Prompt",
+            created_at=None,
+            description=None,
+            model="gpt-4o",
+            instructions=None,
+            tools=[],
+            knowledge=[],
+            memory_enabled=False,
+            guardrails=[],
+        )
+
+    def test_page_is_rendered_on_agents_view(self, home_screen, sample_agent):
+        """Test that a loaded page is shown immediately."""
+        home_screen._current_resource = "agents"
+
+        home_screen._apply_agent_page([sample_agent])
+
+        assert home_screen._agents == [sample_agent]
+        home_screen._populate_agents_table.assert_called_once()
+
+    def test_page_not_rendered_on_models_view(self, home_screen, sample_agent):
+        """Test that pages arriving after a view switch only update state."""
+        home_screen._current_resource = "models"
+
+        home_screen._apply_agent_page([sample_agent])
+
+        assert home_screen._agents == [sample_agent]
+        home_screen._populate_agents_table.assert_not_called()
+
+
+class TestWarmupProgress:
+    """Tests for applying warm-up progress to the home screen."""
+
+    @pytest.fixture
+    def sample_agent(self):
+        """Create a sample agent."""
+        return Agent(
+            id="agent-1",
+            name="agent-1",
+            version="1",
+            agent_type="Prompt",
+            created_at=None,
+            description=None,
+            model="gpt-4o",
+            instructions=None,
+            tools=[],
+            knowledge=[],
+            memory_enabled=False,
+            guardrails=[],
+        )
+
+    @pytest.fixture
+    def home_screen(self):
+        """Create a HomeScreen with rendering mocked out."""
+        screen = HomeScreen()
+        screen._populate_agents_table = MagicMock()
+        screen._populate_models_table = MagicMock()
+        screen._update_warmup_status = MagicMock()
+        return screen
+
+    def _warm(self, screen, loaders):
+        screen._warmup = ProjectWarmup(loaders)
+        screen._warmup.start()
+        screen._warmup.wait(timeout=2)
+        for progress in screen._warmup.snapshot():
+            screen._apply_warmup_progress(progress)
+
+    def test_all_resources_are_stored(self, home_screen, sample_agent):
+        """Test that agents, models and published state land in the screen."""
+        home_screen._current_resource = "agents"
+        deployment = Deployment(
+            name="gpt-4o",
+            model_name="gpt-4o",
+            model_version="1",
+            model_publisher="OpenAI",
+            deployment_type="Standard",
+            capacity=1,
+            capabilities=["Chat Completion"],
+        )
+        published = MagicMock(agent_name="agent-1", base_url="https://x", protocols=["responses"])
+
+        self._warm(
+            home_screen,
+            {
+                "agents": lambda _: [[sample_agent]],
+                "models": lambda _: [[deployment]],
+                "published": lambda _: [[published]],
+            },
+        )
+
+        assert home_screen._agents == [sample_agent]
+        assert home_screen._deployments == [deployment]
+        assert home_screen._agents[0].is_published
+        # Models are cached but not rendered while the agents view is shown
+        home_screen._populate_models_table.assert_not_called()
+
+    def test_stale_progress_is_ignored(self, home_screen, sample_agent):
+        """Test that progress superseded by a newer update is not applied."""
+        self._warm(home_screen, {"agents": lambda _: [[sample_agent]]})
+        home_screen._agents = []
+        home_screen._populate_agents_table.reset_mock()
+
+        stale = MagicMock(resource="agents", state=WarmupState.DONE, items=[sample_agent])
+        home_screen._apply_warmup_progress(stale)
+
+        assert home_screen._agents == []
+        home_screen._populate_agents_table.assert_not_called()
+
+    def test_sidebar_switch_does_not_refetch_while_warming(self, home_screen):
+        """Test that switching views reuses the running warm-up."""
+        home_screen._project_client = MagicMock()
+        home_screen._warmup = MagicMock()
+        home_screen._warmup.progress.return_value = MagicMock(finished=False)
+        home_screen._load_models = MagicMock()
+        home_screen._setup_models_table = MagicMock()
+        home_screen._cancel_pending_workers = MagicMock()
+        home_screen.query_one = MagicMock()
+
+        home_screen.on_sidebar_selected(MagicMock(resource_id="models"))
+
+        home_screen._load_models.assert_not_called()
+
+
+class TestSelectionPrefetch:
+    """Tests for prefetching along the selection path."""
+
+    @staticmethod
+    def _account(name: str = "acct"):
+        from anvil.services.foundry import FoundryAccount
+
+        return FoundryAccount(
+            id=f"/accounts/{name}", name=name, resource_group="rg", location="", endpoint=""
+        )
+
+    async def test_project_list_uses_prefetched_projects(self, mock_auth_and_config) -> None:
+        """Test that prefetched projects are shown without listing them again."""
+        from concurrent.futures import Future
+
+        from anvil.screens.project_select import ProjectSelectScreen
+        from anvil.services.foundry import FoundryProject
+
+        project = FoundryProject(id="/projects/p", name="p", display_name="P", endpoint="")
+        prefetched: Future = Future()
+        prefetched.set_result([project])
+        service = MagicMock()
+
+        app = AnvilApp()
+        async with app.run_test() as pilot:
+            await pilot.press("enter")
+            screen = ProjectSelectScreen(service, self._account(), prefetched=prefetched)
+            app.push_screen(screen)
+            await pilot.pause()
+
+            # Shown before the worker has run
+            assert screen._projects == [project]
+            await app.workers.wait_for_complete()
+            service.list_projects.assert_not_called()
+
+    async def test_failed_prefetch_is_listed_again(self, mock_auth_and_config) -> None:
+        """Test that a failed prefetch falls back to listing the projects."""
+        from concurrent.futures import Future
+
+        from anvil.screens.project_select import ProjectSelectScreen
+
+        prefetched: Future = Future()
+        prefetched.set_exception(RuntimeError("boom"))
+        service = MagicMock()
+        service.list_projects.return_value = []
+
+        app = AnvilApp()
+        async with app.run_test() as pilot:
+            await pilot.press("enter")
+            app.push_screen(ProjectSelectScreen(service, self._account(), prefetched=prefetched))
+            await pilot.pause()
+            await app.workers.wait_for_complete()
+
+            service.list_projects.assert_called_once()
+
+    async def test_highlighted_account_is_prefetched(self, mock_auth_and_config) -> None:
+        """Test that the last used and dwelt-on instances are prefetched."""
+        from anvil.screens.foundry_select import FoundrySelectScreen
+        from anvil.widgets import SearchableList
+
+        service = MagicMock()
+        service.list_accounts.return_value = [self._account("a"), self._account("b")]
+        prefetch = MagicMock()
+
+        app = AnvilApp()
+        async with app.run_test() as pilot:
+            await pilot.press("enter")
+            screen = FoundrySelectScreen(
+                service, highlight_account_name="a", prefetch=prefetch, prefetch_delay=0.01
+            )
+            app.push_screen(screen)
+            await pilot.pause()
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            prefetch.assert_any_call(self._account("a"))
+
+            screen.post_message(SearchableList.Highlighted("b", "b"))
+            await pilot.pause(0.1)
+
+            prefetch.assert_called_with(self._account("b"))
+
+
 class TestFormatAgentPreview:
     """Tests for the _format_agent_preview method."""
 
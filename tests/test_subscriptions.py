@@ -0,0 +1,42 @@
+"""Tests for SubscriptionService - subscription listing."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from anvil.services.subscriptions import SubscriptionService
+
+
+class TestSubscriptionClientReuse:
+    """Tests for sharing one SubscriptionClient across calls."""
+
+    @pytest.fixture
+    def mock_client(self):
+        """Create a mock SubscriptionClient."""
+        with patch("anvil.services.subscriptions.SubscriptionClient") as mock:
+            enabled = MagicMock(state="Enabled", subscription_id="sub-1", display_name="Dev")
+            disabled = MagicMock(state="Disabled", subscription_id="sub-2", display_name="Old")
+            mock.return_value.subscriptions.list.return_value = [enabled, disabled]
+            yield mock
+
+    def test_client_created_once(self, mock_client):
+        """Test that repeated listings reuse one client."""
+        service = SubscriptionService(MagicMock())
+
+        first = service.list_subscriptions()
+        service.list_subscriptions()
+
+        assert [s.subscription_id for s in first] == ["sub-1"]
+        mock_client.assert_called_once()
+
+    def test_close_releases_client(self, mock_client):
+        """Test that close() closes the shared client and does not reopen it."""
+        service = SubscriptionService(MagicMock())
+        service.list_subscriptions()
+
+        service.close()
+
+        mock_client.return_value.close.assert_called_once()
+        with pytest.raises(RuntimeError):
+            service.list_subscriptions()
+        mock_client.assert_called_once()
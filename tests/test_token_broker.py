@@ -0,0 +1,156 @@
+"""Tests for TokenBroker - access token caching and proactive refresh."""
+
+import time
+from unittest.mock import MagicMock
+
+from azure.core.credentials import AccessToken
+
+from anvil.services.token_broker import AsyncCredentialAdapter, TokenBroker
+
+ARM_SCOPE = "https://management.azure.com/.default"
+AI_SCOPE = "https://ai.azure.com/.default"
+
+
+def _token(value: str, expires_in: float) -> AccessToken:
+    return AccessToken(value, int(time.time() + expires_in))
+
+
+def _wait_for(condition, timeout: float = 2.0) -> bool:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+class TestTokenCaching:
+    """Tests for serving tokens from the cache."""
+
+    def test_fetches_token_once_per_scope(self):
+        """Test that repeated requests for a scope hit the credential once."""
+        credential = MagicMock()
+        credential.get_token.return_value = _token("arm-token", expires_in=3600)
+        broker = TokenBroker(credential)
+
+        first = broker.get_token(ARM_SCOPE)
+        second = broker.get_token(ARM_SCOPE)
+
+        assert first.token == "arm-token"
+        assert second is first
+        credential.get_token.assert_called_once_with(ARM_SCOPE)
+
+    def test_caches_scopes_independently(self):
+        """Test that each scope gets its own cached token."""
+        credential = MagicMock()
+        credential.get_token.side_effect = lambda scope, **_: _token(scope, expires_in=3600)
+        broker = TokenBroker(credential)
+
+        assert broker.get_token(ARM_SCOPE).token == ARM_SCOPE
+        assert broker.get_token(AI_SCOPE).token == AI_SCOPE
+        assert broker.get_token(ARM_SCOPE).token == ARM_SCOPE
+        assert credential.get_token.call_count == 2
+
+    def test_expired_token_is_refetched_synchronously(self):
+        """Test that a token inside the expiry buffer is never handed out."""
+        credential = MagicMock()
+        credential.get_token.side_effect = [
+            _token("old", expires_in=5),
+            _token("new", expires_in=3600),
+        ]
+        broker = TokenBroker(credential)
+
+        assert broker.get_token(ARM_SCOPE).token == "old"
+        assert broker.get_token(ARM_SCOPE).token == "new"
+
+    def test_claims_bypass_cache(self):
+        """Test that claims challenges always reach the credential."""
+        credential = MagicMock()
+        credential.get_token.return_value = _token("token", expires_in=3600)
+        broker = TokenBroker(credential)
+
+        broker.get_token(ARM_SCOPE)
+        broker.get_token(ARM_SCOPE, claims="challenge")
+
+        assert credential.get_token.call_count == 2
+        credential.get_token.assert_called_with(ARM_SCOPE, claims="challenge")
+
+    def test_invalidate_drops_cached_tokens(self):
+        """Test that invalidate forces a fresh token on next request."""
+        credential = MagicMock()
+        credential.get_token.return_value = _token("token", expires_in=3600)
+        broker = TokenBroker(credential)
+
+        broker.get_token(ARM_SCOPE)
+        broker.invalidate()
+        broker.get_token(ARM_SCOPE)
+
+        assert credential.get_token.call_count == 2
+
+
+class TestProactiveRefresh:
+    """Tests for background refresh ahead of expiry."""
+
+    def test_refreshes_in_background_inside_margin(self):
+        """Test that a token near expiry is served while a refresh runs."""
+        credential = MagicMock()
+        credential.get_token.side_effect = lambda *_, **__: (
+            _token("old", expires_in=120)
+            if credential.get_token.call_count == 1
+            else _token("new", expires_in=3600)
+        )
+        broker = TokenBroker(credential, refresh_margin=300)
+
+        assert broker.get_token(ARM_SCOPE).token == "old"
+        # Still valid, so the cached token is returned immediately
+        assert broker.get_token(ARM_SCOPE).token == "old"
+
+        assert _wait_for(lambda: broker.get_token(ARM_SCOPE).token == "new")
+
+    def test_background_refresh_failure_keeps_cached_token(self):
+        """Test that a failed refresh does not discard a still-valid token."""
+        credential = MagicMock()
+        credential.get_token.side_effect = [
+            _token("old", expires_in=120),
+            RuntimeError("az failed"),
+        ]
+        broker = TokenBroker(credential, refresh_margin=300)
+
+        broker.get_token(ARM_SCOPE)
+        broker.get_token(ARM_SCOPE)
+
+        assert _wait_for(lambda: not broker._refreshing)
+        assert broker.get_token(ARM_SCOPE).token == "old"
+
+    def test_close_closes_wrapped_credential(self):
+        """Test that close() is forwarded to the wrapped credential."""
+        credential = MagicMock()
+        broker = TokenBroker(credential)
+
+        broker.close()
+
+        credential.close.assert_called_once()
+
+
+class TestAsyncCredentialAdapter:
+    """Tests for exposing a sync credential to the aio SDK clients."""
+
+    async def test_delegates_to_wrapped_credential(self):
+        """Test that tokens come from the wrapped credential."""
+        credential = MagicMock()
+        credential.get_token.return_value = _token("token", expires_in=3600)
+        adapter = AsyncCredentialAdapter(credential)
+
+        token = await adapter.get_token(AI_SCOPE, tenant_id="tenant")
+
+        assert token.token == "token"
+        credential.get_token.assert_called_once_with(AI_SCOPE, tenant_id="tenant")
+
+    async def test_close_leaves_wrapped_credential_open(self):
+        """Test that closing the adapter does not close the shared credential."""
+        credential = MagicMock()
+
+        async with AsyncCredentialAdapter(credential):
+            pass
+
+        credential.close.assert_not_called()
@@ -0,0 +1,136 @@
+"""Tests for ProjectWarmup - concurrent loading of project resources."""
+
+import threading
+
+from anvil.services.exceptions import OperationCancelled
+from anvil.services.warmup import ProjectWarmup, WarmupProgress, WarmupState
+
+
+class TestProjectWarmup:
+    """Tests for loading resources concurrently with per-resource progress."""
+
+    def test_loads_all_resources(self):
+        """Test that every loader runs and its pages are collected."""
+        warmup = ProjectWarmup(
+            {
+                "agents": lambda _: iter([["a", "b"], ["c"]]),
+                "models": lambda _: [["gpt-4o"]],
+            }
+        )
+
+        warmup.start()
+
+        assert warmup.wait(timeout=2)
+        assert warmup.progress("agents").items == ["a", "b", "c"]
+        assert warmup.progress("models").state == WarmupState.DONE
+
+    def test_loaders_run_concurrently(self):
+        """Test that a slow resource does not hold up the others."""
+        release = threading.Event()
+
+        def slow(_):
+            release.wait(2)
+            yield ["late"]
+
+        warmup = ProjectWarmup({"slow": slow, "fast": lambda _: [["early"]]})
+        warmup.start()
+
+        try:
+            warmup._threads[1].join(2)
+            assert warmup.progress("fast").state == WarmupState.DONE
+            assert warmup.progress("slow").state == WarmupState.LOADING
+        finally:
+            release.set()
+        assert warmup.wait(timeout=2)
+
+    def test_reports_progress_per_page(self):
+        """Test that each page is reported with everything loaded so far."""
+        reported: list[WarmupProgress] = []
+        warmup = ProjectWarmup({"agents": lambda _: [["a"], ["b"]]}, on_progress=reported.append)
+
+        warmup.start()
+        warmup.wait(timeout=2)
+
+        assert [(p.state, p.loaded) for p in reported] == [
+            (WarmupState.LOADING, 0),
+            (WarmupState.LOADING, 1),
+            (WarmupState.LOADING, 2),
+            (WarmupState.DONE, 2),
+        ]
+
+    def test_failure_is_isolated_to_its_resource(self):
+        """Test that a failing loader does not affect the other resources."""
+
+        def failing(_):
+            yield ["a"]
+            raise RuntimeError("boom")
+
+        warmup = ProjectWarmup({"agents": failing, "models": lambda _: [["gpt-4o"]]})
+
+        warmup.start()
+        warmup.wait(timeout=2)
+
+        agents = warmup.progress("agents")
+        assert agents.state == WarmupState.FAILED
+        assert str(agents.error) == "boom"
+        assert agents.items == ["a"]
+        assert warmup.progress("models").state == WarmupState.DONE
+
+    def test_cancel_stops_at_page_boundary(self):
+        """Test that cancelling stops a loader before its next page."""
+        first_page = threading.Event()
+        resume = threading.Event()
+        fetched: list[int] = []
+
+        def pages(_):
+            for i in range(3):
+                fetched.append(i)
+                if i == 1:
+                    first_page.set()
+                    resume.wait(2)
+                yield [i]
+
+        warmup = ProjectWarmup({"agents": pages})
+        warmup.start()
+        assert first_page.wait(2)
+        warmup.cancel()
+        resume.set()
+        warmup.wait(timeout=2)
+
+        progress = warmup.progress("agents")
+        assert progress.state == WarmupState.CANCELLED
+        assert progress.items == [0]
+        assert fetched == [0, 1]
+
+    def test_start_is_idempotent(self):
+        """Test that starting twice runs each loader once."""
+        calls: list[str] = []
+        warmup = ProjectWarmup({"agents": lambda _: calls.append("agents") or []})
+
+        warmup.start()
+        warmup.start()
+        warmup.wait(timeout=2)
+
+        assert calls == ["agents"]
+
+    def test_loaders_receive_cancel_token(self):
+        """Test that loaders can stop themselves when the warm-up is cancelled."""
+        started = threading.Event()
+
+        def pages(cancel):
+            yield ["a"]
+            started.set()
+            cancel.wait(2)
+            if cancel.is_set():
+                raise OperationCancelled("stopped")
+            yield ["b"]
+
+        warmup = ProjectWarmup({"agents": pages})
+        warmup.start()
+        assert started.wait(2)
+        warmup.cancel()
+        warmup.wait(timeout=2)
+
+        progress = warmup.progress("agents")
+        assert progress.state == WarmupState.CANCELLED
+        assert progress.items == ["a"]